@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -32,6 +33,9 @@ DEBUG = True
 
 ALLOWED_HOSTS: list[str] = os.getenv("ALLOWED_HOSTS", "").split(",") if os.getenv("ALLOWED_HOSTS") else []
 
+# 테스트 실행 여부 (manage.py test 또는 pytest)
+TESTING = "test" in sys.argv[1:2] or "pytest" in sys.modules
+
 
 # Application definition
 
@@ -42,6 +46,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.sitemaps",
     "django_extensions",
     "main",
     "tailwind",
@@ -50,7 +55,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "main.middleware.HealthCheckMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "main.middleware.StaticFilesMiddleware",
+    "main.middleware.MetricsMiddleware",
+    "main.middleware.ServerTimingMiddleware",
+    "main.middleware.QueryBudgetMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -61,19 +71,49 @@ MIDDLEWARE = [
     "django_htmx.middleware.HtmxMiddleware",
 ]
 
+# 뷰별 SQL 쿼리 수 제한(main.query_budget) 검사. 개발/테스트에서만 켜고, 초과하면 예외를 발생시킵니다.
+QUERY_BUDGET_ENFORCED = TESTING or (DEBUG and not os.environ.get("DOCKER_ENV"))
+
+# 요청 지표(main.metrics). 여러 gunicorn 워커의 지표를 합산하려면 METRICS_DIR에 공유 디렉터리를 지정합니다.
+METRICS_ENABLED = not os.getenv("METRICS_DISABLED")
+METRICS_DIR = os.getenv("METRICS_DIR") or None
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", 5))
+# /metrics 접근 토큰 (Authorization: Bearer <토큰>). 없으면 스태프 사용자만 조회할 수 있습니다.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Server-Timing 응답 헤더(main.middleware.ServerTimingMiddleware). 개발에서는 항상 붙이고, 운영에서는
+# 스태프 사용자나 X-Server-Timing: <SERVER_TIMING_TOKEN> 헤더를 보낸 요청에만 붙입니다.
+SERVER_TIMING_ALWAYS = DEBUG and not os.environ.get("DOCKER_ENV") and not TESTING
+SERVER_TIMING_TOKEN = os.getenv("SERVER_TIMING_TOKEN", "")
+
+# readiness 헬스체크(main.health) 결과를 재사용하는 시간(초)
+HEALTH_CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", 5))
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        # Django 템플릿 엔진 + 렌더링 시간 측정 (main.metrics)
+        "BACKEND": "main.template_backends.DjangoTemplates",
+        "NAME": "django",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "django.template.context_processors.i18n",
+                "main.context_processors.layout",
+            ],
+            # 언어별로 컴파일하여 LANGUAGE_CODE 분기를 미리 접어 두는 캐시 로더
+            "loaders": [
+                (
+                    "main.template_loaders.LanguageFoldingLoader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
             ],
         },
     },
@@ -91,14 +131,67 @@ if os.environ.get("DOCKER_ENV"):
 else:
     DATABASE_PATH = str(BASE_DIR / "db.sqlite3")
 
+# 연결할 때마다 적용하는 SQLite PRAGMA
+# WAL 모드에서는 관리자가 쓰는 동안에도 읽기가 막히지 않고, synchronous=NORMAL은 WAL에서 안전합니다.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", 5000)),  # 밀리초
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 128 * 1024 * 1024)),  # 바이트
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", -20000)),  # 음수는 KiB 단위 (약 20MB)
+    "temp_store": "MEMORY",
+}
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": DATABASE_PATH,
+        "OPTIONS": {
+            "init_command": ";".join(f"PRAGMA {name}={value}" for name, value in SQLITE_PRAGMAS.items()),
+            # 쓰기 트랜잭션이 시작할 때 잠금을 잡아, 읽기에서 쓰기로 올릴 때 busy_timeout 없이 실패하지 않도록 함
+            "transaction_mode": "IMMEDIATE",
+        },
+        # 요청마다 새로 연결하지 않고 재사용 (재사용 전 연결 상태 확인)
+        "CONN_MAX_AGE": int(os.getenv("CONN_MAX_AGE", 600)),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# 여러 gunicorn 워커가 캐시 무효화를 공유하려면 프로세스 간 공유 백엔드를 사용해야 합니다.
+# 예: CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+#     CACHE_LOCATION=/app/data/cache
+#
+# default: 페이지(경로 x 언어 x HTMX 여부), 조각, 계산 결과 캐시. 기본 MAX_ENTRIES(300)로는 공개 페이지 전체가
+#   들어가지 않아 계속 축출되므로 넉넉하게 지정합니다.
+# versions: 네임스페이스 버전(main.caching). 축출되면 "지금 변경됨"으로 초기화되어 모든 캐시가 무효화되므로,
+#   축출되지 않도록 별도 위치에 둡니다 (네임스페이스는 활동 수 + 몇 개뿐).
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+CACHE_LOCATION = os.getenv("CACHE_LOCATION", "pyladies-seoul")
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": CACHE_LOCATION,
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", 10000))},
+    },
+    "versions": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": f"{CACHE_LOCATION}-versions",
+        "OPTIONS": {"MAX_ENTRIES": 1_000_000},
+    },
+}
+
+# 전체 페이지 캐시 최대 유지 시간(초). 콘텐츠 변경 시에는 시그널로 즉시 무효화됩니다.
+PAGE_CACHE_TIMEOUT = int(os.getenv("PAGE_CACHE_TIMEOUT", 60 * 60 * 24))
+
+if TESTING:
+    # 테스트 간 캐시가 공유되지 않도록 비활성화 (캐시 테스트는 override_settings 사용)
+    CACHES = {alias: {"BACKEND": "django.core.cache.backends.dummy.DummyCache"} for alias in ("default", "versions")}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -145,9 +238,29 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# 배포(Docker)에서는 collectstatic 때 파일명에 내용 해시를 붙이고 .gz 사전 압축본을 생성
+# (개발/테스트는 collectstatic 없이 동작하도록 기본 스토리지 사용)
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "main.storage.CompressedManifestStaticFilesStorage"
+            if os.environ.get("DOCKER_ENV") and not TESTING
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        )
+    },
+}
+# nginx 없이 단일 컨테이너로 배포할 때 Django가 STATIC_ROOT를 직접 제공 (main.middleware.StaticFilesMiddleware)
+SERVE_STATIC = bool(os.getenv("SERVE_STATIC"))
+
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# 정적 사이트 내보내기 출력 디렉터리 (python manage.py export_static, nginx가 직접 제공)
+STATIC_EXPORT_ROOT = Path(os.getenv("STATIC_EXPORT_ROOT", BASE_DIR / "export"))
+# 관리자 페이지에서 저장/삭제하면 바뀐 페이지를 백그라운드에서 다시 내보냄
+STATIC_EXPORT_ON_SAVE = bool(os.getenv("STATIC_EXPORT_ON_SAVE"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -24,8 +24,23 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from main import api, ical, metrics, sitemaps
+
 urlpatterns: list[Any] = [
     path("set_language/", include("django.conf.urls.i18n")),
+    # 캘린더 피드는 언어와 무관하므로 언어 접두사 없이 제공
+    path("events.ics", ical.calendar_feed, name="events_ics"),
+    path("events/<slug:activity_type>.ics", ical.calendar_feed, name="events_type_ics"),
+    # 사이트맵은 모든 언어의 URL을 hreflang 대체 링크와 함께 한 파일에 담음
+    path("sitemap.xml", sitemaps.index, name="sitemap"),
+    path("sitemap-<section>.xml", sitemaps.section, name="sitemap_section"),
+    # 읽기 전용 JSON API는 한국어/영어 필드를 함께 응답하므로 언어 접두사 없이 제공
+    path("api/v1/activities/", api.activities, name="api_activities"),
+    path("api/v1/organizers/", api.organizers, name="api_organizers"),
+    path("api/v1/faqs/", api.faqs, name="api_faqs"),
+    path("api/v1/opportunities/", api.opportunities, name="api_opportunities"),
+    # Prometheus 수집용 지표 (토큰 또는 스태프 사용자만)
+    path("metrics", metrics.metrics_view, name="metrics"),
 ]
 
 urlpatterns.extend(
@@ -1,9 +1,52 @@
+from typing import Any, Optional
+
+from django.conf import settings
 from django.contrib import admin
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import Model, QuerySet
+from django.forms import ModelForm
 from django.http import HttpRequest
+from django.utils.html import format_html
+from django.utils.safestring import SafeString
 from django.utils.translation import gettext_lazy as _
 
+from .images import thumbnail_url
 from .models import FAQ, Activity, ActivityPublication, ContributionOpportunity, Organizer, SocialMediaPlatform
+from .tasks import schedule_static_export
+
+
+class StaticExportAdminMixin:
+    """저장/삭제가 커밋되면 바뀐 공개 페이지를 백그라운드에서 다시 내보내는 관리자 믹스인"""
+
+    def schedule_page_export(self) -> None:
+        if settings.STATIC_EXPORT_ON_SAVE:
+            transaction.on_commit(schedule_static_export)
+
+    def save_related(self, request: HttpRequest, form: ModelForm, formsets: Any, change: bool) -> None:
+        # 인라인(예: 활동 게시물)까지 저장된 뒤에 예약
+        super().save_related(request, form, formsets, change)  # type: ignore[misc]
+        self.schedule_page_export()
+
+    def delete_model(self, request: HttpRequest, obj: Model) -> None:
+        super().delete_model(request, obj)  # type: ignore[misc]
+        self.schedule_page_export()
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet) -> None:
+        super().delete_queryset(request, queryset)  # type: ignore[misc]
+        self.schedule_page_export()
+
+
+class ImageThumbnailAdminMixin:
+    """원본 이미지 대신 작은 변환본을 목록과 수정 화면에 보여 주는 관리자 믹스인"""
+
+    thumbnail_field: str = ""
+
+    @admin.display(description=_("미리보기"))
+    def thumbnail(self, obj: Model) -> Optional[SafeString]:
+        image = getattr(obj, self.thumbnail_field)
+        if not image:
+            return None
+        return format_html('<img src="{}" alt="" style="max-width: 80px; max-height: 80px;">', thumbnail_url(image))
 
 
 class ActivityPublicationInline(admin.TabularInline):
@@ -13,9 +56,11 @@ class ActivityPublicationInline(admin.TabularInline):
 
 
 @admin.register(Activity)
-class ActivityAdmin(admin.ModelAdmin):
+class ActivityAdmin(ImageThumbnailAdminMixin, StaticExportAdminMixin, admin.ModelAdmin):
+    thumbnail_field = "image"
     list_display = (
         "title_ko",
+        "thumbnail",
         "activity_type",
         "start_datetime",
         "end_datetime",
@@ -39,6 +84,7 @@ class ActivityAdmin(admin.ModelAdmin):
         "location_name_en",
     )
     date_hierarchy = "start_datetime"
+    readonly_fields = ("thumbnail",)
     inlines = [ActivityPublicationInline]
 
     fieldsets = (
@@ -52,6 +98,7 @@ class ActivityAdmin(admin.ModelAdmin):
                     "description_en",
                     "activity_type",
                     "image",
+                    "thumbnail",
                 )
             },
         ),
@@ -94,9 +141,11 @@ class ActivityAdmin(admin.ModelAdmin):
 
 
 @admin.register(Organizer)
-class OrganizerAdmin(admin.ModelAdmin):
+class OrganizerAdmin(ImageThumbnailAdminMixin, StaticExportAdminMixin, admin.ModelAdmin):
+    thumbnail_field = "photo"
     list_display = (
         "name_ko",
+        "thumbnail",
         "name_en",
         "role_ko",
         "role_en",
@@ -106,10 +155,11 @@ class OrganizerAdmin(admin.ModelAdmin):
     list_filter = ("is_public",)
     search_fields = ("name_ko", "name_en", "role_ko", "role_en")
     ordering = ("order", "name_ko")
+    readonly_fields = ("thumbnail",)
 
 
 @admin.register(FAQ)
-class FAQAdmin(admin.ModelAdmin):
+class FAQAdmin(StaticExportAdminMixin, admin.ModelAdmin):
     list_display = (
         "question_ko",
         "question_en",
@@ -123,9 +173,11 @@ class FAQAdmin(admin.ModelAdmin):
 
 
 @admin.register(SocialMediaPlatform)
-class SocialMediaPlatformAdmin(admin.ModelAdmin):
+class SocialMediaPlatformAdmin(ImageThumbnailAdminMixin, StaticExportAdminMixin, admin.ModelAdmin):
+    thumbnail_field = "icon"
     list_display = (
         "name_ko",
+        "thumbnail",
         "url",
         "link_type",
         "order",
@@ -136,18 +188,19 @@ class SocialMediaPlatformAdmin(admin.ModelAdmin):
     search_fields = ("name_ko", "name_en")
     list_editable = ("link_type", "order", "is_active")
     ordering = ("order", "name_ko")
+    readonly_fields = ("thumbnail",)
 
     fieldsets = (
         (None, {"fields": ("name_ko", "name_en", "url", "link_type")}),
         (
             _("표시 설정"),
-            {"fields": ("icon", "icon_class", "order", "is_active")},
+            {"fields": ("icon", "thumbnail", "icon_class", "order", "is_active")},
         ),
     )
 
 
 @admin.register(ContributionOpportunity)
-class ContributionOpportunityAdmin(admin.ModelAdmin):
+class ContributionOpportunityAdmin(StaticExportAdminMixin, admin.ModelAdmin):
     list_display = (
         "title_ko",
         "type",
@@ -0,0 +1,223 @@
+"""
+공개 콘텐츠 읽기 전용 JSON API (v1)
+
+파트너 사이트와 디스코드 봇이 HTML을 긁어 가지 않도록 `/api/v1/<리소스>/`로 공개 행을 제공합니다.
+
+- `fields=id,title_ko`: 필요한 컬럼만 조회 (허용된 필드만)
+- `cursor=`, `limit=`: 키셋 페이지네이션 (`next`에 다음 페이지 URL)
+- 활동은 `activity_type=seminar,workshop`, `start_after=`, `start_before=` (ISO 날짜/일시)로 필터링
+
+모델 인스턴스를 만들지 않고 `.values()` 행을 그대로 직렬화하며, 응답은 리소스별 네임스페이스
+버전으로 페이지 캐시에 저장되고 ETag/Last-Modified로 304를 응답합니다.
+"""
+
+import json
+from datetime import datetime, time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.http import urlencode
+
+from .caching import ACTIVITIES, FAQS, OPPORTUNITIES, ORGANIZERS, cache_public_page, conditional_page
+from .models import FAQ, Activity, ActivityType, ContributionOpportunity, Organizer
+from .pagination import InvalidCursor, paginate
+
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 200
+
+
+class ApiError(ValueError):
+    """잘못된 API 요청 파라미터 (400)"""
+
+
+class Resource(NamedTuple):
+    queryset: Callable[[], QuerySet]
+    fields: Tuple[str, ...]
+    ordering: Tuple[str, ...]
+    file_fields: Tuple[str, ...] = ()
+    filter: Optional[Callable[[QuerySet, HttpRequest], QuerySet]] = None
+
+
+def _parse_bound(value: str, name: str, end_of_day: bool = False) -> datetime:
+    """ISO 날짜 또는 일시 (날짜만 주면 그날의 시작/끝)"""
+    try:
+        day = parse_date(value)
+        parsed = datetime.combine(day, time.max if end_of_day else time.min) if day else parse_datetime(value)
+    except ValueError as e:
+        raise ApiError(f"Invalid {name}: {value!r}") from e
+    if parsed is None:
+        raise ApiError(f"Invalid {name}: {value!r}")
+    return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
+
+
+def _filter_activities(queryset: QuerySet, request: HttpRequest) -> QuerySet:
+    """활동 유형과 시작 일시 범위로 필터링"""
+    if activity_types := request.GET.get("activity_type"):
+        values = activity_types.split(",")
+        unknown = set(values) - set(ActivityType.values)
+        if unknown:
+            raise ApiError(f"Unknown activity_type: {', '.join(sorted(unknown))}")
+        queryset = queryset.filter(activity_type__in=values)
+    if start_after := request.GET.get("start_after"):
+        queryset = queryset.filter(start_datetime__gte=_parse_bound(start_after, "start_after"))
+    if start_before := request.GET.get("start_before"):
+        queryset = queryset.filter(start_datetime__lte=_parse_bound(start_before, "start_before", end_of_day=True))
+    return queryset
+
+
+RESOURCES: Dict[str, Resource] = {
+    "activities": Resource(
+        queryset=lambda: Activity.objects.filter(is_public=True),
+        fields=(
+            "id",
+            "activity_type",
+            "title_ko",
+            "title_en",
+            "description_ko",
+            "description_en",
+            "start_datetime",
+            "end_datetime",
+            "location_name_ko",
+            "location_name_en",
+            "location_address",
+            "location_url",
+            "meeting_schedule_ko",
+            "meeting_schedule_en",
+            "is_recruiting",
+            "is_featured",
+            "image",
+            "created",
+            "modified",
+        ),
+        ordering=("-start_datetime", "-id"),
+        file_fields=("image",),
+        filter=_filter_activities,
+    ),
+    "organizers": Resource(
+        queryset=lambda: Organizer.objects.filter(is_public=True),
+        fields=(
+            "id",
+            "name_ko",
+            "name_en",
+            "role_ko",
+            "role_en",
+            "bio_ko",
+            "bio_en",
+            "photo",
+            "email",
+            "github",
+            "linkedin",
+            "order",
+            "modified",
+        ),
+        ordering=("order", "id"),
+        file_fields=("photo",),
+    ),
+    "faqs": Resource(
+        queryset=lambda: FAQ.objects.filter(is_public=True),
+        fields=("id", "category", "question_ko", "question_en", "answer_ko", "answer_en", "order", "modified"),
+        ordering=("category", "order", "id"),
+    ),
+    "opportunities": Resource(
+        queryset=lambda: ContributionOpportunity.objects.filter(is_public=True),
+        fields=(
+            "id",
+            "type",
+            "title_ko",
+            "title_en",
+            "description_ko",
+            "description_en",
+            "requirements_ko",
+            "requirements_en",
+            "contact_method_ko",
+            "contact_method_en",
+            "order",
+            "is_open",
+            "modified",
+        ),
+        ordering=("order", "id"),
+    ),
+}
+
+
+def _requested_fields(request: HttpRequest, resource: Resource) -> List[str]:
+    """`fields=` 파라미터를 검증하여 응답할 필드 목록 반환 (기본값: 전체)"""
+    if not (value := request.GET.get("fields")):
+        return list(resource.fields)
+    fields = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = set(fields) - set(resource.fields)
+    if unknown or not fields:
+        raise ApiError(f"Unknown fields: {', '.join(sorted(unknown))}" if unknown else "No fields requested")
+    return fields
+
+
+def _page_size(request: HttpRequest) -> int:
+    value = request.GET.get("limit")
+    if value is None:
+        return API_PAGE_SIZE
+    # isdigit()만으로는 "²" 같은 유니코드 숫자도 통과하여 int()가 실패하므로 ASCII 숫자만 허용
+    if not (value.isascii() and value.isdigit()) or not 1 <= int(value) <= API_MAX_PAGE_SIZE:
+        raise ApiError(f"limit must be between 1 and {API_MAX_PAGE_SIZE}")
+    return int(value)
+
+
+def _serialize(rows: List[Dict[str, Any]], fields: List[str], file_fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """`.values()` 행을 응답 필드만 남긴 딕셔너리로 변환 (파일 필드는 URL로)"""
+    files = [name for name in fields if name in file_fields]
+    items = []
+    for row in rows:
+        item = {name: row[name] for name in fields}
+        for name in files:
+            item[name] = default_storage.url(item[name]) if item[name] else None
+        items.append(item)
+    return items
+
+
+def _json_response(data: Dict[str, Any], status: int = 200) -> HttpResponse:
+    content = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(",", ":"))
+    return HttpResponse(content, content_type="application/json", status=status)
+
+
+def list_resource(request: HttpRequest, name: str) -> HttpResponse:
+    """리소스의 공개 행 한 페이지"""
+    resource = RESOURCES[name]
+    try:
+        fields = _requested_fields(request, resource)
+        page_size = _page_size(request)
+        queryset = resource.queryset()
+        if resource.filter:
+            queryset = resource.filter(queryset, request)
+        # 커서를 만들려면 정렬 키도 조회해야 함
+        columns = dict.fromkeys([*fields, *(spec.lstrip("-") for spec in resource.ordering)])
+        page = paginate(queryset.values(*columns), resource.ordering, request.GET.get("cursor"), page_size)
+    except (ApiError, InvalidCursor) as e:
+        message = "Invalid cursor" if isinstance(e, InvalidCursor) else str(e)
+        return _json_response({"error": message}, status=400)
+
+    next_url = None
+    if page.next_cursor:
+        query = request.GET.copy()
+        query["cursor"] = page.next_cursor
+        next_url = request.build_absolute_uri(f"{request.path}?{urlencode(query, doseq=True)}")
+    return _json_response({"results": _serialize(page.items, fields, resource.file_fields), "next": next_url})
+
+
+def _resource_view(name: str, namespace: str) -> Callable[..., HttpResponse]:
+    @conditional_page(namespace)
+    @cache_public_page(namespace)
+    def view(request: HttpRequest) -> HttpResponse:
+        return list_resource(request, name)
+
+    view.__name__ = f"api_{name}"
+    return view
+
+
+activities = _resource_view("activities", ACTIVITIES)
+organizers = _resource_view("organizers", ORGANIZERS)
+faqs = _resource_view("faqs", FAQS)
+opportunities = _resource_view("opportunities", OPPORTUNITIES)
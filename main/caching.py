@@ -0,0 +1,288 @@
+"""
+캐시 계층 공통 유틸리티
+
+콘텐츠를 네임스페이스 단위로 나누고, 네임스페이스마다 "버전"을 캐시에 보관합니다.
+버전 값은 해당 네임스페이스가 마지막으로 변경된 시각(UNIX 타임스탬프)이며,
+모델이 저장/삭제될 때 시그널 핸들러(`main.signals`)에서 갱신됩니다.
+
+캐시된 값은 계산 당시의 버전 스냅샷과 함께 저장되므로, 버전이 바뀌면
+별도의 삭제 없이 자연스럽게 무효화됩니다. 버전은 페이지 캐시와 함께 축출되지 않도록
+별도의 `versions` 캐시에 보관합니다 (설정되지 않았으면 기본 캐시).
+
+모든 변경은 전역 `CONTENT` 버전도 함께 갱신하므로, 이 값 하나로 사이트 전체의
+콘텐츠 세대(ETag/Last-Modified)를 판단할 수 있습니다.
+"""
+
+import hashlib
+import time
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone, translation
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+from .metrics import current_timings
+
+VERSION_KEY_PREFIX = "main:version:"
+PAGE_KEY_PREFIX = "main:page:"
+
+# 네임스페이스 버전을 저장하는 캐시 (페이지 캐시와 함께 축출되지 않도록 분리, 없으면 기본 캐시)
+VERSION_CACHE_ALIAS = "versions"
+
+# 네임스페이스
+CONTENT = "content"
+LAYOUT = "layout"
+ACTIVITIES = "activities"
+ORGANIZERS = "organizers"
+FAQS = "faqs"
+OPPORTUNITIES = "opportunities"
+
+
+class _TimedCache:
+    """요청 처리 중의 캐시 호출 수와 시간을 요청 지표(`main.metrics`)에 더하는 캐시 래퍼"""
+
+    def __init__(self, alias: str) -> None:
+        self.alias = alias
+
+    def __getattr__(self, name: str) -> Any:
+        alias = self.alias if self.alias in settings.CACHES else DEFAULT_CACHE_ALIAS
+        method = getattr(caches[alias], name)
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            timings = current_timings.get()
+            if timings is None:
+                return method(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timings.cache_calls += 1
+                timings.cache_seconds += time.perf_counter() - started
+
+        return timed
+
+
+cache = _TimedCache(DEFAULT_CACHE_ALIAS)
+version_cache = _TimedCache(VERSION_CACHE_ALIAS)
+
+
+def activity_namespace(activity_id: int) -> str:
+    """개별 활동 네임스페이스"""
+    return f"activity:{activity_id}"
+
+
+def activity_type_namespace(activity_type: str) -> str:
+    """활동 유형별 네임스페이스 (관련 이벤트 목록)"""
+    return f"activity_type:{activity_type}"
+
+
+def _version_key(namespace: str) -> str:
+    return f"{VERSION_KEY_PREFIX}{namespace}"
+
+
+def get_versions(namespaces: Iterable[str]) -> Dict[str, float]:
+    """네임스페이스별 현재 버전 조회 (없으면 현재 시각으로 초기화)"""
+    keys = {_version_key(namespace): namespace for namespace in namespaces}
+    found = version_cache.get_many(keys)
+
+    for key in keys.keys() - found.keys():
+        # 캐시가 비어 있거나 축출된 경우: 지금 변경된 것으로 간주
+        now = time.time()
+        version_cache.add(key, now, timeout=None)
+        found[key] = version_cache.get(key, now)
+
+    return {keys[key]: value for key, value in found.items()}
+
+
+def bump_versions(*namespaces: str) -> None:
+    """네임스페이스 버전 갱신 (해당 네임스페이스에 의존하는 캐시 무효화)"""
+    if not namespaces:
+        return
+
+    keys = [_version_key(namespace) for namespace in {*namespaces, CONTENT}]
+    current = version_cache.get_many(keys)
+    now = time.time()
+    # 같은 시각에 연속으로 갱신되어도 버전이 반드시 바뀌도록 보장
+    version_cache.set_many({key: max(now, current.get(key, 0) + 1e-6) for key in keys}, timeout=None)
+
+
+def get_or_compute(
+    key: str,
+    namespaces: Iterable[str],
+    compute: Callable[[], Any],
+    timeout: Optional[int] = None,
+) -> Any:
+    """
+    네임스페이스 버전에 묶인 값을 캐시에서 조회하고, 없거나 오래되었으면 다시 계산합니다.
+
+    Args:
+        key: 캐시 키
+        namespaces: 값이 의존하는 네임스페이스 목록
+        compute: 값을 계산하는 함수
+        timeout: 캐시 유지 시간(초), None이면 버전이 바뀔 때까지 유지
+
+    Returns:
+        캐시되었거나 새로 계산된 값
+    """
+    versions = get_versions(namespaces)
+    entry = cache.get(key)
+    if entry is not None and entry[0] == versions:
+        return entry[1]
+
+    value = compute()
+    cache.set(key, (versions, value), timeout)
+    return value
+
+
+# 전체 페이지 캐시
+
+
+def _page_cache_key(request: HttpRequest) -> str:
+    """
+    스킴/호스트와 경로, 활성 언어, HTMX 요청 여부로 페이지 캐시 키 생성
+
+    피드처럼 본문에 절대 URL이 들어가는 응답이 다른 호스트로 들어온 요청에 재사용되지 않도록
+    스킴과 호스트도 키에 포함합니다. 호스트는 CommonMiddleware에서 이미 검증된 값입니다.
+    """
+    url = f"{request.scheme}://{request.META.get('HTTP_HOST', '')}{request.get_full_path()}"
+    path_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
+    is_htmx = int(bool(getattr(request, "htmx", False)))
+    return f"{PAGE_KEY_PREFIX}{translation.get_language()}:{is_htmx}:{path_hash}"
+
+
+def _is_cacheable_request(request: HttpRequest) -> bool:
+    """익명 사용자의 GET/HEAD 요청만 캐시"""
+    if request.method not in ("GET", "HEAD"):
+        return False
+    user = getattr(request, "user", None)
+    return not (user is not None and user.is_authenticated)
+
+
+def _is_cacheable_response(response: HttpResponse) -> bool:
+    return response.status_code == 200 and not response.streaming and not response.cookies
+
+
+def add_page_dependencies(request: HttpRequest, *namespaces: str) -> None:
+    """뷰 실행 중에 결정되는 페이지 캐시 의존성 추가 (예: 이벤트 유형)"""
+    dependencies = getattr(request, "_page_cache_dependencies", None)
+    if dependencies is not None:
+        dependencies.update(get_versions(namespaces))
+
+
+def set_page_cache_expiry(request: HttpRequest, expires_at: datetime) -> None:
+    """시간에 따라 내용이 바뀌는 페이지의 캐시 만료 시각 지정 (예: 다가오는 이벤트)"""
+    if hasattr(request, "_page_cache_dependencies"):
+        seconds = max(0, int((expires_at - timezone.now()).total_seconds()))
+        current = getattr(request, "_page_cache_timeout", None)
+        request._page_cache_timeout = seconds if current is None else min(current, seconds)  # type: ignore[attr-defined]
+
+
+def cache_public_page(*namespaces: str) -> Callable:
+    """
+    공개 페이지의 렌더링 결과를 통째로 캐시하는 뷰 데코레이터.
+
+    캐시 키는 경로(쿼리스트링 포함), 활성 언어, HTMX 요청 여부로 구성됩니다.
+    캐시된 응답은 의존하는 네임스페이스의 버전 스냅샷과 함께 저장되며,
+    관련 모델이 변경되어 버전이 바뀌면 해당 페이지만 무효화됩니다.
+    캐시 적중 시에는 뷰와 템플릿 엔진을 전혀 거치지 않습니다.
+
+    Args:
+        namespaces: 페이지가 항상 의존하는 네임스페이스 목록
+    """
+
+    def decorator(view_func: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        @wraps(view_func)
+        def _wrapped_view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            if not _is_cacheable_request(request):
+                return view_func(request, *args, **kwargs)
+
+            key = _page_cache_key(request)
+            entry = cache.get(key)
+            if entry is not None:
+                versions, content, content_type = entry
+                if get_versions(versions) == versions:
+                    response = HttpResponse(content, content_type=content_type)
+                    patch_vary_headers(response, ("HX-Request",))
+                    return response
+
+            # 렌더링 전에 버전을 기록해 두어야 렌더링 중 변경된 내용이 캐시에 남지 않음
+            dependencies = get_versions(namespaces)
+            request._page_cache_dependencies = dependencies  # type: ignore[attr-defined]
+            response = view_func(request, *args, **kwargs)
+            patch_vary_headers(response, ("HX-Request",))
+
+            if _is_cacheable_response(response):
+                timeout = getattr(request, "_page_cache_timeout", settings.PAGE_CACHE_TIMEOUT)
+                if timeout:
+                    cache.set(key, (dependencies, response.content, response["Content-Type"]), timeout)
+            return response
+
+        return _wrapped_view
+
+    return decorator
+
+
+# 조건부 GET (ETag / Last-Modified / 304)
+
+
+def _content_validators(
+    request: HttpRequest,
+    namespaces: Tuple[str, ...],
+    last_change: Optional[Callable[[HttpRequest], Optional[datetime]]],
+) -> Tuple[str, datetime]:
+    """요청 단위로 한 번만 계산되는 (ETag, Last-Modified)"""
+    if not hasattr(request, "_content_validators"):
+        versions = get_versions(namespaces)
+        version = ":".join(str(versions[namespace]) for namespace in namespaces)
+        modified = datetime.fromtimestamp(max(versions.values()), tz=dt_timezone.utc)
+        extra = last_change(request) if last_change else None
+        is_htmx = int(bool(getattr(request, "htmx", False)))
+        raw = f"{version}:{extra}:{translation.get_language()}:{is_htmx}"
+        etag = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+        request._content_validators = (etag, max(modified, extra) if extra else modified)  # type: ignore[attr-defined]
+    return request._content_validators  # type: ignore[attr-defined]
+
+
+def conditional_page(
+    *namespaces: str, last_change: Optional[Callable[[HttpRequest], Optional[datetime]]] = None
+) -> Callable:
+    """
+    콘텐츠 버전으로 ETag/Last-Modified를 붙이고 304 응답을 처리하는 뷰 데코레이터.
+
+    검증자는 렌더링 전에 캐시 조회 한 번으로 계산되며, `If-None-Match`/`If-Modified-Since`가
+    일치하면 뷰(와 페이지 캐시)를 거치지 않고 바로 304를 반환합니다. HEAD 요청도 동일합니다.
+
+    Args:
+        namespaces: 응답이 의존하는 네임스페이스 (기본값: 전역 `CONTENT`)
+        last_change: 모델 변경 외에 시간 경과로 내용이 바뀌는 페이지에서
+            마지막으로 내용이 바뀐 시각을 반환하는 함수 (예: 홈페이지의 지난 이벤트)
+    """
+    namespaces = namespaces or (CONTENT,)
+
+    def last_modified_func(request: HttpRequest, *args: Any, **kwargs: Any) -> datetime:
+        return _content_validators(request, namespaces, last_change)[1]
+
+    def etag_func(request: HttpRequest, *args: Any, **kwargs: Any) -> str:
+        return _content_validators(request, namespaces, last_change)[0]
+
+    def decorator(view_func: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+        conditional_view = condition(etag_func=etag_func, last_modified_func=last_modified_func)(view_func)
+
+        @wraps(view_func)
+        def _wrapped_view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            response = conditional_view(request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                # 브라우저가 매번 검증자를 보내 재검증하도록 설정
+                patch_cache_control(response, no_cache=True)
+                patch_vary_headers(response, ("HX-Request",))
+            return response
+
+        return _wrapped_view
+
+    return decorator
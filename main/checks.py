@@ -0,0 +1,47 @@
+"""
+시스템 체크
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core.checks import CheckMessage, Error, Tags, register
+from django.template import engines
+
+# `<script src="https://...">`, `<script src="//...">` (프로토콜 생략 포함)
+THIRD_PARTY_SCRIPT_RE = re.compile(r"""<script\b[^>]*?\bsrc\s*=\s*["']?((?:https?:)?//[^"'\s>]+)""", re.IGNORECASE)
+
+
+def _project_templates() -> Iterator[Path]:
+    """프로젝트 안의 템플릿 파일 (설치된 패키지의 템플릿은 제외)"""
+    base_dir = Path(settings.BASE_DIR).resolve()
+    seen = set()
+    for engine in engines.all():
+        for directory in getattr(engine, "template_dirs", ()):
+            directory = Path(directory).resolve()
+            if not directory.is_relative_to(base_dir) or directory in seen:
+                continue
+            seen.add(directory)
+            yield from sorted(path for path in directory.rglob("*.html") if path.is_file())
+
+
+@register(Tags.templates)
+def check_third_party_scripts(app_configs: Optional[Sequence[AppConfig]] = None, **kwargs: Any) -> List[CheckMessage]:
+    """템플릿이 외부 출처의 스크립트를 불러오지 않는지 검사 (정적 파일 파이프라인으로 제공해야 함)"""
+    errors: List[CheckMessage] = []
+    for path in _project_templates():
+        content = path.read_text(encoding="utf-8")
+        for match in THIRD_PARTY_SCRIPT_RE.finditer(content):
+            line = content.count("\n", 0, match.start()) + 1
+            errors.append(
+                Error(
+                    f"{path}:{line} loads a third-party script: {match.group(1)}",
+                    hint="Vendor the file into the static pipeline and load it with {% static %}.",
+                    obj=str(path),
+                    id="main.E001",
+                )
+            )
+    return errors
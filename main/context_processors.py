@@ -0,0 +1,63 @@
+"""
+사이트 공통 레이아웃 컨텍스트
+
+모든 페이지의 레이아웃(푸터, CTA 등)에서 쓰는 소셜 미디어 플랫폼 목록과 Discord URL을
+제공합니다. 값은 `SocialMediaPlatform` 변경 시에만 다시 계산되어 캐시되고,
+템플릿에서 실제로 사용할 때까지 평가되지 않습니다.
+
+언어 선택 메뉴는 세션/CSRF 토큰 없이 언어별 URL 링크로 제공하여,
+페이지 HTML이 사용자와 무관하게 동일하도록(전체 페이지 캐시 가능) 유지합니다.
+"""
+
+from typing import Any, Dict, List
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.urls import translate_url
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import get_language_info
+
+from .caching import LAYOUT, get_or_compute
+from .models import SocialMediaPlatform
+
+LAYOUT_CACHE_KEY = "main:layout"
+
+
+def _compute_layout_context() -> Dict[str, Any]:
+    """활성화된 소셜 미디어 플랫폼과 Discord URL을 한 번의 쿼리로 조회"""
+    platforms = list(SocialMediaPlatform.objects.filter(is_active=True).order_by("order", "name_ko"))
+    discord_platform = next((platform for platform in platforms if "discord" in platform.name_en.lower()), None)
+
+    return {
+        "social_platforms": platforms,
+        "discord_url": discord_platform.url if discord_platform else None,
+    }
+
+
+def get_layout_context() -> Dict[str, Any]:
+    """캐시된 레이아웃 컨텍스트 조회"""
+    return get_or_compute(LAYOUT_CACHE_KEY, [LAYOUT], _compute_layout_context)
+
+
+def get_language_links(request: HttpRequest) -> List[Dict[str, str]]:
+    """현재 페이지의 언어별 URL 목록 (언어 선택 메뉴용)"""
+    path = request.get_full_path()
+    return [
+        {
+            "code": code,
+            "name": get_language_info(code)["name_local"],
+            "url": translate_url(path, code),
+        }
+        for code, _name in settings.LANGUAGES
+    ]
+
+
+def layout(request: HttpRequest) -> Dict[str, Any]:
+    """레이아웃 컨텍스트 프로세서 (지연 평가)"""
+    layout_context = SimpleLazyObject(get_layout_context)
+
+    return {
+        "social_platforms": SimpleLazyObject(lambda: layout_context["social_platforms"]),
+        "discord_url": SimpleLazyObject(lambda: layout_context["discord_url"]),
+        "language_links": SimpleLazyObject(lambda: get_language_links(request)),
+    }
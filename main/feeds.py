@@ -0,0 +1,75 @@
+"""
+활동 RSS/Atom 피드 (언어별)
+
+`/ko/events/feed/rss/`, `/en/events/feed/atom/` 등 언어 접두사별로 제공합니다.
+피드 본문은 전체 페이지 캐시에 언어별로 저장되어 활동이 바뀔 때만 다시 생성되고,
+활동 버전 기반 ETag/Last-Modified로 304를 응답하므로 매분 폴링해도 비용이 거의 들지 않습니다.
+"""
+
+from datetime import datetime
+from typing import Tuple
+
+from django.contrib.syndication.views import Feed
+from django.db.models import QuerySet
+from django.urls import reverse
+from django.utils import translation
+from django.utils.feedgenerator import Atom1Feed
+
+from .caching import ACTIVITIES, cache_public_page, conditional_page
+from .models import Activity
+from .query_budget import query_budget
+
+FEED_ITEMS_COUNT = 20
+
+
+def _is_korean() -> bool:
+    return translation.get_language() == "ko"
+
+
+class ActivityRssFeed(Feed):
+    """최근 등록된 공개 활동 RSS 피드"""
+
+    def title(self) -> str:
+        return "PyLadies Seoul 이벤트" if _is_korean() else "PyLadies Seoul Events"
+
+    def description(self) -> str:
+        if _is_korean():
+            return "PyLadies Seoul의 세미나, 워크숍, 네트워킹, 스터디그룹 소식"
+        return "Seminars, workshops, networking and study groups from PyLadies Seoul"
+
+    def link(self) -> str:
+        return reverse("events_list")
+
+    def items(self) -> QuerySet[Activity]:
+        return Activity.objects.filter(is_public=True).order_by("-created", "-id")[:FEED_ITEMS_COUNT]
+
+    def item_title(self, item: Activity) -> str:
+        return item.title_ko if _is_korean() else item.title_en or item.title_ko
+
+    def item_description(self, item: Activity) -> str:
+        return item.description_ko if _is_korean() else item.description_en or item.description_ko
+
+    def item_link(self, item: Activity) -> str:
+        return reverse("event_detail", args=[item.id])
+
+    def item_pubdate(self, item: Activity) -> datetime:
+        return item.created
+
+    def item_updateddate(self, item: Activity) -> datetime:
+        return item.modified
+
+    def item_categories(self, item: Activity) -> Tuple[str]:
+        return (str(item.get_activity_type_display()),)
+
+
+class ActivityAtomFeed(ActivityRssFeed):
+    """최근 등록된 공개 활동 Atom 피드"""
+
+    feed_type = Atom1Feed
+
+    def subtitle(self) -> str:
+        return self.description()
+
+
+activities_rss = query_budget(1)(conditional_page(ACTIVITIES)(cache_public_page(ACTIVITIES)(ActivityRssFeed())))
+activities_atom = query_budget(1)(conditional_page(ACTIVITIES)(cache_public_page(ACTIVITIES)(ActivityAtomFeed())))
@@ -0,0 +1,125 @@
+"""
+헬스체크 (liveness/readiness)
+
+- `/healthz` (liveness): 프로세스가 요청을 처리할 수 있는지만 확인합니다. 외부 의존성을 확인하지 않습니다.
+- `/readyz` (readiness): 데이터베이스 연결, 미적용 마이그레이션, 캐시 백엔드를 확인하고 항목별 소요 시간을 응답합니다.
+
+로드 밸런서와 Docker가 자주 호출하므로 `HealthCheckMiddleware`가 미들웨어 맨 앞에서 바로 응답하고
+(세션, CSRF, 언어 감지, i18n 리다이렉트를 거치지 않음), readiness 결과는 프로세스별로
+`HEALTH_CHECK_INTERVAL`초 동안 재사용합니다.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+LIVENESS_PATH = "/healthz"
+READINESS_PATH = "/readyz"
+
+# 캐시 백엔드 확인용 키
+CACHE_PROBE_KEY = "health:probe"
+
+Probe = Callable[[], Dict[str, Any]]
+
+
+def check_database() -> Dict[str, Any]:
+    """데이터베이스 연결 확인"""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    return {}
+
+
+def check_migrations() -> Dict[str, Any]:
+    """적용되지 않은 마이그레이션이 없는지 확인"""
+    executor = MigrationExecutor(connection)
+    pending = executor.migration_plan(executor.loader.graph.leaf_nodes())
+    if pending:
+        raise RuntimeError(f"{len(pending)} unapplied migrations")
+    return {}
+
+
+def check_cache() -> Dict[str, Any]:
+    """캐시 백엔드에 쓰고 다시 읽을 수 있는지 확인"""
+    cache = caches["default"]
+    value = uuid.uuid4().hex
+    cache.set(CACHE_PROBE_KEY, value, timeout=60)
+    if cache.get(CACHE_PROBE_KEY) != value:
+        raise RuntimeError("cache read did not return the written value")
+    return {"backend": type(cache).__name__}
+
+
+PROBES: Dict[str, Probe] = {
+    "database": check_database,
+    "migrations": check_migrations,
+    "cache": check_cache,
+}
+
+
+def _run_probe(name: str, probe: Probe) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        result = {"status": "ok", **probe()}
+    except Exception as error:
+        logger.warning("Readiness check %s failed", name, exc_info=True)
+        result = {"status": "error", "error": f"{type(error).__name__}: {error}"}
+    result["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+class ReadinessChecker:
+    """readiness 확인 결과를 일정 시간 재사용하는 확인기 (프로세스별)"""
+
+    def __init__(self, probes: Dict[str, Probe], interval: float) -> None:
+        self.probes = probes
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+
+    def check(self) -> Tuple[Dict[str, Any], bool]:
+        """(확인 결과, 재사용 여부). 동시에 들어온 요청은 확인이 끝날 때까지 기다렸다가 같은 결과를 받음"""
+        with self._lock:
+            if self._result is not None and time.monotonic() - self._checked_at < self.interval:
+                return self._result, True
+            checks = {name: _run_probe(name, probe) for name, probe in self.probes.items()}
+            self._result = {
+                "status": "ok" if all(check["status"] == "ok" for check in checks.values()) else "error",
+                "checked_at": timezone.now().isoformat(),
+                "checks": checks,
+            }
+            self._checked_at = time.monotonic()
+            return self._result, False
+
+    def reset(self) -> None:
+        """저장된 결과 삭제 (다음 요청에서 다시 확인)"""
+        with self._lock:
+            self._result = None
+
+
+readiness = ReadinessChecker(PROBES, settings.HEALTH_CHECK_INTERVAL)
+
+
+def liveness_response() -> HttpResponse:
+    """liveness 응답 (외부 의존성 확인 없음)"""
+    response = HttpResponse("ok", content_type="text/plain; charset=utf-8")
+    response["Cache-Control"] = "no-store"
+    return response
+
+
+def readiness_response() -> HttpResponse:
+    """readiness 응답 (하나라도 실패하면 503)"""
+    result, cached = readiness.check()
+    response = JsonResponse({**result, "cached": cached}, status=200 if result["status"] == "ok" else 503)
+    response["Cache-Control"] = "no-store"
+    return response
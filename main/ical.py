@@ -0,0 +1,153 @@
+"""
+공개 활동 iCalendar(.ics) 피드
+
+`/events.ics`와 활동 유형별 `/events/<유형>.ics`를 제공합니다. 응답은 제너레이터로
+한 이벤트씩 만들어 `StreamingHttpResponse`로 내보내고, DB에서도 `.iterator()`로 읽으므로
+이벤트가 몇 년치 쌓여도 메모리 사용량이 일정합니다.
+
+캘린더 앱은 피드를 자주 폴링하므로 활동 버전 기반 ETag/Last-Modified로 304를 응답합니다.
+시작 일시가 없는 스터디그룹은 일정(`meeting_schedule_*`)이 자유 형식 텍스트라
+반복 규칙으로 옮길 수 없으므로 피드에서 제외합니다.
+"""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import Iterator, List, Optional
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, StreamingHttpResponse
+from django.urls import reverse
+from django.utils import translation
+
+from .caching import ACTIVITIES, conditional_page
+from .models import Activity, ActivityType
+
+CRLF = "\r\n"
+MAX_LINE_OCTETS = 75
+CALENDAR_NAME = "PyLadies Seoul"
+PRODUCT_ID = "-//PyLadies Seoul//Events//KO"
+ITERATOR_CHUNK_SIZE = 200
+
+ICAL_FIELDS = (
+    "id",
+    "modified",
+    "title_ko",
+    "title_en",
+    "description_ko",
+    "description_en",
+    "start_datetime",
+    "end_datetime",
+    "location_name_ko",
+    "location_name_en",
+    "location_address",
+    "location_url",
+)
+
+
+def escape_text(value: str) -> str:
+    """TEXT 값 이스케이프 (RFC 5545 3.3.11)"""
+    return (
+        value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> str:
+    """75옥텟을 넘는 줄을 접어서 CRLF로 끝나는 문자열로 반환 (UTF-8 문자는 나누지 않음)"""
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line + CRLF
+
+    parts: List[str] = []
+    current, size = "", 0
+    for char in line:
+        octets = len(char.encode())
+        if size + octets > MAX_LINE_OCTETS:
+            parts.append(current)
+            current, size = " ", 1
+        current += char
+        size += octets
+    parts.append(current)
+    return CRLF.join(parts) + CRLF
+
+
+def format_datetime(value: datetime) -> str:
+    """UTC 날짜-시각 값 (예: 20250101T100000Z)"""
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _bilingual(korean: str, english: str, separator: str = " / ") -> str:
+    return separator.join(text for text in dict.fromkeys((korean, english)) if text)
+
+
+def render_event(activity: Activity, base_url: str, host: str) -> str:
+    """활동 하나를 VEVENT 블록으로 변환"""
+    with translation.override(settings.LANGUAGE_CODE):
+        url = base_url + reverse("event_detail", args=[activity.id])
+
+    description = _bilingual(activity.description_ko, activity.description_en, "\n\n")
+    location = _bilingual(activity.location_name_ko, activity.location_name_en)
+    if activity.location_address:
+        location = f"{location} ({activity.location_address})" if location else activity.location_address
+    if activity.location_url:
+        description = f"{description}\n\n{activity.location_url}"
+
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:activity-{activity.id}@{host}",
+        f"DTSTAMP:{format_datetime(activity.modified)}",
+        f"LAST-MODIFIED:{format_datetime(activity.modified)}",
+        f"DTSTART:{format_datetime(activity.start_datetime)}",  # type: ignore[arg-type]
+    ]
+    if activity.end_datetime:
+        lines.append(f"DTEND:{format_datetime(activity.end_datetime)}")
+    lines.append(f"SUMMARY:{escape_text(_bilingual(activity.title_ko, activity.title_en))}")
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    if location:
+        lines.append(f"LOCATION:{escape_text(location)}")
+    lines.extend([f"URL:{url}", "END:VEVENT"])
+    return "".join(fold_line(line) for line in lines)
+
+
+def generate_calendar(request: HttpRequest, activity_type: Optional[str] = None) -> Iterator[str]:
+    """VCALENDAR를 이벤트 단위로 나누어 생성"""
+    base_url = request.build_absolute_uri("/").rstrip("/")
+    host = request.get_host().split(":")[0]
+    name = CALENDAR_NAME
+    if activity_type:
+        name = f"{name} - {ActivityType(activity_type).label}"
+
+    yield "".join(
+        fold_line(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODUCT_ID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape_text(name)}",
+            f"X-WR-TIMEZONE:{settings.TIME_ZONE}",
+            "REFRESH-INTERVAL;VALUE=DURATION:PT1H",
+            "X-PUBLISHED-TTL:PT1H",
+        )
+    )
+
+    activities = Activity.objects.filter(is_public=True, start_datetime__isnull=False)
+    if activity_type:
+        activities = activities.filter(activity_type=activity_type)
+    for activity in activities.only(*ICAL_FIELDS).order_by("start_datetime", "id").iterator(ITERATOR_CHUNK_SIZE):
+        yield render_event(activity, base_url, host)
+
+    yield fold_line("END:VCALENDAR")
+
+
+@conditional_page(ACTIVITIES)
+def calendar_feed(request: HttpRequest, activity_type: Optional[str] = None) -> StreamingHttpResponse:
+    """공개 활동 iCalendar 피드 (전체 또는 활동 유형별)"""
+    if activity_type is not None and activity_type not in ActivityType.values:
+        raise Http404("Unknown activity type")
+
+    response = StreamingHttpResponse(
+        generate_calendar(request, activity_type), content_type="text/calendar; charset=utf-8"
+    )
+    response["Content-Disposition"] = f'inline; filename="{activity_type or "events"}.ics"'
+    return response
@@ -0,0 +1,155 @@
+"""
+반응형 이미지 변환본
+
+업로드된 원본(`Activity.image`, `Organizer.photo`, `SocialMediaPlatform.icon`)을 몇 가지 너비의
+WebP/JPEG로 줄여 `<원본 디렉터리>/variants/<파일명>-<너비>w.<확장자>`에 저장합니다.
+템플릿은 `{% responsive_image %}`로 `srcset`/`sizes`를 출력하므로, 브라우저는 카드 크기에 맞는
+작은 파일만 내려받습니다. 변환은 저장이 커밋된 뒤 백그라운드 스레드(`main.tasks`)에서 실행되며,
+변환본이 준비되기 전까지는 원본을 그대로 보여 줍니다.
+
+이미지 크기(`<필드>_width`/`<필드>_height`), 흐린 자리표시자(`<필드>_placeholder`), 변환본 준비 여부
+(`<필드>_has_variants`)는 업로드할 때 모델 컬럼에 저장되므로, 렌더링 중에는 파일을 열지 않습니다.
+"""
+
+import base64
+import posixpath
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple, Type
+
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import Storage, default_storage
+from django.db.models import Model
+from django.db.models.fields.files import FieldFile
+
+from PIL import Image, ImageOps
+
+from .models import Activity, Organizer, SocialMediaPlatform
+
+IMAGE_VARIANT_WIDTHS = (320, 640, 1280)
+IMAGE_QUALITY = 80
+PLACEHOLDER_SIZE = 16
+
+# 확장자: (Pillow 형식, MIME 타입)
+IMAGE_VARIANT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "webp": ("WEBP", "image/webp"),
+    "jpg": ("JPEG", "image/jpeg"),
+}
+
+# 변환본과 자리표시자를 만드는 이미지 필드
+IMAGE_FIELDS: Dict[Type[Model], str] = {
+    Activity: "image",
+    Organizer: "photo",
+    SocialMediaPlatform: "icon",
+}
+
+
+def variant_name(name: str, width: int, extension: str) -> str:
+    """원본 파일 이름에 대한 변환본 파일 이름"""
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, "variants", f"{stem}-{width}w.{extension}")
+
+
+def _resize(image: Image.Image, width: int) -> Image.Image:
+    """너비에 맞게 축소 (원본보다 크게 늘리지 않음)"""
+    if image.width <= width:
+        return image.copy()
+    height = max(1, round(image.height * width / image.width))
+    return image.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def _prepare(image: Image.Image, image_format: str) -> Image.Image:
+    """형식에 맞는 색상 모드로 변환 (JPEG는 투명 영역을 흰색 배경으로 채움)"""
+    has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+    if not has_alpha:
+        return image.convert("RGB")
+    image = image.convert("RGBA")
+    if image_format != "JPEG":
+        return image
+    background = Image.new("RGB", image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel("A"))
+    return background
+
+
+def placeholder_data_uri(file: File) -> str:
+    """흐린 자리표시자로 쓸 아주 작은 WebP의 data URI (수백 바이트 이하)"""
+    file.seek(0)
+    with Image.open(file) as original:
+        # JPEG는 DCT 단계에서 축소하여 디코딩하므로 큰 사진도 빠르게 처리됨
+        original.draft("RGB", (PLACEHOLDER_SIZE * 4, PLACEHOLDER_SIZE * 4))
+        image = ImageOps.exif_transpose(original)
+    file.seek(0)
+
+    image.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    buffer = BytesIO()
+    _prepare(image, "WEBP").save(buffer, format="WEBP", quality=50)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode()
+
+
+def variants_ready(image: FieldFile) -> bool:
+    """변환본이 준비되었는지 (모델의 `<필드>_has_variants` 컬럼, 파일시스템을 확인하지 않음)"""
+    return bool(getattr(image.instance, f"{image.field.name}_has_variants", False))
+
+
+def dimensions(image: FieldFile) -> Tuple[Optional[int], Optional[int]]:
+    """모델 컬럼에 저장된 이미지 크기 (파일을 열지 않음, 알 수 없으면 None)"""
+    field = image.field
+    # 0은 파일이 없는 이미지 (backfill_images가 기록)
+    return (
+        getattr(image.instance, field.width_field, None) or None,
+        getattr(image.instance, field.height_field, None) or None,
+    )
+
+
+def placeholder(image: FieldFile) -> str:
+    """모델 컬럼에 저장된 자리표시자 data URI"""
+    return getattr(image.instance, f"{image.field.name}_placeholder", "")
+
+
+def generate_variants(name: str, storage: Optional[Storage] = None) -> List[str]:
+    """
+    없는 변환본만 생성합니다.
+
+    Args:
+        name: 스토리지 기준 원본 파일 이름
+        storage: 파일 스토리지 (기본값: default_storage)
+
+    Returns:
+        새로 저장한 변환본 파일 이름 목록
+    """
+    storage = storage or default_storage
+    missing = [
+        (width, extension)
+        for width in IMAGE_VARIANT_WIDTHS
+        for extension in IMAGE_VARIANT_FORMATS
+        if not storage.exists(variant_name(name, width, extension))
+    ]
+    if not missing:
+        return []
+
+    with storage.open(name, "rb") as file, Image.open(file) as original:
+        # 휴대폰 사진의 회전 정보를 픽셀에 반영 (변환본에는 EXIF를 남기지 않음)
+        image = ImageOps.exif_transpose(original)
+
+    saved = []
+    for width, extension in missing:
+        image_format = IMAGE_VARIANT_FORMATS[extension][0]
+        buffer = BytesIO()
+        _prepare(_resize(image, width), image_format).save(
+            buffer, format=image_format, quality=IMAGE_QUALITY, optimize=True
+        )
+        saved.append(storage.save(variant_name(name, width, extension), ContentFile(buffer.getvalue())))
+    return saved
+
+
+def srcset(name: str, extension: str, storage: Optional[Storage] = None) -> str:
+    """변환본 너비별 `srcset` 속성 값"""
+    storage = storage or default_storage
+    return ", ".join(f"{storage.url(variant_name(name, width, extension))} {width}w" for width in IMAGE_VARIANT_WIDTHS)
+
+
+def thumbnail_url(image: FieldFile) -> str:
+    """가장 작은 JPEG 변환본 URL (아직 없으면 원본)"""
+    if not variants_ready(image):
+        return image.url
+    return image.storage.url(variant_name(image.name, IMAGE_VARIANT_WIDTHS[0], list(IMAGE_VARIANT_FORMATS)[-1]))
@@ -0,0 +1,75 @@
+"""
+이미지 크기, 자리표시자, 반응형 변환본 채우기 커맨드
+
+사용법:
+    python manage.py backfill_images            # 아직 처리되지 않은 이미지만
+    python manage.py backfill_images --force    # 모든 이미지 다시 처리 (파일이 없던 이미지 포함)
+
+업로드 시점에 저장되는 값(`main.images`)이 없는 기존 이미지를 처리합니다.
+크기가 비어 있는 행은 인스턴스를 만들 때마다 Django가 파일을 열어 크기를 읽으므로, 마이그레이션 직후 실행하세요.
+파일이 없는 이미지는 크기를 0으로 기록하여 다시 파일을 열지 않게 합니다 (`main.models.DimensionsImageField`).
+크기가 0인 이미지는 `--force` 없이는 다시 처리하지 않으므로, 컨테이너를 시작할 때마다 실행해도 같은 실패를 반복하지 않습니다.
+"""
+
+from typing import Any, Type
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Model, Q
+
+from main.images import IMAGE_FIELDS, generate_variants, placeholder_data_uri
+
+
+class Command(BaseCommand):
+    help = "기존 이미지의 크기, 자리표시자, 반응형 변환본을 생성합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--force", action="store_true", help="이미 처리된 이미지도 다시 처리")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        processed = failed = 0
+        for model, field_name in IMAGE_FIELDS.items():
+            images = model._default_manager.exclude(Q(**{f"{field_name}__isnull": True}) | Q(**{field_name: ""}))
+            if not options["force"]:
+                images = images.filter(
+                    Q(**{f"{field_name}_width__isnull": True})
+                    | Q(**{f"{field_name}_placeholder": ""})
+                    | Q(**{f"{field_name}_has_variants": False})
+                ).exclude(
+                    # 파일이 없어 크기를 0으로 기록한 이미지
+                    **{f"{field_name}_width": 0}
+                )
+
+            # 인스턴스를 만들 때 파일을 읽으므로, 파일이 없는 행을 건너뛸 수 있게 하나씩 조회
+            for pk in images.order_by("pk").values_list("pk", flat=True):
+                try:
+                    self.backfill(model, pk, field_name)
+                    processed += 1
+                except OSError as e:
+                    failed += 1
+                    self.stderr.write(f"  {model._meta.model_name} {pk}: {e}")
+                    if isinstance(e, FileNotFoundError):
+                        self.mark_missing(model, pk, field_name)
+
+        self.stdout.write(self.style.SUCCESS(f"{processed} processed, {failed} failed"))
+
+    def mark_missing(self, model: Type[Model], pk: int, field_name: str) -> None:
+        """파일이 없는 이미지의 크기를 0으로 기록 (인스턴스를 만들 때 다시 파일을 열지 않도록)"""
+        model._default_manager.filter(pk=pk).update(**{f"{field_name}_width": 0, f"{field_name}_height": 0})
+
+    def backfill(self, model: Type[Model], pk: int, field_name: str) -> None:
+        instance = model._default_manager.get(pk=pk)
+        image = getattr(instance, field_name)
+        image.field.update_dimension_fields(instance, force=True)
+        with image.open("rb"):
+            setattr(instance, f"{field_name}_placeholder", placeholder_data_uri(image))
+        generate_variants(image.name)
+        setattr(instance, f"{field_name}_has_variants", True)
+        instance.save(
+            update_fields=[
+                image.field.width_field,
+                image.field.height_field,
+                f"{field_name}_placeholder",
+                f"{field_name}_has_variants",
+                "modified",
+            ]
+        )
@@ -0,0 +1,147 @@
+"""
+성능 벤치마크 커맨드
+
+사용법:
+    python manage.py benchmark coc --iterations 1000
+    python manage.py benchmark sqlite --iterations 500
+"""
+
+import inspect
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import timeit
+from typing import Any, Callable, Dict, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.http import HttpRequest
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils.safestring import mark_safe
+
+from main import views
+
+# SQLite 벤치마크: 읽기 스레드 수, 초기 행 수
+SQLITE_READERS = 4
+SQLITE_ROWS = 1000
+
+
+class Command(BaseCommand):
+    help = "요청 단위 처리 비용을 측정합니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("target", choices=["coc", "sqlite"], help="측정 대상")
+        parser.add_argument("--iterations", type=int, default=1000, help="반복 횟수")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        getattr(self, f"benchmark_{options['target']}")(options["iterations"])
+
+    def report(self, label: str, func: Callable[[], Any], iterations: int) -> float:
+        """함수 1회 호출당 평균 소요 시간(마이크로초) 출력"""
+        func()  # 워밍업
+        per_call = timeit.timeit(func, number=iterations) / iterations * 1_000_000
+        self.stdout.write(f"  {label:<40} {per_call:>12.2f} µs/request")
+        return per_call
+
+    def benchmark_coc(self, iterations: int) -> None:
+        """행동 강령 페이지: 요청마다 마크다운 변환 vs 시작 시 1회 변환"""
+
+        def legacy_context() -> Dict[str, str]:
+            # 이전 구현: 요청마다 딕셔너리를 복사하고 4개 필드를 정규식으로 변환
+            processed = views.CODE_OF_CONDUCT.copy()
+            for field in views.CODE_OF_CONDUCT_MARKDOWN_FIELDS:
+                processed[field] = mark_safe(views.convert_markdown_to_html(views.CODE_OF_CONDUCT[field]))
+            return processed
+
+        def precomputed_context() -> Dict[str, str]:
+            return views.RENDERED_CODE_OF_CONDUCT
+
+        request: HttpRequest = RequestFactory().get(reverse("coc"))
+
+        self.stdout.write(f"/coc/ ({iterations} iterations)")
+        before = self.report("context: per-request markdown", legacy_context, iterations)
+        after = self.report("context: precomputed", precomputed_context, iterations)
+        self.report("view: render (page cache bypassed)", lambda: inspect.unwrap(views.coc)(request), iterations)
+        self.report("view: page cache hit", lambda: views.coc(request), iterations)
+        self.stdout.write(self.style.SUCCESS(f"  context preparation speedup: {before / max(after, 1e-9):.0f}x"))
+
+    def benchmark_sqlite(self, iterations: int) -> None:
+        """관리자가 쓰는 동안의 읽기 처리량: SQLite 기본 설정 vs `SQLITE_PRAGMAS`"""
+        profiles = {
+            "default pragmas (rollback journal)": "",
+            "settings.SQLITE_PRAGMAS (WAL)": settings.DATABASES["default"].get("OPTIONS", {}).get("init_command", ""),
+        }
+
+        self.stdout.write(f"SQLite reads during {iterations} admin writes ({SQLITE_READERS} readers)")
+        results = {}
+        for label, init_command in profiles.items():
+            with tempfile.TemporaryDirectory() as directory:
+                reads, errors, elapsed = self._reads_during_writes(
+                    os.path.join(directory, "db.sqlite3"), init_command, iterations
+                )
+            results[label] = reads / elapsed
+            self.stdout.write(f"  {label:<40} {reads / elapsed:>12.0f} reads/s  {errors:>6} locked")
+
+        before, after = results.values()
+        self.stdout.write(self.style.SUCCESS(f"  read throughput speedup: {after / max(before, 1e-9):.1f}x"))
+
+    def _reads_during_writes(self, path: str, init_command: str, iterations: int) -> Tuple[int, int, float]:
+        """쓰기 스레드 1개가 `iterations`번 커밋하는 동안 읽기 스레드들이 처리한 쿼리 수, 잠금 오류 수, 소요 시간"""
+
+        def connect() -> sqlite3.Connection:
+            # Django와 같은 방식으로 연결마다 PRAGMA 적용
+            conn = sqlite3.connect(path, isolation_level=None)
+            for statement in init_command.split(";"):
+                if statement := statement.strip():
+                    conn.execute(statement)
+            return conn
+
+        setup = connect()
+        setup.execute("CREATE TABLE activity (id INTEGER PRIMARY KEY, title TEXT, description TEXT)")
+        setup.executemany(
+            "INSERT INTO activity (title, description) VALUES (?, ?)",
+            ((f"Activity {i}", "description " * 20) for i in range(SQLITE_ROWS)),
+        )
+        setup.close()
+
+        done = threading.Event()
+        counts = {"reads": 0, "errors": 0}
+        lock = threading.Lock()
+
+        def reader() -> None:
+            conn = connect()
+            reads = errors = 0
+            while not done.is_set():
+                try:
+                    conn.execute("SELECT id, title FROM activity ORDER BY id DESC LIMIT 20").fetchall()
+                    reads += 1
+                except sqlite3.OperationalError:
+                    errors += 1
+            conn.close()
+            with lock:
+                counts["reads"] += reads
+                counts["errors"] += errors
+
+        def writer() -> None:
+            # 관리자 저장 1회: 트랜잭션 안에서 수정 1건과 추가 1건
+            conn = connect()
+            for i in range(iterations):
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("UPDATE activity SET description = ? WHERE id = ?", (f"edit {i}", i % SQLITE_ROWS + 1))
+                conn.execute("INSERT INTO activity (title, description) VALUES (?, ?)", (f"New {i}", "description"))
+                conn.execute("COMMIT")
+            conn.close()
+
+        readers = [threading.Thread(target=reader) for _ in range(SQLITE_READERS)]
+        for thread in readers:
+            thread.start()
+        started = time.perf_counter()
+        writer()
+        elapsed = time.perf_counter() - started
+        done.set()
+        for thread in readers:
+            thread.join()
+        return counts["reads"], counts["errors"], elapsed
@@ -0,0 +1,66 @@
+"""
+정적 사이트 내보내기 커맨드
+
+사용법:
+    python manage.py export_static            # 바뀐 페이지만 다시 렌더링
+    python manage.py export_static --force    # 모든 페이지 다시 렌더링 (배포 직후 등)
+    python manage.py export_static --interval 60    # 60초마다 반복 (운영 컨테이너의 exporter 서비스)
+
+홈페이지의 다가오는/지난 이벤트는 시간이 지나면 바뀌므로 주기적으로 실행해야 합니다.
+바뀐 페이지가 없으면 쿼리 몇 번으로 끝납니다. `--interval`로 반복할 때 실패한 실행은 기록만 하고
+다음 주기에 다시 시도하며, `--force`는 처음 성공할 때까지만 적용됩니다.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+
+from main.static_export import export_site
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "공개 페이지를 언어별 정적 HTML 파일로 내보냅니다."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--output", type=Path, default=settings.STATIC_EXPORT_ROOT, help="출력 디렉터리")
+        parser.add_argument("--jobs", type=int, default=None, help="렌더링 프로세스 수 (기본값: CPU 수)")
+        parser.add_argument("--force", action="store_true", help="모든 페이지를 다시 렌더링")
+        parser.add_argument("--interval", type=float, default=0, help="지정한 초마다 반복 실행")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not options["interval"]:
+            self.export(options, options["force"])
+            return
+
+        force = options["force"]
+        while True:
+            try:
+                self.export(options, force)
+                force = False
+            except Exception:
+                logger.exception("Static export failed")
+            finally:
+                # 오래 실행되는 프로세스이므로 끊기거나 오래된 DB 연결은 다음 주기 전에 정리
+                close_old_connections()
+            time.sleep(options["interval"])
+
+    def export(self, options: Dict[str, Any], force: bool) -> None:
+        result = export_site(options["output"], jobs=options["jobs"], force=force)
+
+        if options["verbosity"] > 1:
+            for path in result.rendered:
+                self.stdout.write(f"  rendered {path}")
+            for path in result.removed:
+                self.stdout.write(f"  removed  {path}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(result.rendered)} rendered, {len(result.removed)} removed, {result.unchanged} unchanged"
+            )
+        )
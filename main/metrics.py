@@ -0,0 +1,342 @@
+"""
+요청 지표 (Prometheus 텍스트 형식)
+
+`MetricsMiddleware`가 뷰 이름과 언어별로 요청 수(상태 코드별), 응답 시간 히스토그램, 응답 크기,
+SQL 쿼리 수와 시간, 템플릿 렌더링 시간을 프로세스 메모리에 누적합니다.
+gunicorn 워커처럼 여러 프로세스가 있으면 각 프로세스가 `METRICS_DIR`에 자기 파일(`metrics-<pid>.json`)을
+주기적으로 덮어쓰고, `/metrics`는 모든 파일을 합산하여 응답합니다 (별도 수집 서비스 불필요).
+요청 처리 중에는 메모리 값만 갱신하고, 파일 쓰기는 `METRICS_FLUSH_INTERVAL`초에 한 번만 합니다.
+
+파일 이름은 처음 기록할 때의 pid로 정하므로 `gunicorn --preload`로 fork된 워커도 각자 파일을 쓰며,
+종료되거나 재시작된 워커의 파일은 `/metrics` 조회 때 누적 파일(`metrics-aggregate.json`)에 더한 뒤
+삭제합니다. 모든 값이 카운터(히스토그램 포함)이므로, 워커가 바뀌어도 합계는 줄어들지 않습니다.
+pid로 프로세스 생존 여부를 확인하므로 `METRICS_DIR`은 컨테이너(호스트)마다 따로 두어야 합니다.
+"""
+
+import atexit
+import fcntl
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.views.decorators.cache import never_cache
+
+logger = logging.getLogger(__name__)
+
+# 응답 시간 히스토그램 구간 상한(초), 마지막 구간(+Inf)은 자동 추가
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 뷰별 누적 값의 위치 (그 뒤에 히스토그램 구간별 요청 수)
+COUNT, DURATION, RESPONSE_BYTES, DB_QUERIES, DB_SECONDS, TEMPLATE_SECONDS = range(6)
+BUCKETS = 6
+
+ViewKey = Tuple[str, str]
+StatusKey = Tuple[str, str, str]
+Snapshot = Dict[str, list]
+
+# 종료된 워커의 지표를 더해 두는 파일과, 이 파일을 갱신하는 동안 잡는 잠금 파일
+AGGREGATE_NAME = "metrics-aggregate.json"
+LOCK_NAME = ".metrics.lock"
+
+
+class RequestTimings:
+    """요청 하나를 처리하는 동안 누적되는 단계별 시간"""
+
+    __slots__ = ("db_queries", "db_seconds", "template_seconds", "cache_calls", "cache_seconds", "rendering")
+
+    def __init__(self) -> None:
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.template_seconds = 0.0
+        self.cache_calls = 0
+        self.cache_seconds = 0.0
+        # 템플릿 렌더링 중 여부 (중첩 렌더링을 두 번 세지 않도록)
+        self.rendering = False
+
+
+# 처리 중인 요청의 RequestTimings (요청 밖에서는 None)
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("current_timings", default=None)
+
+
+@contextmanager
+def track_request() -> Iterator[RequestTimings]:
+    """블록 안의 SQL 쿼리 수와 시간을 측정 (이미 측정 중이면 같은 RequestTimings를 공유)"""
+    timings = current_timings.get()
+    if timings is not None:
+        yield timings
+        return
+
+    def record(execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            timings.db_queries += 1
+            timings.db_seconds += time.perf_counter() - started
+
+    timings = RequestTimings()
+    token = current_timings.set(timings)
+    try:
+        with connection.execute_wrapper(record):
+            yield timings
+    finally:
+        current_timings.reset(token)
+
+
+def _empty_stats() -> List[float]:
+    return [0.0] * (BUCKETS + len(LATENCY_BUCKETS) + 1)
+
+
+class MetricsRegistry:
+    """프로세스별 지표 저장소"""
+
+    def __init__(self, directory: Optional[Path] = None, flush_interval: float = 5.0) -> None:
+        self.directory = Path(directory) if directory else None
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._views: Dict[ViewKey, List[float]] = {}
+        self._statuses: Dict[StatusKey, int] = {}
+        self._last_flush = time.monotonic()
+
+    @property
+    def path(self) -> Optional[Path]:
+        """이 프로세스의 지표 파일"""
+        return self.directory / f"metrics-{self._pid}.json" if self.directory else None
+
+    def _check_fork(self) -> None:
+        """fork된 프로세스에서 처음 호출되면 부모에게서 복사된 값을 버리고 자기 pid를 사용 (잠금 안에서 호출)"""
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._views = {}
+            self._statuses = {}
+            self._last_flush = time.monotonic()
+
+    def observe(
+        self, view: str, language: str, status: int, duration: float, size: int, timings: RequestTimings
+    ) -> None:
+        """요청 하나의 지표 누적"""
+        with self._lock:
+            self._check_fork()
+            stats = self._views.get((view, language))
+            if stats is None:
+                stats = self._views[(view, language)] = _empty_stats()
+            stats[COUNT] += 1
+            stats[DURATION] += duration
+            stats[RESPONSE_BYTES] += size
+            stats[DB_QUERIES] += timings.db_queries
+            stats[DB_SECONDS] += timings.db_seconds
+            stats[TEMPLATE_SECONDS] += timings.template_seconds
+            stats[BUCKETS + bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+            status_key = (view, language, str(status))
+            self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+
+            flush_due = self.directory is not None and time.monotonic() - self._last_flush >= self.flush_interval
+
+        if flush_due:
+            self.flush()
+
+    def _snapshot(self) -> Snapshot:
+        with self._lock:
+            self._check_fork()
+            return _dump(self._views, self._statuses)
+
+    def flush(self) -> None:
+        """이 프로세스의 지표를 파일에 저장"""
+        if self.directory is None:
+            return
+        snapshot = self._snapshot()
+        path = self.path
+        self._last_flush = time.monotonic()
+        try:
+            _write_snapshot(path, snapshot)
+        except OSError:
+            logger.warning("Could not write metrics to %s", path, exc_info=True)
+
+    @contextmanager
+    def _directory_lock(self) -> Iterator[None]:
+        """여러 워커가 동시에 누적 파일을 갱신하지 않도록 잠금"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / LOCK_NAME, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _merge_dead_workers(self) -> None:
+        """종료된 워커의 파일을 누적 파일에 더한 뒤 삭제 (잠금 안에서 호출)"""
+        dead = [
+            path
+            for path in self.directory.glob("metrics-*.json")
+            if (pid := _file_pid(path)) is not None and pid != os.getpid() and not _process_alive(pid)
+        ]
+        if not dead:
+            return
+        aggregate = self.directory / AGGREGATE_NAME
+        views, statuses = _merge(_read_snapshot(path) for path in [aggregate, *dead])
+        try:
+            _write_snapshot(aggregate, _dump(views, statuses))
+        except OSError:
+            logger.warning("Could not write metrics to %s", aggregate, exc_info=True)
+            return
+        for path in dead:
+            path.unlink(missing_ok=True)
+
+    def _snapshots(self) -> List[Snapshot]:
+        if self.directory is None:
+            return [self._snapshot()]
+        self.flush()
+        try:
+            with self._directory_lock():
+                self._merge_dead_workers()
+                # 누적 파일에 더한 뒤 삭제하기 전의 파일을 두 번 세지 않도록 잠금 안에서 읽음
+                return [_read_snapshot(path) for path in sorted(self.directory.glob("metrics-*.json"))]
+        except OSError:
+            logger.warning("Could not read metrics from %s", self.directory, exc_info=True)
+            return [self._snapshot()]
+
+    def collect(self) -> Tuple[Dict[ViewKey, List[float]], Dict[StatusKey, int]]:
+        """모든 프로세스(종료된 워커 포함)의 지표 합산"""
+        return _merge(self._snapshots())
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        views, statuses = self.collect()
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        metric("http_requests_total", "counter", "Requests by view, language and status code.")
+        for (view, language, status), count in sorted(statuses.items()):
+            lines.append(f"http_requests_total{_labels(view=view, language=language, status=status)} {count}")
+
+        metric("http_request_duration_seconds", "histogram", "Request latency by view and language.")
+        for (view, language), stats in sorted(views.items()):
+            cumulative = 0.0
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), stats[BUCKETS:]):
+                cumulative += count
+                labels = _labels(view=view, language=language, le=str(bound))
+                lines.append(f"http_request_duration_seconds_bucket{labels} {_number(cumulative)}")
+            labels = _labels(view=view, language=language)
+            lines.append(f"http_request_duration_seconds_sum{labels} {_number(stats[DURATION])}")
+            lines.append(f"http_request_duration_seconds_count{labels} {_number(stats[COUNT])}")
+
+        for name, index, help_text in (
+            ("http_response_size_bytes_total", RESPONSE_BYTES, "Response body bytes by view and language."),
+            ("db_queries_total", DB_QUERIES, "SQL queries by view and language."),
+            ("db_query_duration_seconds_total", DB_SECONDS, "Time spent executing SQL by view and language."),
+            (
+                "template_render_duration_seconds_total",
+                TEMPLATE_SECONDS,
+                "Time spent rendering templates, excluding SQL and cache calls made while rendering.",
+            ),
+        ):
+            metric(name, "counter", help_text)
+            for (view, language), stats in sorted(views.items()):
+                lines.append(f"{name}{_labels(view=view, language=language)} {_number(stats[index])}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _read_snapshot(path: Path) -> Snapshot:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        # 아직 없는 누적 파일, 다른 프로세스가 지운 파일, 손상된 파일
+        return {"views": [], "statuses": []}
+
+
+def _write_snapshot(path: Path, snapshot: Snapshot) -> None:
+    """임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 봄"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(snapshot, separators=(",", ":")))
+    os.replace(temporary, path)
+
+
+def _merge(snapshots: Iterable[Snapshot]) -> Tuple[Dict[ViewKey, List[float]], Dict[StatusKey, int]]:
+    """여러 스냅샷의 지표 합산"""
+    views: Dict[ViewKey, List[float]] = {}
+    statuses: Dict[StatusKey, int] = {}
+    for snapshot in snapshots:
+        for view, language, *values in snapshot["views"]:
+            total = views.setdefault((view, language), _empty_stats())
+            for index, value in enumerate(values[: len(total)]):
+                total[index] += value
+        for view, language, status, count in snapshot["statuses"]:
+            statuses[(view, language, status)] = statuses.get((view, language, status), 0) + count
+    return views, statuses
+
+
+def _dump(views: Dict[ViewKey, List[float]], statuses: Dict[StatusKey, int]) -> Snapshot:
+    return {
+        "views": [[*key, *stats] for key, stats in views.items()],
+        "statuses": [[*key, count] for key, count in statuses.items()],
+    }
+
+
+def _file_pid(path: Path) -> Optional[int]:
+    """지표 파일 이름의 pid (`metrics-<pid>.json`)"""
+    try:
+        return int(path.stem.split("-")[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _process_alive(pid: int) -> bool:
+    """이 호스트(컨테이너)에서 pid 프로세스가 실행 중인지"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.6f}"
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_label_value(value)}"' for key, value in labels.items()) + "}"
+
+
+registry = MetricsRegistry(settings.METRICS_DIR, settings.METRICS_FLUSH_INTERVAL)
+atexit.register(registry.flush)
+
+
+def _authorized(request: HttpRequest) -> bool:
+    """`METRICS_TOKEN` 베어러 토큰 또는 스태프 사용자"""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if settings.METRICS_TOKEN and scheme.lower() == "bearer":
+        return hmac.compare_digest(token.strip().encode(), settings.METRICS_TOKEN.encode())
+    return request.user.is_staff
+
+
+@never_cache
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """모든 프로세스의 지표 (Prometheus 수집용)"""
+    if not _authorized(request):
+        return HttpResponseForbidden()
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
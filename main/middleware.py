@@ -0,0 +1,260 @@
+"""
+미들웨어
+"""
+
+import hmac
+import mimetypes
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import MiddlewareNotUsed, SuspiciousFileOperation
+from django.db import connection
+from django.http import FileResponse, HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe
+
+from . import health
+from .metrics import current_timings, registry, track_request
+from .query_budget import Query, QueryBudgetExceeded, budget_report, get_query_budget, is_exempt
+
+# 내용 해시가 붙은 파일 (이름이 바뀌지 않으므로 무기한 캐시)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+# (Content-Encoding, 사전 압축본 확장자), 선호 순
+PRECOMPRESSED_ENCODINGS = (("gzip", ".gz"),)
+
+
+def _accepted_encodings(header: str) -> Set[str]:
+    """Accept-Encoding 헤더에서 허용된(q=0이 아닌) 인코딩"""
+    encodings = set()
+    for item in header.split(","):
+        token, _, params = item.partition(";")
+        quality = params.strip()
+        try:
+            if quality.startswith("q=") and float(quality[2:]) == 0:
+                continue
+        except ValueError:
+            continue
+        encodings.add(token.strip().lower())
+    return encodings
+
+
+class StaticFilesMiddleware:
+    """
+    nginx 없이 단일 컨테이너로 배포할 때 `STATIC_ROOT`의 파일을 직접 제공하는 미들웨어.
+
+    `collectstatic`이 만든 `.gz` 사전 압축본을 Accept-Encoding에 맞춰 그대로 보내고,
+    해시가 붙은 파일에는 1년 immutable 캐시 헤더를 붙입니다. `SERVE_STATIC`이 꺼져 있으면 제거됩니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.SERVE_STATIC:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.prefix = "/" + settings.STATIC_URL.lstrip("/")
+        self.root = str(settings.STATIC_ROOT)
+        self.immutable_names = self._hashed_names()
+
+    @staticmethod
+    def _hashed_names() -> Set[str]:
+        hashed_files = getattr(staticfiles_storage, "hashed_files", None)
+        return set(hashed_files.values()) if hashed_files else set()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.method in ("GET", "HEAD") and request.path_info.startswith(self.prefix):
+            response = self.serve(request, request.path_info[len(self.prefix) :])
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    def _find(self, name: str) -> Optional[str]:
+        try:
+            path = safe_join(self.root, name)
+        except SuspiciousFileOperation:
+            return None
+        return path if os.path.isfile(path) else None
+
+    def serve(self, request: HttpRequest, name: str) -> Optional[HttpResponse]:
+        """정적 파일 응답 (없으면 None을 반환하여 Django가 404 처리)"""
+        path = self._find(name)
+        if path is None or name.endswith(".gz"):
+            return None
+
+        stat = os.stat(path)
+        if_modified_since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+        if if_modified_since is not None and int(stat.st_mtime) <= if_modified_since:
+            response: HttpResponse = HttpResponseNotModified()
+        else:
+            encoding = None
+            accepted = _accepted_encodings(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+            for token, suffix in PRECOMPRESSED_ENCODINGS:
+                if token in accepted and os.path.isfile(path + suffix):
+                    encoding, path = token, path + suffix
+                    break
+
+            content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            response = FileResponse(open(path, "rb"), content_type=content_type, filename=os.path.basename(name))
+            if encoding:
+                response["Content-Encoding"] = encoding
+
+        response["Last-Modified"] = http_date(stat.st_mtime)
+        response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if name in self.immutable_names else STATIC_CACHE_CONTROL
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
+
+
+class HealthCheckMiddleware:
+    """
+    헬스체크(`main.health`)에 바로 응답하는 미들웨어.
+
+    로드 밸런서와 Docker가 자주 호출하는 `/healthz`, `/readyz` 요청이 세션, CSRF, 언어 감지 등
+    나머지 미들웨어와 i18n 리다이렉트를 거치지 않도록 미들웨어 목록의 맨 앞에 둡니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.path_info == health.LIVENESS_PATH:
+            return health.liveness_response()
+        if request.path_info == health.READINESS_PATH:
+            return health.readiness_response()
+        return self.get_response(request)
+
+
+class QueryBudgetMiddleware:
+    """
+    뷰에 선언된 쿼리 수 제한(`main.query_budget.query_budget`)을 검사하는 미들웨어.
+
+    요청 전체에서 실행된 쿼리를 세어, 예산을 넘으면 실행된 SQL 목록과 함께 `QueryBudgetExceeded`를
+    발생시킵니다. 예산이 없는 뷰(관리자 등)는 검사하지 않고, `QUERY_BUDGET_ENFORCED`가 꺼져 있으면 제거됩니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.QUERY_BUDGET_ENFORCED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if settings.SESSION_COOKIE_NAME in request.COOKIES:
+            # 예산은 세션이 없는 익명 요청 기준 (로그인한 관리자는 세션/사용자 조회 쿼리가 추가됨)
+            return self.get_response(request)
+
+        queries: List[Query] = []
+
+        def record(execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+            if not is_exempt():
+                queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(record):
+            response = self.get_response(request)
+
+        budget = getattr(request, "query_budget", None)
+        if budget is not None and len(queries) > budget:
+            raise QueryBudgetExceeded(budget_report(request.resolver_match.view_name, budget, queries))
+        return response
+
+    def process_view(
+        self, request: HttpRequest, view_func: Callable[..., Any], view_args: Any, view_kwargs: Any
+    ) -> None:
+        request.query_budget = get_query_budget(view_func)  # type: ignore[attr-defined]
+
+
+class MetricsMiddleware:
+    """
+    뷰 이름과 언어별 요청 지표(`main.metrics`)를 기록하는 미들웨어.
+
+    응답 시간, 상태 코드, 응답 크기와 함께 요청 중 실행된 SQL 쿼리 수와 시간을 셉니다.
+    URL에 맞는 뷰가 없는 요청은 `unmatched`로 묶어 레이블 수가 늘어나지 않게 합니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        with track_request() as timings:
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        match = request.resolver_match
+        if response.streaming:
+            size = int(response.get("Content-Length") or 0)
+        else:
+            size = len(response.content)
+        registry.observe(
+            match.view_name if match else "unmatched",
+            getattr(request, "LANGUAGE_CODE", ""),
+            response.status_code,
+            duration,
+            size,
+            timings,
+        )
+        return response
+
+
+class ServerTimingMiddleware:
+    """
+    단계별 처리 시간을 `Server-Timing` 응답 헤더로 보내는 미들웨어 (브라우저 개발자 도구의 Timing 탭).
+
+    SQL 쿼리(db), 템플릿 렌더링(tpl), 캐시 조회(cache), 그 밖의 뷰 본문(view)과 전체(total) 시간을
+    밀리초로 보냅니다. `SERVER_TIMING_ALWAYS`가 켜져 있으면 모든 응답에, 아니면 스태프 사용자나
+    `X-Server-Timing: <SERVER_TIMING_TOKEN>` 헤더를 보낸 요청에만 붙입니다.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        started = time.perf_counter()
+        with track_request() as timings:
+            response = self.get_response(request)
+            if not self._enabled(request):
+                return response
+        total = time.perf_counter() - started
+
+        metrics = [
+            ("db", timings.db_seconds, f"{timings.db_queries} queries"),
+            ("tpl", timings.template_seconds, None),
+            ("cache", timings.cache_seconds, f"{timings.cache_calls} calls"),
+        ]
+        view_timing = getattr(request, "server_timing_view", None)
+        if view_timing is not None:
+            view_started, inner_before = view_timing
+            # 뷰가 호출된 뒤의 시간에서 그동안의 db/tpl/cache 시간을 뺀 나머지
+            inner = timings.db_seconds + timings.template_seconds + timings.cache_seconds - inner_before
+            metrics.append(("view", max(time.perf_counter() - view_started - inner, 0.0), None))
+        metrics.append(("total", total, None))
+
+        response["Server-Timing"] = ", ".join(
+            f"{name};dur={seconds * 1000:.1f}" + (f';desc="{description}"' if description else "")
+            for name, seconds, description in metrics
+        )
+        return response
+
+    def process_view(
+        self, request: HttpRequest, view_func: Callable[..., Any], view_args: Any, view_kwargs: Any
+    ) -> None:
+        timings = current_timings.get()
+        if timings is not None:
+            inner = timings.db_seconds + timings.template_seconds + timings.cache_seconds
+            request.server_timing_view = (time.perf_counter(), inner)  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _enabled(request: HttpRequest) -> bool:
+        if settings.SERVER_TIMING_ALWAYS:
+            return True
+        token = request.headers.get("X-Server-Timing", "")
+        if settings.SERVER_TIMING_TOKEN and token:
+            return hmac.compare_digest(token.encode(), settings.SERVER_TIMING_TOKEN.encode())
+        # 세션이 없는 요청에서는 사용자 조회(DB 쿼리)를 하지 않음
+        user = getattr(request, "user", None)
+        return settings.SESSION_COOKIE_NAME in request.COOKIES and user is not None and user.is_staff
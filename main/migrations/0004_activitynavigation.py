@@ -0,0 +1,69 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0003_socialmediaplatform_link_type_activitypublication_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivityNavigation",
+            fields=[
+                (
+                    "activity",
+                    models.OneToOneField(
+                        db_comment="Reference to the activity",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="navigation",
+                        serialize=False,
+                        to="main.activity",
+                        verbose_name="활동",
+                    ),
+                ),
+                (
+                    "related_ids",
+                    models.JSONField(
+                        blank=True,
+                        db_comment="Ordered ids of related public activities of the same type",
+                        default=list,
+                        verbose_name="관련 활동",
+                    ),
+                ),
+                (
+                    "next",
+                    models.ForeignKey(
+                        blank=True,
+                        db_comment="Chronologically next public activity",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="main.activity",
+                        verbose_name="다음 활동",
+                    ),
+                ),
+                (
+                    "previous",
+                    models.ForeignKey(
+                        blank=True,
+                        db_comment="Chronologically previous public activity",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="main.activity",
+                        verbose_name="이전 활동",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "활동 탐색 정보",
+                "verbose_name_plural": "활동 탐색 정보",
+                "db_table_comment": "Precomputed previous/next and related activities per activity",
+            },
+        ),
+    ]
@@ -0,0 +1,178 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0004_activitynavigation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="activity",
+            name="image_has_variants",
+            field=models.BooleanField(
+                db_comment="Whether resized variants of the activity image have been generated",
+                default=False,
+                editable=False,
+                verbose_name="대표 이미지 변환본 생성 여부",
+            ),
+        ),
+        migrations.AddField(
+            model_name="activity",
+            name="image_height",
+            field=models.PositiveIntegerField(
+                blank=True,
+                db_comment="Height of the activity image in pixels",
+                editable=False,
+                null=True,
+                verbose_name="대표 이미지 높이",
+            ),
+        ),
+        migrations.AddField(
+            model_name="activity",
+            name="image_placeholder",
+            field=models.TextField(
+                blank=True,
+                db_comment="Tiny data URI of the activity image shown while it loads",
+                editable=False,
+                verbose_name="대표 이미지 자리표시자",
+            ),
+        ),
+        migrations.AddField(
+            model_name="activity",
+            name="image_width",
+            field=models.PositiveIntegerField(
+                blank=True,
+                db_comment="Width of the activity image in pixels",
+                editable=False,
+                null=True,
+                verbose_name="대표 이미지 너비",
+            ),
+        ),
+        migrations.AddField(
+            model_name="organizer",
+            name="photo_has_variants",
+            field=models.BooleanField(
+                db_comment="Whether resized variants of the organizer photo have been generated",
+                default=False,
+                editable=False,
+                verbose_name="프로필 사진 변환본 생성 여부",
+            ),
+        ),
+        migrations.AddField(
+            model_name="organizer",
+            name="photo_height",
+            field=models.PositiveIntegerField(
+                blank=True,
+                db_comment="Height of the organizer photo in pixels",
+                editable=False,
+                null=True,
+                verbose_name="프로필 사진 높이",
+            ),
+        ),
+        migrations.AddField(
+            model_name="organizer",
+            name="photo_placeholder",
+            field=models.TextField(
+                blank=True,
+                db_comment="Tiny data URI of the organizer photo shown while it loads",
+                editable=False,
+                verbose_name="프로필 사진 자리표시자",
+            ),
+        ),
+        migrations.AddField(
+            model_name="organizer",
+            name="photo_width",
+            field=models.PositiveIntegerField(
+                blank=True,
+                db_comment="Width of the organizer photo in pixels",
+                editable=False,
+                null=True,
+                verbose_name="프로필 사진 너비",
+            ),
+        ),
+        migrations.AddField(
+            model_name="socialmediaplatform",
+            name="icon_has_variants",
+            field=models.BooleanField(
+                db_comment="Whether resized variants of the platform icon have been generated",
+                default=False,
+                editable=False,
+                verbose_name="아이콘 변환본 생성 여부",
+            ),
+        ),
+        migrations.AddField(
+            model_name="socialmediaplatform",
+            name="icon_height",
+            field=models.PositiveIntegerField(
+                blank=True,
+                db_comment="Height of the platform icon in pixels",
+                editable=False,
+                null=True,
+                verbose_name="아이콘 높이",
+            ),
+        ),
+        migrations.AddField(
+            model_name="socialmediaplatform",
+            name="icon_placeholder",
+            field=models.TextField(
+                blank=True,
+                db_comment="Tiny data URI of the platform icon shown while it loads",
+                editable=False,
+                verbose_name="아이콘 자리표시자",
+            ),
+        ),
+        migrations.AddField(
+            model_name="socialmediaplatform",
+            name="icon_width",
+            field=models.PositiveIntegerField(
+                blank=True,
+                db_comment="Width of the platform icon in pixels",
+                editable=False,
+                null=True,
+                verbose_name="아이콘 너비",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="activity",
+            name="image",
+            field=models.ImageField(
+                blank=True,
+                db_comment="Activity representative image",
+                height_field="image_height",
+                null=True,
+                upload_to="activities/",
+                verbose_name="대표 이미지",
+                width_field="image_width",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="organizer",
+            name="photo",
+            field=models.ImageField(
+                blank=True,
+                db_comment="Organizer profile photo",
+                height_field="photo_height",
+                null=True,
+                upload_to="organizers/",
+                verbose_name="프로필 사진",
+                width_field="photo_width",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="socialmediaplatform",
+            name="icon",
+            field=models.ImageField(
+                blank=True,
+                db_comment="Platform icon or logo",
+                height_field="icon_height",
+                null=True,
+                upload_to="social_media/",
+                verbose_name="아이콘",
+                width_field="icon_width",
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.4 on 2026-10-17 01:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0005_image_dimensions_and_placeholders"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["start_datetime", "id"],
+                name="activity_public_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["activity_type", "start_datetime", "id"],
+                name="activity_public_type_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activity",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["created", "id"],
+                name="activity_public_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contributionopportunity",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["order"],
+                name="opportunity_public_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="faq",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["category", "order"],
+                name="faq_public_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organizer",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["order", "name_ko"],
+                name="organizer_public_order_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="socialmediaplatform",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["order", "name_ko"],
+                name="platform_active_order_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.4 on 2026-10-17 02:09
+
+from django.db import migrations
+
+import main.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0006_public_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="activity",
+            name="image",
+            field=main.models.DimensionsImageField(
+                blank=True,
+                db_comment="Activity representative image",
+                height_field="image_height",
+                null=True,
+                upload_to="activities/",
+                verbose_name="대표 이미지",
+                width_field="image_width",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="organizer",
+            name="photo",
+            field=main.models.DimensionsImageField(
+                blank=True,
+                db_comment="Organizer profile photo",
+                height_field="photo_height",
+                null=True,
+                upload_to="organizers/",
+                verbose_name="프로필 사진",
+                width_field="photo_width",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="socialmediaplatform",
+            name="icon",
+            field=main.models.DimensionsImageField(
+                blank=True,
+                db_comment="Platform icon or logo",
+                height_field="icon_height",
+                null=True,
+                upload_to="social_media/",
+                verbose_name="아이콘",
+                width_field="icon_width",
+            ),
+        ),
+    ]
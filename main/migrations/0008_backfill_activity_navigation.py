@@ -0,0 +1,65 @@
+from django.db import migrations
+
+# main.navigation.RELATED_ACTIVITIES_COUNT (마이그레이션 시점의 값)
+RELATED_ACTIVITIES_COUNT = 3
+
+
+def backfill_navigation(apps, schema_editor):
+    """기존 공개 활동의 탐색 정보를 한 번에 계산 (main.navigation과 같은 규칙)"""
+    Activity = apps.get_model("main", "Activity")
+    ActivityNavigation = apps.get_model("main", "ActivityNavigation")
+    public = Activity.objects.filter(is_public=True)
+
+    timeline = list(
+        public.filter(start_datetime__isnull=False)
+        .order_by("start_datetime", "id")
+        .values_list("id", flat=True)
+    )
+    neighbours = {
+        pk: (
+            timeline[index - 1] if index > 0 else None,
+            timeline[index + 1] if index + 1 < len(timeline) else None,
+        )
+        for index, pk in enumerate(timeline)
+    }
+
+    by_type = {}
+    for pk, activity_type in public.order_by("-start_datetime", "-id").values_list(
+        "id", "activity_type"
+    ):
+        by_type.setdefault(activity_type, []).append(pk)
+
+    rows = []
+    for ids in by_type.values():
+        top = ids[: RELATED_ACTIVITIES_COUNT + 1]
+        for pk in ids:
+            previous, following = neighbours.get(pk, (None, None))
+            rows.append(
+                ActivityNavigation(
+                    activity_id=pk,
+                    previous_id=previous,
+                    next_id=following,
+                    related_ids=[other for other in top if other != pk][
+                        :RELATED_ACTIVITIES_COUNT
+                    ],
+                )
+            )
+
+    ActivityNavigation.objects.bulk_create(
+        rows,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["activity"],
+        update_fields=["previous", "next", "related_ids"],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0007_image_fields_skip_missing_files"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_navigation, migrations.RunPython.noop),
+    ]
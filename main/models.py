@@ -1,11 +1,35 @@
+import logging
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from django_extensions.db.models import TimeStampedModel
 
+logger = logging.getLogger(__name__)
+
+
+class DimensionsImageField(models.ImageField):
+    """
+    크기 컬럼(`width_field`/`height_field`)에 값이 있으면 파일을 열지 않는 이미지 필드
+
+    Django의 ImageField는 크기 컬럼이 비어 있거나 0이면 인스턴스를 만들 때마다 파일을 열어 크기를 읽고,
+    파일이 없으면 `FileNotFoundError`로 페이지 전체가 실패합니다. 이 필드는 저장된 값(파일이 없는 이미지는
+    `backfill_images`가 기록한 0)을 그대로 사용하고, 인스턴스를 만들 때 파일이 없으면 크기를 비워 둡니다.
+    """
+
+    def update_dimension_fields(self, instance: models.Model, force: bool = False, *args: Any, **kwargs: Any) -> None:
+        if force:
+            super().update_dimension_fields(instance, force, *args, **kwargs)
+            return
+        if None not in (instance.__dict__.get(self.width_field), instance.__dict__.get(self.height_field)):
+            return
+        try:
+            super().update_dimension_fields(instance, force, *args, **kwargs)
+        except FileNotFoundError:
+            logger.warning("Image file %s of %r is missing", instance.__dict__.get(self.attname), instance)
+
 
 class ActivityType(models.TextChoices):
     SEMINAR = "seminar", _("세미나")
@@ -106,13 +130,41 @@ class Activity(TimeStampedModel):
     )
 
     # 공통 메타 필드들
-    image = models.ImageField(
+    image = DimensionsImageField(
         upload_to="activities/",
+        width_field="image_width",
+        height_field="image_height",
         blank=True,
         null=True,
         verbose_name=_("대표 이미지"),
         db_comment="Activity representative image",
     )
+    image_width = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("대표 이미지 너비"),
+        db_comment="Width of the activity image in pixels",
+    )
+    image_height = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("대표 이미지 높이"),
+        db_comment="Height of the activity image in pixels",
+    )
+    image_placeholder = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name=_("대표 이미지 자리표시자"),
+        db_comment="Tiny data URI of the activity image shown while it loads",
+    )
+    image_has_variants = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("대표 이미지 변환본 생성 여부"),
+        db_comment="Whether resized variants of the activity image have been generated",
+    )
     is_public = models.BooleanField(
         default=True,
         verbose_name=_("공개 여부"),
@@ -136,6 +188,22 @@ class Activity(TimeStampedModel):
         verbose_name = _("활동")
         verbose_name_plural = _("활동")
         db_table_comment = "PyLadies Seoul activities (events and study groups)"
+        indexes = [
+            # 홈/이벤트 목록/이전·다음 이벤트: 공개 활동을 시작 일시 범위로 조회하고 시작 일시 순으로 정렬
+            models.Index(
+                fields=["start_datetime", "id"], condition=models.Q(is_public=True), name="activity_public_start_idx"
+            ),
+            # 관련 이벤트/유형별 캘린더/API 유형 필터: 유형별 공개 활동을 시작 일시 순으로 정렬
+            models.Index(
+                fields=["activity_type", "start_datetime", "id"],
+                condition=models.Q(is_public=True),
+                name="activity_public_type_idx",
+            ),
+            # RSS/Atom 피드: 최근 등록된 공개 활동
+            models.Index(
+                fields=["created", "id"], condition=models.Q(is_public=True), name="activity_public_created_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.get_activity_type_display()} - {self.title_ko}"
@@ -202,13 +270,41 @@ class Organizer(TimeStampedModel):
         verbose_name=_("소개 (영어)"),
         db_comment="Organizer bio in English",
     )
-    photo = models.ImageField(
+    photo = DimensionsImageField(
         upload_to="organizers/",
+        width_field="photo_width",
+        height_field="photo_height",
         blank=True,
         null=True,
         verbose_name=_("프로필 사진"),
         db_comment="Organizer profile photo",
     )
+    photo_width = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("프로필 사진 너비"),
+        db_comment="Width of the organizer photo in pixels",
+    )
+    photo_height = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("프로필 사진 높이"),
+        db_comment="Height of the organizer photo in pixels",
+    )
+    photo_placeholder = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name=_("프로필 사진 자리표시자"),
+        db_comment="Tiny data URI of the organizer photo shown while it loads",
+    )
+    photo_has_variants = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("프로필 사진 변환본 생성 여부"),
+        db_comment="Whether resized variants of the organizer photo have been generated",
+    )
     email = models.EmailField(
         blank=True,
         verbose_name=_("이메일"),
@@ -241,6 +337,11 @@ class Organizer(TimeStampedModel):
         verbose_name = _("오거나이저")
         verbose_name_plural = _("오거나이저")
         db_table_comment = "PyLadies Seoul organizer information"
+        indexes = [
+            models.Index(
+                fields=["order", "name_ko"], condition=models.Q(is_public=True), name="organizer_public_order_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name_ko} ({self.role_ko})"
@@ -297,6 +398,9 @@ class FAQ(TimeStampedModel):
         verbose_name = _("FAQ")
         verbose_name_plural = _("FAQ")
         db_table_comment = "PyLadies Seoul frequently asked questions"
+        indexes = [
+            models.Index(fields=["category", "order"], condition=models.Q(is_public=True), name="faq_public_order_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.get_category_display()} - {self.question_ko}"
@@ -336,13 +440,41 @@ class SocialMediaPlatform(TimeStampedModel):
         verbose_name=_("링크 유형"),
         db_comment="Type of the link (main channel or publication platform)",
     )
-    icon = models.ImageField(
+    icon = DimensionsImageField(
         upload_to="social_media/",
+        width_field="icon_width",
+        height_field="icon_height",
         blank=True,
         null=True,
         verbose_name=_("아이콘"),
         db_comment="Platform icon or logo",
     )
+    icon_width = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("아이콘 너비"),
+        db_comment="Width of the platform icon in pixels",
+    )
+    icon_height = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_("아이콘 높이"),
+        db_comment="Height of the platform icon in pixels",
+    )
+    icon_placeholder = models.TextField(
+        blank=True,
+        editable=False,
+        verbose_name=_("아이콘 자리표시자"),
+        db_comment="Tiny data URI of the platform icon shown while it loads",
+    )
+    icon_has_variants = models.BooleanField(
+        default=False,
+        editable=False,
+        verbose_name=_("아이콘 변환본 생성 여부"),
+        db_comment="Whether resized variants of the platform icon have been generated",
+    )
     icon_class = models.CharField(
         max_length=50,
         blank=True,
@@ -367,6 +499,11 @@ class SocialMediaPlatform(TimeStampedModel):
         verbose_name = _("소셜 미디어 플랫폼")
         verbose_name_plural = _("소셜 미디어 플랫폼")
         db_table_comment = "PyLadies Seoul social media platforms and external links"
+        indexes = [
+            models.Index(
+                fields=["order", "name_ko"], condition=models.Q(is_active=True), name="platform_active_order_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name_ko
@@ -413,6 +550,56 @@ class ActivityPublication(TimeStampedModel):
         return f"{self.activity.title_ko} on {self.platform.name_ko}"
 
 
+class ActivityNavigation(models.Model):
+    """
+    Precomputed navigation for an activity detail page.
+
+    Holds the chronological previous/next public activities and the related
+    activities of the same type, kept up to date by `main.navigation`.
+    """
+
+    activity = models.OneToOneField(
+        Activity,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="navigation",
+        verbose_name=_("활동"),
+        db_comment="Reference to the activity",
+    )
+    previous = models.ForeignKey(
+        Activity,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="+",
+        verbose_name=_("이전 활동"),
+        db_comment="Chronologically previous public activity",
+    )
+    next = models.ForeignKey(
+        Activity,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="+",
+        verbose_name=_("다음 활동"),
+        db_comment="Chronologically next public activity",
+    )
+    related_ids = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("관련 활동"),
+        db_comment="Ordered ids of related public activities of the same type",
+    )
+
+    class Meta:
+        verbose_name = _("활동 탐색 정보")
+        verbose_name_plural = _("활동 탐색 정보")
+        db_table_comment = "Precomputed previous/next and related activities per activity"
+
+    def __str__(self) -> str:
+        return f"Navigation for {self.activity_id}"
+
+
 class ContributionOpportunity(TimeStampedModel):
     """
     Community contribution opportunities for PyLadies Seoul.
@@ -495,6 +682,9 @@ class ContributionOpportunity(TimeStampedModel):
         verbose_name = _("기여 기회")
         verbose_name_plural = _("기여 기회")
         db_table_comment = "PyLadies Seoul community contribution " "opportunities"
+        indexes = [
+            models.Index(fields=["order"], condition=models.Q(is_public=True), name="opportunity_public_order_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.get_type_display()} - {self.title_ko}"
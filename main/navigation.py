@@ -0,0 +1,138 @@
+"""
+이벤트 상세 페이지 탐색 정보 (이전/다음 이벤트, 관련 이벤트)
+
+상세 페이지를 요청할 때마다 계산하지 않도록 `ActivityNavigation`에 미리 저장해 두고,
+활동이 저장/삭제되거나 공개 여부가 바뀔 때 영향을 받는 행만 갱신합니다.
+
+- 이전/다음: 시작 일시가 있는 공개 활동을 (start_datetime, id) 순으로 나열했을 때의 이웃
+- 관련 이벤트: 같은 유형의 공개 활동 중 최신 순 상위 `RELATED_ACTIVITIES_COUNT`개 (자신 제외)
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db.models import Q
+
+from .models import Activity, ActivityNavigation
+from .query_budget import exempt_from_budget
+
+RELATED_ACTIVITIES_COUNT = 3
+
+Row = Tuple[Optional[int], Optional[int], List[int]]
+
+
+def _neighbours(activity: Activity) -> Tuple[Optional[int], Optional[int]]:
+    """시간순으로 바로 앞/뒤에 있는 공개 활동 id"""
+    if activity.start_datetime is None:
+        return None, None
+
+    timeline = Activity.objects.filter(is_public=True, start_datetime__isnull=False)
+    start, pk = activity.start_datetime, activity.pk
+    previous = (
+        timeline.filter(Q(start_datetime__lt=start) | Q(start_datetime=start, id__lt=pk))
+        .order_by("-start_datetime", "-id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    following = (
+        timeline.filter(Q(start_datetime__gt=start) | Q(start_datetime=start, id__gt=pk))
+        .order_by("start_datetime", "id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    return previous, following
+
+
+def _related_by_type(activity_types: Iterable[str]) -> Dict[int, List[int]]:
+    """유형별 모든 공개 활동의 관련 활동 id 목록"""
+    related: Dict[int, List[int]] = {}
+    for activity_type in set(activity_types):
+        ids = list(
+            Activity.objects.filter(activity_type=activity_type, is_public=True)
+            .order_by("-start_datetime", "-id")
+            .values_list("id", flat=True)
+        )
+        # 자신을 제외한 상위 N개는 항상 상위 N+1개 안에 있음
+        top = ids[: RELATED_ACTIVITIES_COUNT + 1]
+        for pk in ids:
+            related[pk] = [other for other in top if other != pk][:RELATED_ACTIVITIES_COUNT]
+    return related
+
+
+def refresh_navigation(activity_ids: Iterable[int], activity_types: Iterable[str] = ()) -> Set[int]:
+    """
+    활동 변경 후 영향을 받는 탐색 정보를 다시 계산합니다.
+
+    Args:
+        activity_ids: 변경된 활동과 변경 전 이전/다음 활동의 id (삭제되었거나 비공개인 활동은 무시)
+        activity_types: 관련 이벤트 목록을 다시 계산할 활동 유형 (변경 전 유형 포함)
+
+    Returns:
+        탐색 정보가 실제로 바뀐 활동 id 목록 (해당 상세 페이지 캐시 무효화용)
+    """
+    requested = set(activity_ids)
+    activities = {
+        activity.pk: activity
+        for activity in Activity.objects.filter(pk__in=requested, is_public=True).only(
+            "id", "activity_type", "start_datetime"
+        )
+    }
+    neighbours = {pk: _neighbours(activity) for pk, activity in activities.items()}
+
+    # 변경된 활동의 새 이웃도 앞/뒤 링크가 바뀜
+    new_ids = {pk for pair in neighbours.values() for pk in pair if pk is not None} - activities.keys()
+    for activity in Activity.objects.filter(pk__in=new_ids).only("id", "activity_type", "start_datetime"):
+        activities[activity.pk] = activity
+        neighbours[activity.pk] = _neighbours(activity)
+
+    related = _related_by_type({*activity_types, *(activity.activity_type for activity in activities.values())})
+    existing: Dict[int, Row] = {
+        row.activity_id: (row.previous_id, row.next_id, row.related_ids)
+        for row in ActivityNavigation.objects.filter(activity_id__in=neighbours.keys() | related.keys())
+    }
+
+    rows: Dict[int, Row] = {}
+    for pk, related_ids in related.items():
+        if pk in neighbours:
+            previous, following = neighbours[pk]
+        elif pk in existing:
+            previous, following = existing[pk][:2]
+        else:
+            continue  # 아직 탐색 정보가 없는 활동은 상세 페이지에서 처음 필요할 때 계산
+        row = (previous, following, related_ids)
+        if existing.get(pk) != row:
+            rows[pk] = row
+
+    if rows:
+        ActivityNavigation.objects.bulk_create(
+            [
+                ActivityNavigation(activity_id=pk, previous_id=previous, next_id=following, related_ids=related_ids)
+                for pk, (previous, following, related_ids) in rows.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["activity"],
+            update_fields=["previous", "next", "related_ids"],
+        )
+    return set(rows)
+
+
+def get_navigation(activity: Activity) -> ActivityNavigation:
+    """
+    활동의 탐색 정보 조회 (없으면 계산하여 저장)
+
+    기존 활동은 마이그레이션(0008)에서, 새 활동은 저장 시그널에서 미리 계산하므로, 여기서 계산하는 것은
+    시그널을 거치지 않고 추가된 활동(bulk_create, update 등)뿐입니다. 한 번 저장하면 다시 계산하지 않으므로
+    쿼리 예산(`main.query_budget`)에서 제외합니다.
+    """
+    try:
+        return activity.navigation
+    except ActivityNavigation.DoesNotExist:
+        with exempt_from_budget():
+            refresh_navigation([activity.pk])
+            return ActivityNavigation.objects.select_related("previous", "next").get(activity=activity)
+
+
+def get_related_activities(navigation: ActivityNavigation) -> List[Activity]:
+    """저장된 순서대로 관련 활동 조회 (기본 키 조회 한 번)"""
+    # 순서는 related_ids로 정하므로 기본 정렬(임시 B-트리 정렬)은 제거
+    activities = Activity.objects.filter(is_public=True).order_by().in_bulk(navigation.related_ids)
+    return [activities[pk] for pk in navigation.related_ids if pk in activities]
@@ -0,0 +1,132 @@
+"""
+키셋(커서) 페이지네이션
+
+OFFSET 대신 "마지막으로 본 행의 정렬 키 다음부터" 조회하므로, 몇 번째 페이지든
+조회 비용이 동일합니다. 정렬 키의 마지막 필드는 유일해야 합니다 (보통 `id`).
+NULL 값은 정렬 방향과 무관하게 항상 마지막에 위치합니다 (예: 시작 일시가 없는 스터디그룹).
+"""
+
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q, QuerySet
+
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 커서"""
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    """마이크로초까지 보존하는 JSON 인코더 (DjangoJSONEncoder는 밀리초로 자름)"""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPage(NamedTuple):
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def _parse_ordering(queryset: QuerySet, ordering: Sequence[str]) -> List[Tuple[str, bool, bool]]:
+    """정렬 지정을 (필드명, 내림차순 여부, NULL 허용 여부) 목록으로 변환"""
+    parsed = []
+    for spec in ordering:
+        name = spec.lstrip("-")
+        field = queryset.model._meta.get_field(name)
+        parsed.append((name, spec.startswith("-"), field.null))
+    return parsed
+
+
+def _row_value(item: Any, name: str) -> Any:
+    """모델 인스턴스와 `.values()` 딕셔너리 모두에서 값 조회"""
+    return item[name] if isinstance(item, dict) else getattr(item, name)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값을 URL에 안전한 커서 문자열로 인코딩"""
+    payload = json.dumps(list(values), cls=_CursorEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, queryset: QuerySet, ordering: Sequence[str]) -> List[Any]:
+    """커서 문자열을 정렬 키 값으로 디코딩"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursor(cursor) from e
+
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor(cursor)
+
+    try:
+        return [
+            None if value is None else queryset.model._meta.get_field(name).to_python(value)
+            for (name, _descending, _nullable), value in zip(_parse_ordering(queryset, ordering), values)
+        ]
+    except (ValidationError, TypeError) as e:
+        raise InvalidCursor(cursor) from e
+
+
+def _after_cursor(fields: List[Tuple[str, bool, bool]], values: Sequence[Any]) -> Q:
+    """커서 행 다음에 오는 행들의 조건 (행 값 비교를 필드별 조건으로 전개)"""
+    condition = Q(pk__in=[])
+    same_prefix = Q()
+
+    for (name, descending, nullable), value in zip(fields, values):
+        if value is None:
+            # NULL은 항상 마지막이므로 같은 NULL끼리는 다음 필드로 비교
+            same_prefix &= Q(**{f"{name}__isnull": True})
+            continue
+
+        after = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        if nullable:
+            after |= Q(**{f"{name}__isnull": True})
+        condition |= same_prefix & after
+        same_prefix &= Q(**{name: value})
+
+    return condition
+
+
+def paginate(queryset: QuerySet, ordering: Sequence[str], cursor: Optional[str], page_size: int) -> KeysetPage:
+    """
+    키셋 방식으로 한 페이지를 조회합니다.
+
+    Args:
+        queryset: 필터가 적용된 쿼리셋 (모델 인스턴스 또는 `.values()`)
+        ordering: 정렬 필드 목록 (예: ("-start_datetime", "-id")), 마지막 필드는 유일해야 함
+        cursor: 이전 페이지에서 받은 커서 (첫 페이지는 None)
+        page_size: 페이지 크기
+
+    Returns:
+        현재 페이지 항목과 다음 페이지 커서 (마지막 페이지면 None)
+
+    Raises:
+        InvalidCursor: 커서를 해석할 수 없을 때
+    """
+    fields = _parse_ordering(queryset, ordering)
+    queryset = queryset.order_by(
+        *[
+            getattr(F(name), "desc" if descending else "asc")(nulls_last=True if nullable else None)
+            for name, descending, nullable in fields
+        ]
+    )
+
+    if cursor:
+        queryset = queryset.filter(_after_cursor(fields, decode_cursor(cursor, queryset, ordering)))
+
+    items = list(queryset[: page_size + 1])
+    if len(items) <= page_size:
+        return KeysetPage(items, None)
+
+    items = items[:page_size]
+    last = items[-1]
+    return KeysetPage(items, encode_cursor([_row_value(last, name) for name, _descending, _nullable in fields]))
@@ -0,0 +1,69 @@
+"""
+뷰별 SQL 쿼리 수 제한
+
+사용법:
+    @query_budget(2)
+    @conditional_page()
+    @cache_public_page(LAYOUT)
+    def faq(request): ...
+
+뷰가 한 요청에서 실행할 수 있는 쿼리 수를 선언하면, 개발/테스트 환경에서 `QueryBudgetMiddleware`가
+요청마다 실행된 쿼리를 세어 초과 시 `QueryBudgetExceeded`를 발생시킵니다 (N+1 쿼리 조기 발견).
+레이아웃 컨텍스트 등을 포함한 요청 전체의 쿼리 수이며, 세션이 없는 익명 요청(공개 페이지의 일반 방문자) 기준입니다.
+데코레이터는 다른 데코레이터보다 바깥(맨 위)에 두어야 URLconf가 받는 뷰에 값이 남습니다.
+한 번 계산해 저장하면 이후 요청에는 필요 없는 작업(예: 탐색 정보가 없는 활동)은 `exempt_from_budget()`
+블록 안에서 실행하여 예산에서 제외합니다.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple, TypeVar
+
+ViewFunc = TypeVar("ViewFunc", bound=Callable[..., Any])
+
+# (SQL, 파라미터)
+Query = Tuple[str, Any]
+
+# exempt_from_budget() 블록 안인지
+_exempt: ContextVar[bool] = ContextVar("query_budget_exempt", default=False)
+
+
+class QueryBudgetExceeded(Exception):
+    """뷰가 선언한 쿼리 수를 초과"""
+
+
+def query_budget(max_queries: int) -> Callable[[ViewFunc], ViewFunc]:
+    """뷰가 한 요청에서 실행할 수 있는 최대 쿼리 수 지정"""
+
+    def decorator(view_func: ViewFunc) -> ViewFunc:
+        view_func.query_budget = max_queries  # type: ignore[attr-defined]
+        return view_func
+
+    return decorator
+
+
+def get_query_budget(view_func: Callable[..., Any]) -> Optional[int]:
+    """뷰에 지정된 최대 쿼리 수 (없으면 None)"""
+    return getattr(view_func, "query_budget", None)
+
+
+@contextmanager
+def exempt_from_budget() -> Iterator[None]:
+    """블록 안에서 실행한 쿼리는 예산에 포함하지 않음 (저장해 두면 다시 필요 없는 일회성 계산용)"""
+    token = _exempt.set(True)
+    try:
+        yield
+    finally:
+        _exempt.reset(token)
+
+
+def is_exempt() -> bool:
+    """`exempt_from_budget()` 블록 안인지"""
+    return _exempt.get()
+
+
+def budget_report(view_name: str, budget: int, queries: Sequence[Query]) -> str:
+    """예산 초과 메시지 (실행된 SQL 목록 포함)"""
+    lines = [f"{view_name} ran {len(queries)} queries (budget {budget}):"]
+    lines.extend(f"  {number}. {sql} {params!r}" for number, (sql, params) in enumerate(queries, 1))
+    return "\n".join(lines)
@@ -0,0 +1,147 @@
+"""
+모델 변경 시그널 핸들러
+
+콘텐츠가 저장/삭제되면 관련 캐시 네임스페이스의 버전을 갱신하여,
+해당 콘텐츠를 보여주는 페이지 캐시만 정확히 무효화합니다. 버전은 트랜잭션이 커밋된 뒤에 갱신합니다
+(커밋 전에 갱신하면 그 사이에 들어온 요청이 이전 내용을 새 버전으로 캐시함).
+활동이 바뀌면 미리 계산된 상세 페이지 탐색 정보(`main.navigation`)도 함께 갱신합니다.
+이미지가 업로드되면 흐린 자리표시자를 저장하고, 커밋 후 반응형 변환본(`main.images`) 생성을 예약합니다.
+"""
+
+from functools import partial
+from typing import Any, Dict, Type
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from .caching import (
+    ACTIVITIES,
+    FAQS,
+    LAYOUT,
+    OPPORTUNITIES,
+    ORGANIZERS,
+    activity_namespace,
+    activity_type_namespace,
+    bump_versions,
+)
+from .images import IMAGE_FIELDS, placeholder_data_uri
+from .models import FAQ, Activity, ActivityPublication, ContributionOpportunity, Organizer, SocialMediaPlatform
+from .navigation import refresh_navigation
+from .tasks import schedule_image_variants
+
+
+def bump_versions_on_commit(*namespaces: str) -> None:
+    """트랜잭션 커밋 후 네임스페이스 버전 갱신 (트랜잭션 밖이면 바로 갱신)"""
+    if namespaces:
+        transaction.on_commit(partial(bump_versions, *namespaces))
+
+
+@receiver([pre_save, pre_delete], sender=Activity)
+def remember_previous_state(sender: Any, instance: Activity, **kwargs: Any) -> None:
+    """변경 전 활동 유형과 이전/다음 활동을 기록 (관련 목록과 탐색 정보 갱신용)"""
+    instance._previous_state = None  # type: ignore[attr-defined]
+    if instance.pk is None or kwargs.get("raw"):
+        return
+    instance._previous_state = (  # type: ignore[attr-defined]
+        Activity.objects.filter(pk=instance.pk)
+        .values_list("activity_type", "navigation__previous_id", "navigation__next_id")
+        .first()
+    )
+
+
+@receiver([post_save, post_delete], sender=Activity)
+def invalidate_activity(sender: Any, instance: Activity, **kwargs: Any) -> None:
+    """활동 변경 시 목록, 상세, 같은 유형의 관련 이벤트 캐시 무효화"""
+    namespaces = {
+        ACTIVITIES,
+        activity_namespace(instance.pk),
+        activity_type_namespace(instance.activity_type),
+    }
+    previous_state = getattr(instance, "_previous_state", None)
+    if previous_state:
+        namespaces.add(activity_type_namespace(previous_state[0]))
+    bump_versions_on_commit(*namespaces)
+
+
+@receiver([post_save, post_delete], sender=Activity)
+def update_activity_navigation(sender: Any, instance: Activity, **kwargs: Any) -> None:
+    """활동 변경 시 영향을 받는 이전/다음, 관련 이벤트 탐색 정보만 갱신"""
+    if kwargs.get("raw"):
+        return
+
+    activity_ids = {instance.pk}
+    activity_types = {instance.activity_type}
+    previous_state = getattr(instance, "_previous_state", None)
+    if previous_state:
+        previous_type, *previous_neighbours = previous_state
+        activity_types.add(previous_type)
+        activity_ids.update(pk for pk in previous_neighbours if pk is not None)
+
+    changed = refresh_navigation(activity_ids, activity_types)
+    bump_versions_on_commit(*(activity_namespace(pk) for pk in changed))
+
+
+@receiver([post_save, post_delete], sender=ActivityPublication)
+def invalidate_activity_publication(sender: Any, instance: ActivityPublication, **kwargs: Any) -> None:
+    """활동 게시물 변경 시 해당 활동 상세 캐시 무효화"""
+    bump_versions_on_commit(activity_namespace(instance.activity_id))
+
+
+@receiver([post_save, post_delete], sender=Organizer)
+def invalidate_organizers(sender: Any, **kwargs: Any) -> None:
+    """오거나이저 변경 시 캐시 무효화"""
+    bump_versions_on_commit(ORGANIZERS)
+
+
+@receiver([post_save, post_delete], sender=FAQ)
+def invalidate_faqs(sender: Any, **kwargs: Any) -> None:
+    """FAQ 변경 시 캐시 무효화"""
+    bump_versions_on_commit(FAQS)
+
+
+@receiver([post_save, post_delete], sender=ContributionOpportunity)
+def invalidate_opportunities(sender: Any, **kwargs: Any) -> None:
+    """기여 기회 변경 시 캐시 무효화"""
+    bump_versions_on_commit(OPPORTUNITIES)
+
+
+@receiver([post_save, post_delete], sender=SocialMediaPlatform)
+def invalidate_layout(sender: Any, **kwargs: Any) -> None:
+    """소셜 미디어 플랫폼 변경 시 레이아웃 캐시 무효화"""
+    bump_versions_on_commit(LAYOUT)
+
+
+def _image_field_changed(sender: Type[Model], kwargs: Dict[str, Any]) -> bool:
+    update_fields = kwargs.get("update_fields")
+    return update_fields is None or IMAGE_FIELDS[sender] in update_fields
+
+
+@receiver(pre_save, sender=Activity)
+@receiver(pre_save, sender=Organizer)
+@receiver(pre_save, sender=SocialMediaPlatform)
+def update_image_placeholder(sender: Type[Model], instance: Model, **kwargs: Any) -> None:
+    """새로 업로드된 이미지의 자리표시자 저장 (크기는 ImageField의 width_field/height_field가 저장)"""
+    if not _image_field_changed(sender, kwargs):
+        return
+    field_name = IMAGE_FIELDS[sender]
+    image = getattr(instance, field_name)
+    if not image:
+        setattr(instance, f"{field_name}_placeholder", "")
+        setattr(instance, f"{field_name}_has_variants", False)
+    elif not image._committed:
+        setattr(instance, f"{field_name}_placeholder", placeholder_data_uri(image))
+        setattr(instance, f"{field_name}_has_variants", False)
+
+
+@receiver(post_save, sender=Activity)
+@receiver(post_save, sender=Organizer)
+@receiver(post_save, sender=SocialMediaPlatform)
+def schedule_image_variants_on_save(sender: Type[Model], instance: Model, **kwargs: Any) -> None:
+    """변환본이 없는 이미지가 있으면 커밋 후 변환본 생성 예약"""
+    if not _image_field_changed(sender, kwargs):
+        return
+    field_name = IMAGE_FIELDS[sender]
+    if getattr(instance, field_name) and not getattr(instance, f"{field_name}_has_variants"):
+        transaction.on_commit(partial(schedule_image_variants, instance, field_name))
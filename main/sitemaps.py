@@ -0,0 +1,117 @@
+"""
+공개 페이지 사이트맵 (언어별 URL과 hreflang 대체 링크 포함)
+
+`/sitemap.xml`은 섹션별 사이트맵을 가리키는 인덱스이며, 섹션이 `limit`(기본값 50,000)보다 커지면
+`?p=2`처럼 여러 파일로 나뉩니다. `i18n` 사이트맵은 (항목, 언어) 쌍 단위로 나누므로 한 파일의 `<url>`은
+언어 수와 관계없이 `limit`개 이하입니다. 각 섹션은 의존하는 네임스페이스 버전으로 전체 페이지 캐시에
+저장되므로, 예를 들어 FAQ가 바뀌어도 이벤트 사이트맵은 다시 생성되지 않습니다.
+"""
+
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.contrib.sitemaps import Sitemap
+from django.contrib.sitemaps import views as sitemap_views
+from django.db.models import Max, QuerySet
+from django.http import Http404, HttpRequest, HttpResponse
+from django.urls import reverse
+
+from .caching import ACTIVITIES, CONTENT, cache_public_page, conditional_page
+from .models import FAQ, Activity, ContributionOpportunity, Organizer
+
+
+def _latest_modified(*querysets: QuerySet) -> Optional[datetime]:
+    values = [queryset.aggregate(modified=Max("modified"))["modified"] for queryset in querysets]
+    return max((value for value in values if value), default=None)
+
+
+class LocalizedSitemap(Sitemap):
+    """모든 언어의 URL과 hreflang 대체 링크(x-default 포함)를 생성하는 사이트맵"""
+
+    i18n = True
+    alternates = True
+    x_default = True
+    namespaces: Tuple[str, ...] = (CONTENT,)
+
+
+class PageSitemap(LocalizedSitemap):
+    """목록/안내 페이지 (내용을 구성하는 모델의 마지막 수정 시각을 lastmod로 사용)"""
+
+    changefreq = "daily"
+
+    def items(self) -> List[Tuple[str, Optional[datetime]]]:
+        public_activities = Activity.objects.filter(is_public=True)
+        return [
+            ("home", _latest_modified(public_activities, Organizer.objects.filter(is_public=True))),
+            ("events_list", _latest_modified(public_activities)),
+            ("contribute", _latest_modified(ContributionOpportunity.objects.filter(is_public=True))),
+            ("faq", _latest_modified(FAQ.objects.filter(is_public=True))),
+            ("coc", None),
+        ]
+
+    def location(self, item: Tuple[str, Optional[datetime]]) -> str:
+        return reverse(item[0])
+
+    def lastmod(self, item: Tuple[str, Optional[datetime]]) -> Optional[datetime]:
+        return item[1]
+
+    def get_latest_lastmod(self) -> Optional[datetime]:
+        return max((modified for _name, modified in self.items() if modified), default=None)
+
+
+class ActivitySitemap(LocalizedSitemap):
+    """공개 이벤트 상세 페이지"""
+
+    changefreq = "weekly"
+    namespaces = (ACTIVITIES,)
+
+    def items(self) -> QuerySet[Activity]:
+        return Activity.objects.filter(is_public=True).only("id", "modified").order_by("id")
+
+    def location(self, item: Activity) -> str:
+        return reverse("event_detail", args=[item.id])
+
+    def lastmod(self, item: Activity) -> datetime:
+        return item.modified
+
+    def get_latest_lastmod(self) -> Optional[datetime]:
+        return _latest_modified(self.items())
+
+
+SITEMAPS: Dict[str, LocalizedSitemap] = {
+    "pages": PageSitemap(),
+    "events": ActivitySitemap(),
+}
+
+
+def _rendered(response: HttpResponse) -> HttpResponse:
+    """페이지 캐시에 저장할 수 있도록 TemplateResponse를 바로 렌더링"""
+    return response.render() if hasattr(response, "render") else response
+
+
+@conditional_page(CONTENT)
+@cache_public_page(CONTENT)
+def index(request: HttpRequest) -> HttpResponse:
+    """섹션별 사이트맵 인덱스"""
+    return _rendered(sitemap_views.index(request, SITEMAPS, sitemap_url_name="sitemap_section"))
+
+
+def _section_view(name: str) -> Callable[..., HttpResponse]:
+    namespaces = SITEMAPS[name].namespaces
+
+    @conditional_page(*namespaces)
+    @cache_public_page(*namespaces)
+    def view(request: HttpRequest) -> HttpResponse:
+        return _rendered(sitemap_views.sitemap(request, SITEMAPS, section=name))
+
+    return view
+
+
+SECTION_VIEWS = {name: _section_view(name) for name in SITEMAPS}
+
+
+def section(request: HttpRequest, section: str) -> HttpResponse:
+    """섹션 사이트맵 (`?p=`로 페이지 지정)"""
+    if section not in SECTION_VIEWS:
+        raise Http404(f"No sitemap available for section: {section!r}")
+    return SECTION_VIEWS[section](request)
@@ -0,0 +1,228 @@
+"""
+정적 사이트 내보내기
+
+익명 방문자가 보는 공개 페이지를 언어별 정적 HTML 파일로 렌더링하여,
+nginx가 gunicorn을 거치지 않고 디스크에서 바로 제공할 수 있게 합니다.
+
+페이지마다 그 페이지가 보여 주는 행들의 `modified`와 개수로 지문(fingerprint)을 계산하고
+`.manifest.json`에 기록해 두었다가, 다음 실행 때는 지문이 바뀐 페이지만 다시 렌더링합니다.
+더 이상 공개되지 않는 페이지의 파일은 삭제합니다. 파일은 임시 파일에 쓴 뒤 교체하므로,
+렌더링 중에도 nginx는 항상 온전한 이전 버전을 제공합니다.
+
+쿼리스트링이 있는 요청(다음 페이지 커서)과 HTMX 요청은 내보내지 않으며 nginx가 Django로 전달합니다.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, Max, QuerySet
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone, translation
+from django.utils.translation import get_language_from_path
+
+from .models import FAQ, Activity, ActivityNavigation, ContributionOpportunity, Organizer, SocialMediaPlatform
+from .navigation import refresh_navigation
+
+MANIFEST_NAME = ".manifest.json"
+LOCK_NAME = ".lock"
+HOME_EVENTS_COUNT = 6
+
+
+class ExportError(Exception):
+    """페이지를 정적 파일로 내보낼 수 없음"""
+
+
+class ExportPage(NamedTuple):
+    path: str
+    fingerprint: str
+
+
+class ExportResult(NamedTuple):
+    rendered: List[str]
+    removed: List[str]
+    unchanged: int
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def _aggregate(queryset: QuerySet) -> tuple:
+    """행 개수와 마지막 수정 시각 (삭제도 감지하도록 개수 포함)"""
+    result = queryset.aggregate(count=Count("pk"), modified=Max("modified"))
+    return result["count"], result["modified"]
+
+
+def _code_fingerprint() -> str:
+    """템플릿과 번역 파일 내용 (배포로 바뀌는 부분)"""
+    from .views import RENDERED_CODE_OF_CONDUCT
+
+    digest = hashlib.md5(repr(sorted(RENDERED_CODE_OF_CONDUCT.items())).encode(), usedforsecurity=False)
+    directories = [*settings.TEMPLATES[0]["DIRS"], *settings.LOCALE_PATHS]
+    for directory in directories:
+        for file in sorted(Path(directory).rglob("*")):
+            if file.is_file() and file.suffix in (".html", ".mo"):
+                digest.update(str(file.relative_to(directory)).encode())
+                digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def collect_pages() -> List[ExportPage]:
+    """내보낼 모든 공개 페이지와 지문 (언어별)"""
+    now = timezone.now()
+    common = (
+        _code_fingerprint(),
+        _aggregate(SocialMediaPlatform.objects.filter(is_active=True)),
+    )
+
+    activities = {
+        row["id"]: row
+        for row in Activity.objects.filter(is_public=True).values("id", "modified", "activity_type", "start_datetime")
+    }
+    rows = ActivityNavigation.objects.filter(activity_id__in=activities.keys())
+    if rows.count() < len(activities):
+        # 상세 페이지를 한 번도 조회하지 않은 활동의 탐색 정보를 미리 계산
+        refresh_navigation(activities.keys() - set(rows.values_list("activity_id", flat=True)))
+    navigation = {row.activity_id: (row.previous_id, row.next_id, row.related_ids) for row in rows.all()}
+
+    def modified(*ids: Optional[int]) -> tuple:
+        return tuple((pk, activities[pk]["modified"]) for pk in ids if pk in activities)
+
+    # 홈페이지는 다가오는/지난 이벤트 6개씩만 보여 주므로, 시간이 지나 목록이 바뀌어도 지문이 바뀜
+    scheduled = sorted((row for row in activities.values() if row["start_datetime"]), key=lambda r: r["start_datetime"])
+    upcoming = [row["id"] for row in scheduled if row["start_datetime"] >= now][:HOME_EVENTS_COUNT]
+    past = [row["id"] for row in reversed(scheduled) if row["start_datetime"] < now][:HOME_EVENTS_COUNT]
+
+    fingerprints: Dict[str, str] = {
+        "home": _digest(
+            common, modified(*upcoming), modified(*past), _aggregate(Organizer.objects.filter(is_public=True))
+        ),
+        "events_list": _digest(common, sorted(modified(*activities))),
+        "contribute": _digest(common, _aggregate(ContributionOpportunity.objects.filter(is_public=True))),
+        "faq": _digest(common, _aggregate(FAQ.objects.filter(is_public=True))),
+        "coc": _digest(common),
+    }
+
+    pages = []
+    for language, _name in settings.LANGUAGES:
+        with translation.override(language):
+            pages.extend(ExportPage(reverse(name), fingerprint) for name, fingerprint in fingerprints.items())
+            for pk, row in activities.items():
+                previous, following, related_ids = navigation.get(pk, (None, None, []))
+                fingerprint = _digest(
+                    common, row["modified"], previous, following, modified(previous, following, *related_ids)
+                )
+                pages.append(ExportPage(reverse("event_detail", args=[pk]), fingerprint))
+    return pages
+
+
+def output_file(root: Path, path: str) -> Path:
+    """URL 경로에 해당하는 파일 경로 (nginx: try_files ${uri}index.html)"""
+    return root / path.strip("/") / "index.html"
+
+
+def render_page(path: str) -> bytes:
+    """익명 사용자의 GET 요청으로 페이지를 렌더링"""
+    request = RequestFactory().get(path)
+    language = get_language_from_path(path) or settings.LANGUAGE_CODE
+    with translation.override(language):
+        request.LANGUAGE_CODE = language  # type: ignore[attr-defined]
+        match = resolve(path)
+        response = match.func(request, *match.args, **match.kwargs)
+
+    if response.status_code != 200:
+        raise ExportError(f"{path}: HTTP {response.status_code}")
+    return response.content
+
+
+def _write_atomic(file: Path, content: bytes) -> None:
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽은 항상 완전한 파일만 보게 됨)"""
+    file.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=file.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp:
+            temp.write(content)
+        os.chmod(temp_name, 0o644)
+        os.replace(temp_name, file)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def export_page(root: Path, path: str) -> str:
+    """페이지 하나를 렌더링하여 파일로 저장"""
+    _write_atomic(output_file(root, path), render_page(path))
+    return path
+
+
+def _export_pages(root: Path, paths: List[str], jobs: int) -> None:
+    if jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            export_page(root, path)
+        return
+
+    # 자식 프로세스가 부모의 DB 연결을 공유하지 않도록 닫은 뒤 분기
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for _path in executor.map(export_page, [root] * len(paths), paths):
+            pass
+
+
+@contextmanager
+def _export_lock(root: Path) -> Iterator[None]:
+    """동시에 여러 내보내기가 실행되지 않도록 잠금"""
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / LOCK_NAME, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def export_site(root: Optional[Path] = None, jobs: Optional[int] = None, force: bool = False) -> ExportResult:
+    """
+    공개 페이지를 정적 파일로 내보냅니다.
+
+    Args:
+        root: 출력 디렉터리 (기본값: settings.STATIC_EXPORT_ROOT)
+        jobs: 렌더링 프로세스 수 (기본값: CPU 수)
+        force: 지문과 관계없이 모든 페이지를 다시 렌더링
+
+    Returns:
+        렌더링한 경로, 삭제한 경로, 변경 없는 페이지 수
+    """
+    root = Path(root or settings.STATIC_EXPORT_ROOT)
+    jobs = jobs or os.cpu_count() or 1
+
+    with _export_lock(root):
+        manifest_file = root / MANIFEST_NAME
+        previous: Dict[str, str] = json.loads(manifest_file.read_text()) if manifest_file.exists() else {}
+        pages = collect_pages()
+
+        stale = [
+            page.path
+            for page in pages
+            if force or previous.get(page.path) != page.fingerprint or not output_file(root, page.path).exists()
+        ]
+        _export_pages(root, stale, jobs)
+
+        current = {page.path for page in pages}
+        removed = sorted(previous.keys() - current)
+        for path in removed:
+            output_file(root, path).unlink(missing_ok=True)
+
+        manifest = {page.path: page.fingerprint for page in pages}
+        _write_atomic(manifest_file, json.dumps(manifest, indent=2, sort_keys=True).encode())
+
+    return ExportResult(stale, removed, len(pages) - len(stale))
@@ -0,0 +1,56 @@
+"""
+정적 파일 스토리지
+
+`collectstatic` 때 파일명에 내용 해시를 붙이고(ManifestStaticFilesStorage), 압축 효과가 있는 파일은
+`.gz` 사전 압축본을 옆에 저장합니다.
+해시가 붙은 파일은 내용이 바뀌면 이름도 바뀌므로 nginx(`gzip_static`)나 `StaticFilesMiddleware`가
+1년간 캐시(immutable)하도록 응답하고, 요청마다 다시 압축하지 않습니다.
+"""
+
+import gzip
+import os
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".mjs", ".map", ".svg", ".json", ".txt", ".xml", ".html", ".ico", ".woff"}
+MIN_COMPRESS_SIZE = 256
+# 압축본이 원본의 이 비율보다 크면 저장하지 않음
+MAX_COMPRESS_RATIO = 0.9
+
+
+def compress(content: bytes) -> Optional[bytes]:
+    """gzip 압축본 (압축 효과가 없으면 None)"""
+    data = gzip.compress(content, compresslevel=9, mtime=0)
+    return data if len(data) <= len(content) * MAX_COMPRESS_RATIO else None
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """내용 해시 파일명과 .gz 사전 압축본을 만드는 정적 파일 스토리지"""
+
+    def post_process(
+        self, paths: Dict[str, Any], dry_run: bool = False, **options: Any
+    ) -> Iterator[Tuple[str, Optional[str], Union[bool, Exception]]]:
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        # CSS는 참조하는 파일의 해시가 바뀌면 여러 번 처리되므로 최종 이름만 압축
+        for hashed_name in sorted(set(self.hashed_files.values())):
+            self.compress_file(hashed_name)
+
+    def compress_file(self, name: str) -> None:
+        """압축 대상 파일의 압축본 저장"""
+        if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+            return
+        with self.open(name) as file:
+            content = file.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return
+
+        data = compress(content)
+        if data is None:
+            return
+        if self.exists(name + ".gz"):
+            self.delete(name + ".gz")
+        self._save(name + ".gz", ContentFile(data))
@@ -0,0 +1,81 @@
+"""
+백그라운드 작업
+
+관리자 페이지에서 콘텐츠가 저장되면 트랜잭션 커밋 후 백그라운드 스레드에서 정적 페이지를
+증분 내보내기(`main.static_export`)로 다시 렌더링합니다. 지문이 바뀐 페이지(상세, 목록,
+홈페이지, 관련 이벤트 페이지 등)만 렌더링되며, 새 파일이 준비될 때까지는 이전 파일이 그대로
+제공되므로 방문자가 렌더링을 기다리는 일이 없습니다.
+
+여러 번 연달아 저장해도 아직 시작하지 않은 실행이 있으면 그 실행 하나로 합쳐집니다.
+
+이미지가 업로드되면 같은 스레드에서 반응형 변환본(`main.images`)도 생성합니다. 작업은 예약된 순서대로
+실행되므로, 같은 저장으로 예약된 정적 페이지 내보내기는 변환본이 준비된 뒤에 실행됩니다.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Type
+
+from django.db import connection
+from django.db.models import Model
+
+from .images import generate_variants
+from .static_export import export_site
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="static-export")
+_lock = threading.Lock()
+_queued: Optional[Future] = None
+
+
+def _run_static_export() -> None:
+    global _queued
+    with _lock:
+        # 이제부터 저장되는 변경은 다음 실행에서 반영
+        _queued = None
+
+    try:
+        result = export_site(jobs=1)
+        logger.info(
+            "Static export: %d rendered, %d removed, %d unchanged",
+            len(result.rendered),
+            len(result.removed),
+            result.unchanged,
+        )
+    except Exception:
+        logger.exception("Static export failed")
+    finally:
+        connection.close()
+
+
+def schedule_static_export() -> Future:
+    """정적 페이지 증분 내보내기를 백그라운드에서 실행 (대기 중인 실행이 있으면 합침)"""
+    global _queued
+    with _lock:
+        if _queued is None:
+            _queued = _executor.submit(_run_static_export)
+        return _queued
+
+
+def _run_image_variants(model: Type[Model], pk: int, field_name: str, name: str) -> None:
+    try:
+        instance = model._default_manager.filter(pk=pk).first()
+        if instance is None or getattr(instance, field_name).name != name:
+            # 그 사이 삭제되었거나 다른 이미지로 바뀜
+            return
+        generate_variants(name)
+        # 수정 시각과 캐시 버전도 갱신하여 원본 대신 변환본을 쓰는 HTML로 다시 렌더링되게 함
+        setattr(instance, f"{field_name}_has_variants", True)
+        instance.save(update_fields=[f"{field_name}_has_variants", "modified"])
+    except Exception:
+        logger.exception("Image variant generation failed: %s", name)
+    finally:
+        connection.close()
+
+
+def schedule_image_variants(instance: Model, field_name: str) -> Future:
+    """이미지 필드의 반응형 변환본을 백그라운드에서 생성"""
+    name = getattr(instance, field_name).name
+    return _executor.submit(_run_image_variants, type(instance), instance.pk, field_name, name)
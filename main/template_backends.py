@@ -0,0 +1,47 @@
+"""
+템플릿 엔진
+
+Django 템플릿 엔진과 같지만, 뷰가 렌더링한 템플릿의 렌더링 시간을 요청 지표(`main.metrics`)에
+더합니다. `{% include %}`와 상속된 템플릿은 바깥 템플릿의 렌더링 시간에 포함됩니다.
+렌더링 중에 실행된 SQL 쿼리(템플릿에서 평가되는 쿼리셋 등)와 캐시 호출(컨텍스트 프로세서 등)은
+db/cache 시간으로 이미 기록되므로 렌더링 시간에서 뺍니다 (단계별 시간이 겹치지 않음).
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from django.http import HttpRequest
+from django.template import TemplateDoesNotExist
+from django.template.backends import django as django_backend
+from django.utils.safestring import SafeString
+
+from .metrics import current_timings
+
+
+class Template(django_backend.Template):
+    def render(self, context: Optional[Dict[str, Any]] = None, request: Optional[HttpRequest] = None) -> SafeString:
+        timings = current_timings.get()
+        if timings is None or timings.rendering:
+            # 요청 밖이거나, 렌더링 중에 다시 렌더링하는 경우(render_to_string 등)는 바깥 렌더링에 포함됨
+            return super().render(context, request)
+
+        timings.rendering = True
+        started = time.perf_counter()
+        recorded_before = timings.db_seconds + timings.cache_seconds
+        try:
+            return super().render(context, request)
+        finally:
+            recorded = timings.db_seconds + timings.cache_seconds - recorded_before
+            timings.template_seconds += max(time.perf_counter() - started - recorded, 0.0)
+            timings.rendering = False
+
+
+class DjangoTemplates(django_backend.DjangoTemplates):
+    def from_string(self, template_code: str) -> Template:
+        return Template(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name: str) -> Template:
+        try:
+            return Template(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            django_backend.reraise(exc, self)
@@ -0,0 +1,127 @@
+"""
+언어별로 특화된 템플릿 로더
+
+템플릿 곳곳의 `{% if LANGUAGE_CODE == 'ko' %}…{% else %}…{% endif %}` 분기는 활성 언어가
+정해지면 결과가 항상 같습니다. 이 로더는 템플릿을 언어별로 따로 컴파일하여 캐시하고,
+컴파일 직후 이런 분기를 상수로 평가해 선택되지 않는 쪽 노드를 제거합니다.
+렌더링 시에는 활성 언어에 맞는 템플릿이 선택되므로 분기 평가와 죽은 노드 순회가 사라집니다.
+
+`LANGUAGE_CODE`는 `i18n` 컨텍스트 프로세서와 `{% get_current_language %}`가 모두
+활성 언어로 설정하므로, 필터 없이 문자열 상수와 비교하는 조건만 접어도 결과가 같습니다.
+그 밖의 조건은 그대로 남겨 둡니다.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from django.template import Template
+from django.template.base import Node, NodeList, Variable
+from django.template.defaulttags import IfNode, TemplateLiteral
+from django.template.loaders import cached
+from django.utils import translation
+
+LANGUAGE_VARIABLE = "LANGUAGE_CODE"
+
+_LANGUAGE = object()
+
+
+def _operand(token: Any) -> Any:
+    """조건의 피연산자가 `LANGUAGE_CODE` 변수이면 _LANGUAGE, 문자열 상수이면 그 값, 그 외에는 None"""
+    if not isinstance(token, TemplateLiteral) or token.value.filters:
+        return None
+    var = token.value.var
+    if isinstance(var, Variable):
+        return _LANGUAGE if var.var == LANGUAGE_VARIABLE else None
+    return var if isinstance(var, str) else None
+
+
+def evaluate_condition(condition: Any, language: str) -> Optional[bool]:
+    """활성 언어만으로 결정되는 조건이면 그 결과를, 아니면 None 반환"""
+    operator = getattr(condition, "id", None)
+
+    if operator in ("==", "!="):
+        first, second = _operand(condition.first), _operand(condition.second)
+        if first is _LANGUAGE and isinstance(second, str):
+            result = language == second
+        elif second is _LANGUAGE and isinstance(first, str):
+            result = language == first
+        else:
+            return None
+        return result if operator == "==" else not result
+
+    if operator == "not":
+        value = evaluate_condition(condition.first, language)
+        return None if value is None else not value
+
+    if operator in ("and", "or"):
+        values = (evaluate_condition(condition.first, language), evaluate_condition(condition.second, language))
+        decisive = operator == "or"
+        if decisive in values:
+            return decisive
+        if values == (not decisive, not decisive):
+            return not decisive
+
+    return None
+
+
+def _fold_if(node: IfNode, language: str) -> List[Node]:
+    """IfNode의 분기를 접어, 대체할 노드 목록 반환"""
+    kept: List[Tuple[Any, NodeList]] = []
+
+    for condition, nodelist in node.conditions_nodelists:
+        value = True if condition is None else evaluate_condition(condition, language)
+        if value is False:
+            continue
+
+        nodelist = fold_nodelist(nodelist, language)
+        if value is True:
+            if not kept:
+                # 항상 선택되는 첫 분기: if 태그 자체를 내용으로 대체
+                return list(nodelist)
+            kept.append((None, nodelist))
+            break
+        kept.append((condition, nodelist))
+
+    if not kept:
+        return []
+    node.conditions_nodelists = kept
+    return [node]
+
+
+def fold_nodelist(nodelist: NodeList, language: str) -> NodeList:
+    """
+    언어 분기를 접은 새 NodeList 반환.
+
+    기존 NodeList를 수정하지 않고 새 목록을 만들어 속성만 교체하므로,
+    다른 스레드가 같은 템플릿을 렌더링하는 중이어도 안전합니다.
+    """
+    folded = NodeList()
+    folded.contains_nontext = nodelist.contains_nontext
+
+    for node in nodelist:
+        if isinstance(node, IfNode):
+            folded.extend(_fold_if(node, language))
+            continue
+
+        for attr in node.child_nodelists:
+            children = getattr(node, attr, None)
+            if isinstance(children, NodeList):
+                setattr(node, attr, fold_nodelist(children, language))
+        folded.append(node)
+
+    return folded
+
+
+class LanguageFoldingLoader(cached.Loader):
+    """활성 언어별로 템플릿을 컴파일하고 언어 분기를 접어서 캐시하는 로더"""
+
+    def cache_key(self, template_name: str, skip: Optional[List[Any]] = None) -> str:
+        return f"{super().cache_key(template_name, skip)}:{translation.get_language() or ''}"
+
+    def get_template(self, template_name: str, skip: Optional[List[Any]] = None) -> Template:
+        template = super().get_template(template_name, skip)
+        language = translation.get_language()
+
+        if language and not getattr(template, "_language_folded", False):
+            template._language_folded = True  # type: ignore[attr-defined]
+            template.nodelist = fold_nodelist(template.nodelist, language)
+        return template
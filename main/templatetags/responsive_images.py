@@ -0,0 +1,59 @@
+"""
+반응형 이미지 템플릿 태그
+
+사용법:
+    {% load responsive_images %}
+    {% responsive_image event.image alt=title sizes="(min-width: 768px) 33vw, 100vw" css_class="w-full h-full object-cover" %}
+"""
+
+from typing import Any, Dict
+
+from django import template
+from django.db.models.fields.files import FieldFile
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from django.utils.safestring import SafeString
+
+from main.images import (
+    IMAGE_VARIANT_FORMATS,
+    IMAGE_VARIANT_WIDTHS,
+    dimensions,
+    placeholder,
+    srcset,
+    variant_name,
+    variants_ready,
+)
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_image(
+    image: FieldFile, alt: str = "", sizes: str = "100vw", css_class: str = "", loading: str = "lazy"
+) -> SafeString:
+    """
+    WebP/JPEG 변환본의 `<picture>` (변환본이 아직 없으면 원본 `<img>`)
+
+    저장된 크기로 `width`/`height`를 지정하여 레이아웃 이동을 막고, 이미지가 로드되기 전에는
+    자리표시자를 배경으로 보여 줍니다. 모두 모델 컬럼 값이므로 파일시스템에 접근하지 않습니다.
+    """
+    if not image:
+        return SafeString("")
+
+    width, height = dimensions(image)
+    attrs: Dict[str, Any] = {"alt": alt, "class": css_class, "width": width, "height": height, "loading": loading}
+    if data_uri := placeholder(image):
+        attrs["style"] = f"background: url({data_uri}) center / cover no-repeat"
+
+    if not variants_ready(image):
+        return format_html("<img{}{}>", flatatt({"src": image.url}), flatatt(attrs))
+
+    webp, jpeg = IMAGE_VARIANT_FORMATS
+    fallback = image.storage.url(variant_name(image.name, IMAGE_VARIANT_WIDTHS[1], jpeg))
+    source = {"type": IMAGE_VARIANT_FORMATS[webp][1], "srcset": srcset(image.name, webp, image.storage), "sizes": sizes}
+    return format_html(
+        '<picture class="contents"><source{}><img{}{}></picture>',
+        flatatt(source),
+        flatatt({"src": fallback, "srcset": srcset(image.name, jpeg, image.storage), "sizes": sizes}),
+        flatatt({**attrs, "decoding": "async"}),
+    )
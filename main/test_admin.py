@@ -2,9 +2,11 @@
 관리자 페이지 테스트
 """
 
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.http import HttpResponse
-from django.test import Client, TestCase
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
 from .models import Activity
@@ -135,6 +137,41 @@ class ActivityAdminTest(TestCase):
         self.assertTrue(Activity.objects.filter(title_ko="새 활동").exists())
 
 
+class StaticExportTriggerTest(TestCase):
+    """관리자 저장/삭제 후 정적 페이지 재생성 예약 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.client = Client()
+        User.objects.create_superuser(username="admin", email="admin@example.com", password="adminpass123")
+        self.client.login(username="admin", password="adminpass123")
+        self.activity = ActivityFactory.create()
+
+    @override_settings(STATIC_EXPORT_ON_SAVE=True)
+    def test_export_scheduled_after_commit(self) -> None:
+        """저장/삭제가 커밋된 뒤에 내보내기가 예약되는지 테스트"""
+        url = reverse("admin:main_activity_delete", args=[self.activity.pk])
+
+        with patch("main.admin.schedule_static_export") as schedule:
+            with self.captureOnCommitCallbacks() as callbacks:
+                response: HttpResponse = self.client.post(url, {"post": "yes"})
+            self.assertEqual(response.status_code, 302)
+            schedule.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+            schedule.assert_called_once_with()
+
+    def test_export_disabled_by_default(self) -> None:
+        """설정이 꺼져 있으면 예약하지 않는지 테스트"""
+        url = reverse("admin:main_activity_delete", args=[self.activity.pk])
+
+        with patch("main.admin.schedule_static_export") as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(url, {"post": "yes"})
+        schedule.assert_not_called()
+
+
 class OrganizerAdminTest(TestCase):
     """Organizer 관리자 페이지 테스트"""
 
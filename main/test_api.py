@@ -0,0 +1,118 @@
+"""
+JSON API 테스트
+"""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from typing import Any, Dict
+
+from django.test import TestCase
+from django.urls import reverse
+
+from .test_caching import CacheTestCase
+from .test_factories import ActivityFactory, FAQFactory, OrganizerFactory
+
+
+class ActivityApiTest(TestCase):
+    """활동 API 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.url = reverse("api_activities")
+        self.march = ActivityFactory.create(start_datetime=datetime(2025, 3, 1, 10, 0, tzinfo=dt_timezone.utc))
+        self.april = ActivityFactory.create(
+            activity_type="workshop", start_datetime=datetime(2025, 4, 1, 10, 0, tzinfo=dt_timezone.utc)
+        )
+        self.hidden = ActivityFactory.create(is_public=False)
+
+    def get_json(self, **params: Any) -> Dict[str, Any]:
+        """성공 응답의 JSON 본문"""
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return response.json()
+
+    def ids(self, **params: Any) -> list:
+        """응답에 포함된 활동 id 목록"""
+        return [item["id"] for item in self.get_json(**params)["results"]]
+
+    def test_lists_public_activities(self) -> None:
+        """공개 활동만 최신 시작 일시 순으로 응답하는지 테스트"""
+        self.assertEqual(self.ids(), [self.april.id, self.march.id])
+
+    def test_field_projection(self) -> None:
+        """요청한 필드만 순서대로 응답하는지 테스트"""
+        data = self.get_json(fields="title_ko,id")
+
+        self.assertEqual(list(data["results"][0]), ["title_ko", "id"])
+
+    def test_unknown_field_is_rejected(self) -> None:
+        """허용되지 않은 필드는 400을 반환하는지 테스트"""
+        response = self.client.get(self.url, {"fields": "id,is_public"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("is_public", response.json()["error"])
+
+    def test_filters(self) -> None:
+        """활동 유형과 날짜 범위 필터 테스트"""
+        self.assertEqual(self.ids(activity_type="workshop"), [self.april.id])
+        self.assertEqual(self.ids(start_after="2025-03-15"), [self.april.id])
+        self.assertEqual(self.ids(start_before="2025-03-01"), [self.march.id])
+        self.assertEqual(self.client.get(self.url, {"activity_type": "party"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"start_after": "yesterday"}).status_code, 400)
+
+    def test_cursor_pagination(self) -> None:
+        """next URL을 따라가면 모든 활동을 한 번씩 받는지 테스트"""
+        first = self.get_json(limit=1, fields="id")
+        second = self.client.get(first["next"]).json()
+
+        self.assertEqual([item["id"] for item in first["results"] + second["results"]], [self.april.id, self.march.id])
+        self.assertIsNone(second["next"])
+        self.assertEqual(self.client.get(self.url, {"cursor": "invalid"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"limit": "0"}).status_code, 400)
+
+    def test_non_ascii_limit(self) -> None:
+        """유니코드 숫자("²", "٥") limit은 500이 아닌 400을 반환하는지 테스트"""
+        for limit in ("²", "٥", " 5", "+5"):
+            with self.subTest(limit=limit):
+                response = self.client.get(self.url, {"limit": limit})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("limit must be between", response.json()["error"])
+
+
+class OtherResourcesApiTest(TestCase):
+    """운영진, FAQ API 테스트"""
+
+    def test_organizers_and_faqs(self) -> None:
+        """공개 행만 응답하는지 테스트"""
+        organizer = OrganizerFactory.create()
+        OrganizerFactory.create(is_public=False)
+        faq = FAQFactory.create()
+
+        organizers = self.client.get(reverse("api_organizers")).json()["results"]
+        faqs = self.client.get(reverse("api_faqs"), {"fields": "id,question_ko"}).json()["results"]
+
+        self.assertEqual([item["id"] for item in organizers], [organizer.id])
+        self.assertEqual(faqs, [{"id": faq.id, "question_ko": faq.question_ko}])
+        self.assertEqual(self.client.get(reverse("api_opportunities")).json(), {"results": [], "next": None})
+
+
+class ApiCacheTest(CacheTestCase):
+    """API 캐시와 조건부 GET 테스트"""
+
+    def test_conditional_get(self) -> None:
+        """ETag가 일치하면 304, 활동이 바뀌면 200을 반환하는지 테스트"""
+        activity = ActivityFactory.create()
+        url = reverse("api_activities")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            FAQFactory.create()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            activity.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
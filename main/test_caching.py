@@ -0,0 +1,303 @@
+"""
+캐시 계층 테스트
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.db import connection, transaction
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone, translation
+
+from .caching import FAQS, LAYOUT, bump_versions, get_or_compute, get_versions
+from .context_processors import get_layout_context, layout
+from .models import Activity
+from .test_factories import ActivityFactory, FAQFactory, SocialMediaPlatformFactory
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "main-tests",
+    },
+    "versions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "main-tests-versions",
+    },
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheTestCase(TestCase):
+    """실제 캐시 백엔드를 사용하는 테스트 기본 클래스"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        for alias in LOCMEM_CACHES:
+            caches[alias].clear()
+
+
+class ContentVersionTest(CacheTestCase):
+    """네임스페이스 버전 테스트"""
+
+    def test_versions_are_stable_until_bumped(self) -> None:
+        """갱신 전까지 버전이 유지되는지 테스트"""
+        first = get_versions([LAYOUT])
+        self.assertEqual(get_versions([LAYOUT]), first)
+
+        bump_versions(LAYOUT)
+        self.assertGreater(get_versions([LAYOUT])[LAYOUT], first[LAYOUT])
+
+    @override_settings(
+        CACHES={
+            **LOCMEM_CACHES,
+            "default": {**LOCMEM_CACHES["default"], "OPTIONS": {"MAX_ENTRIES": 5, "CULL_FREQUENCY": 1}},
+        }
+    )
+    def test_versions_survive_page_cache_culling(self) -> None:
+        """페이지 캐시가 가득 차 축출되어도 버전은 유지되는지 테스트"""
+        first = get_versions([LAYOUT])
+
+        for number in range(20):
+            cache.set(f"page:{number}", number)
+
+        self.assertEqual(get_versions([LAYOUT]), first)
+
+    def test_get_or_compute_recomputes_after_bump(self) -> None:
+        """버전 갱신 후 값이 다시 계산되는지 테스트"""
+        calls = []
+
+        def compute() -> int:
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(get_or_compute("test-key", [LAYOUT], compute), 1)
+        self.assertEqual(get_or_compute("test-key", [LAYOUT], compute), 1)
+
+        bump_versions(LAYOUT)
+        self.assertEqual(get_or_compute("test-key", [LAYOUT], compute), 2)
+
+
+class LayoutContextTest(CacheTestCase):
+    """레이아웃 컨텍스트 캐시 테스트"""
+
+    def test_layout_context_is_cached(self) -> None:
+        """레이아웃 컨텍스트가 한 번만 계산되는지 테스트"""
+        platform = SocialMediaPlatformFactory.create(name_en="Discord")
+
+        with self.assertNumQueries(1):
+            context = get_layout_context()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_layout_context(), context)
+
+        self.assertEqual(context["discord_url"], platform.url)
+        self.assertEqual(context["social_platforms"], [platform])
+
+    def test_layout_context_invalidated_on_save_and_delete(self) -> None:
+        """플랫폼 저장/삭제 시 레이아웃 캐시가 무효화되는지 테스트"""
+        platform = SocialMediaPlatformFactory.create(name_en="Discord")
+        get_layout_context()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            platform.url = "https://discord.gg/changed"
+            platform.save()
+        self.assertEqual(get_layout_context()["discord_url"], "https://discord.gg/changed")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            platform.delete()
+        self.assertIsNone(get_layout_context()["discord_url"])
+        self.assertEqual(get_layout_context()["social_platforms"], [])
+
+    def test_layout_context_processor_is_lazy(self) -> None:
+        """사용하지 않는 레이아웃 값은 조회하지 않는지 테스트"""
+        request = RequestFactory().get(reverse("home"))
+
+        with self.assertNumQueries(0):
+            context = layout(request)
+
+        with self.assertNumQueries(1):
+            self.assertFalse(context["discord_url"])
+            self.assertEqual(len(context["social_platforms"]), 0)
+
+
+class PublicPageCacheTest(CacheTestCase):
+    """전체 페이지 캐시 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        super().setUp()
+        SocialMediaPlatformFactory.create(name_en="Discord")
+        self.faq = FAQFactory.create(question_ko="캐시 질문")
+
+    def test_cache_hit_skips_view(self) -> None:
+        """캐시 적중 시 쿼리 없이 동일한 응답을 반환하는지 테스트"""
+        first = self.client.get(reverse("faq"))
+
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse("faq"))
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertIn("HX-Request", second["Vary"])
+
+    def test_cache_is_keyed_by_language_and_htmx(self) -> None:
+        """언어와 HTMX 요청 여부별로 캐시가 분리되는지 테스트"""
+        self.client.get(reverse("faq"))
+
+        # 레이아웃은 캐시되어 있으므로 FAQ 쿼리만 실행됨
+        with translation.override("en"), self.assertNumQueries(1):
+            response = self.client.get(reverse("faq"))
+        self.assertIn('lang="en"', response.content.decode())
+
+        with self.assertNumQueries(1):
+            self.client.get(reverse("faq"), HTTP_HX_REQUEST="true")
+
+    def test_model_change_evicts_only_affected_pages(self) -> None:
+        """모델 변경 시 관련 페이지만 무효화되는지 테스트"""
+        self.client.get(reverse("faq"))
+        self.client.get(reverse("coc"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.faq.question_ko = "수정된 질문"
+            self.faq.save()
+
+        with self.assertNumQueries(0):
+            self.client.get(reverse("coc"))
+        response = self.client.get(reverse("faq"))
+        self.assertIn("수정된 질문", response.content.decode())
+
+    def test_versions_are_bumped_after_commit(self) -> None:
+        """트랜잭션 안에서 저장하면 커밋된 뒤에 버전이 바뀌고 페이지가 다시 생성되는지 테스트"""
+        self.client.get(reverse("faq"))
+        before = get_versions([FAQS])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.faq.question_ko = "커밋된 질문"
+                self.faq.save()
+                # 커밋 전에는 다른 요청이 이전 내용을 읽으므로 버전을 바꾸지 않음
+                self.assertEqual(get_versions([FAQS]), before)
+
+        self.assertNotEqual(get_versions([FAQS]), before)
+        self.assertIn("커밋된 질문", self.client.get(reverse("faq")).content.decode())
+
+    def test_activity_change_evicts_related_event_pages(self) -> None:
+        """활동 변경 시 같은 유형의 상세 페이지도 무효화되는지 테스트"""
+        # 시간순: related, event, other (other의 이전/다음 링크에 related가 나오지 않도록)
+        now = timezone.now()
+        related = ActivityFactory.create(
+            activity_type="workshop", title_ko="관련 워크숍", start_datetime=now + timedelta(days=1)
+        )
+        event = ActivityFactory.create(activity_type="workshop", start_datetime=now + timedelta(days=2))
+        other = ActivityFactory.create(activity_type="meetup", start_datetime=now + timedelta(days=3))
+        event_url = reverse("event_detail", args=[event.id])
+        other_url = reverse("event_detail", args=[other.id])
+        self.client.get(event_url)
+        self.client.get(other_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            related.title_ko = "이름이 바뀐 워크숍"
+            related.save()
+
+        with self.assertNumQueries(0):
+            self.client.get(other_url)
+        self.assertIn("이름이 바뀐 워크숍", self.client.get(event_url).content.decode())
+
+    def test_authenticated_requests_bypass_cache(self) -> None:
+        """로그인한 사용자는 캐시를 거치지 않는지 테스트"""
+        self.client.get(reverse("coc"))
+        user = get_user_model().objects.create_user(username="staff", password="password")
+        self.client.force_login(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("coc"))
+        self.assertGreater(len(queries), 0)
+
+
+class EventCardFragmentCacheTest(CacheTestCase):
+    """이벤트 카드 조각 캐시 테스트"""
+
+    def render_card(self, event: Activity) -> str:
+        """이벤트 카드 렌더링"""
+        return render_to_string("components/event_card.html", {"event": event})
+
+    def test_card_is_cached_per_activity_and_language(self) -> None:
+        """카드가 활동과 언어별로 캐시되는지 테스트"""
+        event = ActivityFactory.create(title_ko="캐시 카드", title_en="Cached card")
+        self.render_card(event)
+
+        # 시그널 없이 DB만 바꾸면 수정 시각이 그대로이므로 캐시된 카드가 사용됨
+        event.title_ko = "바뀐 카드"
+        self.assertIn("캐시 카드", self.render_card(event))
+
+        with translation.override("en"):
+            self.assertIn("Cached card", self.render_card(event))
+
+    def test_card_is_rerendered_after_save(self) -> None:
+        """활동을 저장하면 해당 카드만 다시 렌더링되는지 테스트"""
+        event = ActivityFactory.create(title_ko="캐시 카드")
+        other = ActivityFactory.create(title_ko="다른 카드")
+        self.render_card(event)
+        self.render_card(other)
+
+        event.title_ko = "바뀐 카드"
+        event.save()
+        other.title_ko = "저장하지 않은 변경"
+
+        self.assertIn("바뀐 카드", self.render_card(event))
+        self.assertIn("다른 카드", self.render_card(other))
+
+
+class ConditionalGetTest(CacheTestCase):
+    """조건부 GET 테스트"""
+
+    def test_validators_are_emitted(self) -> None:
+        """ETag와 Last-Modified 헤더가 포함되는지 테스트"""
+        response = self.client.get(reverse("coc"))
+
+        self.assertTrue(response.has_header("ETag"))
+        self.assertTrue(response.has_header("Last-Modified"))
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_matching_etag_returns_not_modified(self) -> None:
+        """ETag가 일치하면 렌더링 없이 304를 반환하는지 테스트"""
+        etag = self.client.get(reverse("faq"))["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("faq"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        with self.assertNumQueries(0):
+            response = self.client.head(reverse("faq"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_if_modified_since_returns_not_modified(self) -> None:
+        """If-Modified-Since가 최신이면 304를 반환하는지 테스트"""
+        last_modified = self.client.get(reverse("coc"))["Last-Modified"]
+
+        response = self.client.get(reverse("coc"), HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_content_change_invalidates_etag(self) -> None:
+        """콘텐츠가 바뀌면 ETag가 달라지는지 테스트"""
+        etag = self.client.get(reverse("faq"))["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            FAQFactory.create()
+
+        response = self.client.get(reverse("faq"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_home_etag_changes_when_event_starts(self) -> None:
+        """이벤트가 시작되어 지난 이벤트로 넘어가면 홈페이지 ETag가 바뀌는지 테스트"""
+        event = ActivityFactory.create()
+        etag = self.client.get(reverse("home"))["ETag"]
+
+        # 시그널 없이 시작 시각만 과거로 이동 (시간 경과 시뮬레이션)
+        Activity.objects.filter(pk=event.pk).update(start_datetime=timezone.now() - timedelta(minutes=1))
+
+        response = self.client.get(reverse("home"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
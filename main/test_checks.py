@@ -0,0 +1,42 @@
+"""
+시스템 체크 테스트
+"""
+
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+from .checks import check_third_party_scripts
+
+
+class ThirdPartyScriptCheckTest(SimpleTestCase):
+    """외부 출처 스크립트 검사 테스트"""
+
+    def test_project_templates_pass(self) -> None:
+        """프로젝트 템플릿에 외부 스크립트가 없는지 테스트"""
+        self.assertEqual(check_third_party_scripts(), [])
+
+    def test_reports_third_party_scripts(self) -> None:
+        """외부 출처와 프로토콜 생략 URL을 찾고, 정적 파일과 인라인 스크립트는 허용하는지 테스트"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        root = Path(directory.name)
+        (root / "templates" / "components").mkdir(parents=True)
+        (root / "templates" / "base.html").write_text(
+            "{% load static %}\n"
+            "<script defer src=\"{% static 'js/site.js' %}\"></script>\n"
+            "<script>window.ready = true;</script>\n"
+            '<script defer src="https://unpkg.com/htmx.org@1.9.12"></script>\n'
+        )
+        (root / "templates" / "components" / "map.html").write_text("<SCRIPT src='//maps.example.com/api.js'>")
+
+        templates = [{**settings.TEMPLATES[0], "DIRS": [root / "templates"]}]
+        with override_settings(BASE_DIR=root, TEMPLATES=templates):
+            errors = check_third_party_scripts()
+
+        self.assertEqual([error.id for error in errors], ["main.E001", "main.E001"])
+        self.assertIn("base.html:4", errors[0].msg)
+        self.assertIn("https://unpkg.com/htmx.org@1.9.12", errors[0].msg)
+        self.assertIn("//maps.example.com/api.js", errors[1].msg)
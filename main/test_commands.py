@@ -0,0 +1,153 @@
+"""
+관리 커맨드 테스트
+"""
+
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import translation
+
+from .models import Activity
+from .static_export import ExportResult, export_site, output_file
+from .test_factories import ActivityFactory, FAQFactory, SocialMediaPlatformFactory
+from .test_images import ImageVariantTestCase, make_image
+
+
+class BenchmarkCommandTest(TestCase):
+    """benchmark 커맨드 테스트"""
+
+    def test_benchmark_coc(self) -> None:
+        """행동 강령 벤치마크가 결과를 출력하는지 테스트"""
+        out = StringIO()
+        call_command("benchmark", "coc", iterations=2, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("context: per-request markdown", output)
+        self.assertIn("context: precomputed", output)
+
+    def test_benchmark_sqlite(self) -> None:
+        """SQLite 벤치마크가 두 설정의 읽기 처리량을 출력하는지 테스트"""
+        out = StringIO()
+        call_command("benchmark", "sqlite", iterations=5, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("default pragmas (rollback journal)", output)
+        self.assertIn("settings.SQLITE_PRAGMAS (WAL)", output)
+        self.assertIn("read throughput speedup", output)
+
+
+class ExportStaticCommandTest(TestCase):
+    """export_static 커맨드 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+        SocialMediaPlatformFactory.create()
+        self.faq = FAQFactory.create(question_ko="내보내기 질문")
+        self.events = ActivityFactory.create_batch(2)
+
+    def export(self) -> set:
+        """내보내기 실행 후 렌더링된 경로 반환"""
+        return set(export_site(self.root, jobs=1).rendered)
+
+    def url(self, name: str, language: str, *args: int) -> str:
+        """언어별 URL"""
+        with translation.override(language):
+            return reverse(name, args=args)
+
+    def test_exports_public_pages_in_every_language(self) -> None:
+        """모든 공개 페이지가 언어별 파일로 저장되는지 테스트"""
+        out = StringIO()
+        call_command("export_static", output=self.root, jobs=1, stdout=out)
+
+        for language in ("ko", "en"):
+            for name in ("home", "events_list", "contribute", "faq", "coc"):
+                self.assertTrue(output_file(self.root, self.url(name, language)).exists())
+            for event in self.events:
+                self.assertTrue(output_file(self.root, self.url("event_detail", language, event.id)).exists())
+
+        faq_html = output_file(self.root, self.url("faq", "ko")).read_text()
+        self.assertIn("내보내기 질문", faq_html)
+        self.assertIn("14 rendered", out.getvalue())
+
+    def test_rerenders_only_changed_pages(self) -> None:
+        """두 번째 실행부터는 바뀐 페이지만 다시 렌더링하는지 테스트"""
+        self.export()
+        self.assertEqual(self.export(), set())
+
+        self.faq.question_ko = "바뀐 질문"
+        self.faq.save()
+        self.assertEqual(self.export(), {self.url("faq", "ko"), self.url("faq", "en")})
+        self.assertIn("바뀐 질문", output_file(self.root, self.url("faq", "ko")).read_text())
+
+    def test_removes_pages_that_are_no_longer_public(self) -> None:
+        """비공개로 바뀐 이벤트의 파일은 삭제되고 관련 페이지는 다시 렌더링되는지 테스트"""
+        self.export()
+        hidden, remaining = self.events
+        hidden.is_public = False
+        hidden.save()
+
+        result = export_site(self.root, jobs=1)
+
+        self.assertIn(self.url("event_detail", "ko", hidden.id), result.removed)
+        self.assertFalse(output_file(self.root, self.url("event_detail", "ko", hidden.id)).exists())
+        self.assertIn(self.url("event_detail", "ko", remaining.id), result.rendered)
+        self.assertIn(self.url("events_list", "en"), result.rendered)
+
+    def test_interval_retries_failed_exports(self) -> None:
+        """반복 실행 중 실패는 기록만 하고 다음 주기에 다시 시도하며, --force는 성공할 때까지 유지되는지 테스트"""
+        target = "main.management.commands.export_static"
+        with (
+            patch(
+                f"{target}.export_site",
+                side_effect=[OSError("read-only"), ExportResult([], [], 0), ExportResult([], [], 0)],
+            ) as export,
+            patch(f"{target}.time.sleep", side_effect=[None, None, KeyboardInterrupt]),
+            patch(f"{target}.close_old_connections"),
+            self.assertLogs(target, "ERROR"),
+            self.assertRaises(KeyboardInterrupt),
+        ):
+            call_command("export_static", output=self.root, force=True, interval=60, stdout=StringIO())
+
+        self.assertEqual([call.kwargs["force"] for call in export.call_args_list], [True, True, False])
+
+
+class BackfillImagesCommandTest(ImageVariantTestCase):
+    """backfill_images 커맨드 테스트"""
+
+    def test_backfills_existing_images(self) -> None:
+        """기존 이미지의 크기, 자리표시자, 변환본을 채우고 없는 파일은 크기를 0으로 기록해 다시 시도하지 않는지 테스트"""
+        activity = ActivityFactory.create()
+        missing = ActivityFactory.create()
+        name = default_storage.save("activities/old.jpg", make_image(640, 480))
+        Activity.objects.filter(pk=activity.pk).update(image=name)
+        Activity.objects.filter(pk=missing.pk).update(image="activities/missing.jpg")
+
+        out, err = StringIO(), StringIO()
+        call_command("backfill_images", stdout=out, stderr=err)
+
+        activity = Activity.objects.get(pk=activity.pk)
+        self.assertEqual((activity.image_width, activity.image_height), (640, 480))
+        self.assertTrue(activity.image_placeholder)
+        self.assertTrue(activity.image_has_variants)
+        self.assertIn("1 processed, 1 failed", out.getvalue())
+        self.assertIn(f"activity {missing.pk}", err.getvalue())
+        self.assertEqual(Activity.objects.values_list("image_width", "image_height").get(pk=missing.pk), (0, 0))
+
+        out, err = StringIO(), StringIO()
+        call_command("backfill_images", stdout=out, stderr=err)
+        self.assertIn("0 processed, 0 failed", out.getvalue())
+        self.assertEqual(err.getvalue(), "")
+
+        out = StringIO()
+        call_command("backfill_images", "--force", stdout=out, stderr=StringIO())
+        self.assertIn("1 processed, 1 failed", out.getvalue())
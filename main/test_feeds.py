@@ -0,0 +1,86 @@
+"""
+활동 RSS/Atom 피드 테스트
+"""
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import translation
+
+from .test_caching import CacheTestCase
+from .test_factories import ActivityFactory
+
+
+class ActivityFeedTest(TestCase):
+    """피드 내용 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.activity = ActivityFactory.create(title_ko="파이썬 세미나", title_en="Python Seminar")
+        ActivityFactory.create(title_ko="비공개 세미나", is_public=False)
+
+    def get_feed(self, name: str, language: str) -> str:
+        """언어별 피드 본문"""
+        with translation.override(language):
+            response = self.client.get(reverse(name))
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode()
+
+    def test_rss_feed_per_language(self) -> None:
+        """언어별 RSS 피드에 공개 활동만 해당 언어로 포함되는지 테스트"""
+        korean = self.get_feed("events_rss", "ko")
+        english = self.get_feed("events_rss", "en")
+
+        self.assertIn("<rss", korean)
+        self.assertIn("파이썬 세미나", korean)
+        self.assertIn(f"http://testserver/ko/events/{self.activity.id}/", korean)
+        self.assertNotIn("비공개", korean)
+        self.assertIn("Python Seminar", english)
+        self.assertIn(f"http://testserver/en/events/{self.activity.id}/", english)
+
+    def test_atom_feed(self) -> None:
+        """Atom 피드 테스트"""
+        feed = self.get_feed("events_atom", "en")
+
+        self.assertIn('xmlns="http://www.w3.org/2005/Atom"', feed)
+        self.assertIn("<updated>", feed)
+        self.assertIn("Python Seminar", feed)
+
+
+class ActivityFeedCacheTest(CacheTestCase):
+    """피드 캐시와 조건부 GET 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        super().setUp()
+        self.activity = ActivityFactory.create(title_ko="파이썬 세미나")
+        self.url = reverse("events_rss")
+
+    def test_feed_is_served_from_cache(self) -> None:
+        """두 번째 요청부터는 쿼리 없이 캐시에서 응답하는지 테스트"""
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.content, first.content)
+
+    def test_feed_supports_conditional_get(self) -> None:
+        """ETag가 일치하면 304, 활동이 바뀌면 새 피드를 반환하는지 테스트"""
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.activity.title_ko = "바뀐 세미나"
+            self.activity.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("바뀐 세미나", response.content.decode())
+
+    def test_cache_is_separated_by_host(self) -> None:
+        """절대 URL이 다른 호스트의 요청에 재사용되지 않는지 테스트"""
+        with self.settings(ALLOWED_HOSTS=["testserver", "example.com"]):
+            self.client.get(self.url)
+            response = self.client.get(self.url, HTTP_HOST="example.com")
+
+        self.assertIn("http://example.com/", response.content.decode())
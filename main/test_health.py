@@ -0,0 +1,85 @@
+"""
+헬스체크 테스트
+"""
+
+from unittest.mock import patch
+
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+
+from . import health
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class LivenessTest(TestCase):
+    """/healthz 테스트"""
+
+    def test_responds_without_database_queries(self) -> None:
+        """쿼리와 언어 접두사 리다이렉트 없이 바로 응답하는지 테스트"""
+        with self.assertNumQueries(0):
+            response = self.client.get("/healthz")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual(response["Cache-Control"], "no-store")
+        self.assertNotIn("Vary", response)
+        self.assertFalse(response.cookies)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ReadinessTest(TestCase):
+    """/readyz 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        health.readiness.reset()
+        self.addCleanup(health.readiness.reset)
+
+    def test_reports_each_dependency(self) -> None:
+        """데이터베이스, 마이그레이션, 캐시 백엔드 결과와 소요 시간을 응답하는지 테스트"""
+        response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "ok")
+        self.assertFalse(data["cached"])
+        self.assertEqual(set(data["checks"]), {"database", "migrations", "cache"})
+        for check in data["checks"].values():
+            self.assertEqual(check["status"], "ok")
+            self.assertGreaterEqual(check["latency_ms"], 0)
+        self.assertEqual(data["checks"]["cache"]["backend"], "LocMemCache")
+
+    def test_reuses_result_within_interval(self) -> None:
+        """확인 주기 안의 요청은 쿼리 없이 저장된 결과를 응답하는지 테스트"""
+        self.client.get("/readyz")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/readyz")
+
+        self.assertTrue(response.json()["cached"])
+
+    def test_unavailable_dependency(self) -> None:
+        """하나라도 실패하면 503과 실패 원인을 응답하는지 테스트"""
+
+        def unavailable_database() -> dict:
+            raise OperationalError("unable to open")
+
+        with patch.dict(health.PROBES, database=unavailable_database):
+            with self.assertLogs("main.health", "WARNING"):
+                response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 503)
+        data = response.json()
+        self.assertEqual(data["status"], "error")
+        self.assertEqual(data["checks"]["database"]["error"], "OperationalError: unable to open")
+        self.assertEqual(data["checks"]["cache"]["status"], "ok")
+
+    def test_dummy_cache_is_unavailable(self) -> None:
+        """값을 저장하지 않는 캐시 백엔드를 실패로 보고하는지 테스트"""
+        with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}):
+            with self.assertLogs("main.health", "WARNING"):
+                response = self.client.get("/readyz")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["checks"]["cache"]["status"], "error")
@@ -0,0 +1,90 @@
+"""
+iCalendar 피드 테스트
+"""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .ical import escape_text, fold_line
+from .test_caching import LOCMEM_CACHES
+from .test_factories import ActivityFactory
+
+
+class ICalendarFormatTest(TestCase):
+    """iCalendar 값 형식 테스트"""
+
+    def test_escape_text(self) -> None:
+        """특수 문자가 이스케이프되는지 테스트"""
+        self.assertEqual(escape_text("a,b;c\\d\ne"), "a\\,b\\;c\\\\d\\ne")
+
+    def test_long_lines_are_folded_without_splitting_characters(self) -> None:
+        """긴 줄이 75옥텟 이하로 접히고 UTF-8 문자가 나뉘지 않는지 테스트"""
+        line = "SUMMARY:" + "파이썬" * 30
+        folded = fold_line(line)
+
+        for physical_line in folded.split("\r\n")[:-1]:
+            self.assertLessEqual(len(physical_line.encode()), 75)
+        self.assertEqual(folded.replace("\r\n ", "").rstrip("\r\n"), line)
+
+
+class ICalendarFeedTest(TestCase):
+    """iCalendar 피드 뷰 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.seminar = ActivityFactory.create(
+            title_ko="세미나, 첫 번째",
+            title_en="Seminar",
+            start_datetime=datetime(2025, 3, 1, 10, 0, tzinfo=dt_timezone.utc),
+            end_datetime=datetime(2025, 3, 1, 12, 0, tzinfo=dt_timezone.utc),
+        )
+        self.workshop = ActivityFactory.create(activity_type="workshop", title_ko="워크숍")
+        self.study_group = ActivityFactory.create_study_group(title_ko="스터디")
+        ActivityFactory.create(title_ko="비공개", is_public=False)
+
+    def get_calendar(self, url: str) -> str:
+        """피드 응답 본문"""
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/calendar; charset=utf-8")
+        return b"".join(response.streaming_content).decode()
+
+    def test_feed_contains_public_scheduled_activities(self) -> None:
+        """시작 일시가 있는 공개 활동만 포함되는지 테스트"""
+        calendar = self.get_calendar(reverse("events_ics"))
+
+        self.assertTrue(calendar.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(calendar.endswith("END:VCALENDAR\r\n"))
+        self.assertEqual(calendar.count("BEGIN:VEVENT"), 2)
+        self.assertIn("SUMMARY:세미나\\, 첫 번째 / Seminar\r\n", calendar)
+        self.assertIn("DTSTART:20250301T100000Z\r\n", calendar)
+        self.assertIn("DTEND:20250301T120000Z\r\n", calendar)
+        self.assertIn(f"UID:activity-{self.seminar.id}@testserver\r\n", calendar)
+        self.assertNotIn("스터디", calendar)
+        self.assertNotIn("비공개", calendar)
+
+    def test_feed_per_activity_type(self) -> None:
+        """활동 유형별 피드 테스트"""
+        calendar = self.get_calendar(reverse("events_type_ics", args=["workshop"]))
+
+        self.assertEqual(calendar.count("BEGIN:VEVENT"), 1)
+        self.assertIn("워크숍", calendar)
+        self.assertEqual(self.client.get(reverse("events_type_ics", args=["unknown"])).status_code, 404)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_feed_supports_conditional_get(self) -> None:
+        """ETag가 일치하면 304, 활동이 바뀌면 200을 반환하는지 테스트"""
+        url = reverse("events_ics")
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seminar.title_ko = "바뀐 세미나"
+            self.seminar.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
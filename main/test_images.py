@@ -0,0 +1,209 @@
+"""
+반응형 이미지 변환본 테스트
+"""
+
+import tempfile
+from io import BytesIO
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from PIL import Image
+
+from .images import IMAGE_VARIANT_WIDTHS, generate_variants, thumbnail_url, variant_name
+from .models import Activity
+from .tasks import _run_image_variants
+from .test_factories import ActivityFactory, OrganizerFactory
+
+
+def make_image(width: int, height: int, mode: str = "RGB", image_format: str = "JPEG") -> ContentFile:
+    """테스트용 이미지 파일"""
+    buffer = BytesIO()
+    Image.new(mode, (width, height), "purple").save(buffer, format=image_format)
+    return ContentFile(buffer.getvalue())
+
+
+def make_upload(width: int = 400, height: int = 300) -> SimpleUploadedFile:
+    """테스트용 업로드 파일"""
+    return SimpleUploadedFile("photo.jpg", make_image(width, height).read(), content_type="image/jpeg")
+
+
+class ImageVariantTestCase(TestCase):
+    """임시 MEDIA_ROOT를 사용하는 테스트 기본 클래스"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings_override = override_settings(MEDIA_ROOT=media_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+
+class GenerateVariantsTest(ImageVariantTestCase):
+    """변환본 생성 테스트"""
+
+    def test_generates_each_width_and_format(self) -> None:
+        """너비별 WebP/JPEG가 생성되고 원본보다 커지지 않는지 테스트"""
+        name = default_storage.save("activities/photo.jpg", make_image(1000, 500))
+
+        saved = generate_variants(name)
+
+        self.assertEqual(len(saved), len(IMAGE_VARIANT_WIDTHS) * 2)
+        with default_storage.open(variant_name(name, 320, "webp")) as file, Image.open(file) as image:
+            self.assertEqual((image.format, image.size), ("WEBP", (320, 160)))
+        with default_storage.open(variant_name(name, 1280, "jpg")) as file, Image.open(file) as image:
+            self.assertEqual((image.format, image.size), ("JPEG", (1000, 500)))
+
+    def test_existing_variants_are_skipped(self) -> None:
+        """이미 있는 변환본은 다시 만들지 않는지 테스트"""
+        name = default_storage.save("activities/photo.jpg", make_image(400, 400))
+        generate_variants(name)
+
+        self.assertEqual(generate_variants(name), [])
+
+    def test_transparent_image(self) -> None:
+        """투명 PNG도 JPEG 변환본을 만들 수 있는지 테스트"""
+        name = default_storage.save("social_media/icon.png", make_image(64, 64, "RGBA", "PNG"))
+
+        generate_variants(name)
+
+        with default_storage.open(variant_name(name, 320, "jpg")) as file, Image.open(file) as image:
+            self.assertEqual(image.mode, "RGB")
+
+    def test_task_marks_row_ready(self) -> None:
+        """변환본을 만든 뒤 준비 여부와 수정 시각을 갱신하는지 테스트"""
+        activity = ActivityFactory.create(image=make_upload())
+        modified = activity.modified
+
+        with patch("main.tasks.connection"):
+            _run_image_variants(Activity, activity.pk, "image", activity.image.name)
+
+        activity.refresh_from_db()
+        self.assertTrue(activity.image_has_variants)
+        self.assertTrue(default_storage.exists(variant_name(activity.image.name, 1280, "jpg")))
+        self.assertGreater(activity.modified, modified)
+
+
+class ImageMetadataTest(ImageVariantTestCase):
+    """업로드 시 저장되는 크기와 자리표시자 테스트"""
+
+    def test_dimensions_and_placeholder_saved_on_upload(self) -> None:
+        """업로드하면 크기와 자리표시자가 컬럼에 저장되는지 테스트"""
+        activity = ActivityFactory.create(image=make_upload(800, 600))
+        activity.refresh_from_db()
+
+        self.assertEqual((activity.image_width, activity.image_height), (800, 600))
+        self.assertTrue(activity.image_placeholder.startswith("data:image/webp;base64,"))
+        self.assertLess(len(activity.image_placeholder), 400)
+        self.assertFalse(activity.image_has_variants)
+
+    def test_cleared_image_resets_metadata(self) -> None:
+        """이미지를 지우면 자리표시자와 준비 여부도 초기화되는지 테스트"""
+        organizer = OrganizerFactory.create(photo=make_upload(), photo_has_variants=True)
+        organizer.photo = None
+        organizer.save()
+        organizer.refresh_from_db()
+
+        self.assertEqual((organizer.photo_width, organizer.photo_placeholder), (None, ""))
+        self.assertFalse(organizer.photo_has_variants)
+
+    def test_missing_file_does_not_break_pages(self) -> None:
+        """크기가 비어 있는 행의 파일이 없어도 페이지가 응답하는지 테스트"""
+        activity = ActivityFactory.create(start_datetime=None)
+        Activity.objects.filter(pk=activity.pk).update(image="activities/missing.jpg")
+
+        with self.assertLogs("main.models", "WARNING"):
+            loaded = Activity.objects.get(pk=activity.pk)
+        self.assertEqual((loaded.image_width, loaded.image_height), (None, None))
+
+        with self.assertLogs("main.models", "WARNING"):
+            for url in (reverse("home"), reverse("events_list"), reverse("event_detail", args=[activity.pk])):
+                with self.subTest(url=url):
+                    self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_recorded_missing_file_is_not_opened(self) -> None:
+        """크기가 0으로 기록된 행은 파일을 열지 않고 크기 속성 없이 렌더링하는지 테스트"""
+        activity = ActivityFactory.create()
+        Activity.objects.filter(pk=activity.pk).update(image="activities/missing.jpg", image_width=0, image_height=0)
+
+        with patch.object(default_storage, "open") as storage_open:
+            loaded = Activity.objects.get(pk=activity.pk)
+        storage_open.assert_not_called()
+
+        html = Template("{% load responsive_images %}{% responsive_image event.image %}").render(
+            Context({"event": loaded})
+        )
+        self.assertNotIn("width=", html)
+
+
+class ResponsiveImageTagTest(ImageVariantTestCase):
+    """responsive_image 템플릿 태그 테스트"""
+
+    def render(self, activity: Activity) -> str:
+        """태그 렌더링 결과"""
+        template = Template('{% load responsive_images %}{% responsive_image event.image alt="사진" sizes="50vw" %}')
+        return template.render(Context({"event": activity}))
+
+    def test_falls_back_to_original_until_variants_exist(self) -> None:
+        """변환본이 준비되기 전에는 원본, 준비된 뒤에는 srcset을 출력하는지 테스트"""
+        activity = ActivityFactory.create(image=make_upload(800, 600))
+
+        html = self.render(activity)
+        self.assertIn(f'<img src="{activity.image.url}" alt="사진"', html)
+        self.assertIn('width="800"', html)
+        self.assertIn('height="600"', html)
+        self.assertIn('style="background: url(data:image/webp;base64,', html)
+        self.assertEqual(thumbnail_url(activity.image), activity.image.url)
+
+        activity.image_has_variants = True
+        html = self.render(activity)
+
+        self.assertIn('srcset="/media/activities/variants/photo-320w.webp 320w', html)
+        self.assertIn("-320w.webp 320w", html)
+        self.assertIn("-1280w.jpg 1280w", html)
+        self.assertIn('sizes="50vw"', html)
+        self.assertIn('width="800"', html)
+        self.assertIn('loading="lazy"', html)
+        self.assertTrue(thumbnail_url(activity.image).endswith("-320w.jpg"))
+
+    def test_renders_without_filesystem_access(self) -> None:
+        """렌더링 중에는 스토리지에서 파일을 열거나 존재 여부를 확인하지 않는지 테스트"""
+        activity = Activity.objects.get(pk=ActivityFactory.create(image=make_upload(), image_has_variants=True).pk)
+
+        with patch.object(default_storage, "open") as storage_open, patch.object(default_storage, "exists") as exists:
+            self.render(activity)
+
+        storage_open.assert_not_called()
+        exists.assert_not_called()
+
+    def test_empty_image(self) -> None:
+        """이미지가 없으면 아무것도 출력하지 않는지 테스트"""
+        self.assertEqual(self.render(ActivityFactory.create()), "")
+
+
+class ImageVariantSignalTest(TestCase):
+    """변환본 생성 예약 테스트"""
+
+    def test_scheduled_after_commit_when_image_saved(self) -> None:
+        """변환본이 없는 이미지가 저장되면 커밋 후 예약되고, 수정 시각만 저장하면 예약하지 않는지 테스트"""
+        activity = ActivityFactory.create()
+        activity.image.name = "activities/photo.jpg"
+
+        with patch("main.signals.schedule_image_variants") as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                activity.save()
+                schedule.assert_not_called()
+            schedule.assert_called_once_with(activity, "image")
+
+            schedule.reset_mock()
+            with self.captureOnCommitCallbacks(execute=True):
+                activity.save(update_fields=["modified"])
+                activity.image_has_variants = True
+                activity.save()
+            schedule.assert_not_called()
@@ -0,0 +1,231 @@
+"""
+요청 지표 테스트
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.template import engines
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import translation
+
+from .metrics import MetricsRegistry, RequestTimings, track_request
+from .test_factories import FAQFactory
+
+
+class MetricsTestCase(TestCase):
+    """요청마다 새 지표 저장소를 사용하는 테스트 기본 클래스"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.registry = MetricsRegistry()
+        for target in ("main.metrics.registry", "main.middleware.registry"):
+            patcher = patch(target, self.registry)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class MetricsMiddlewareTest(MetricsTestCase):
+    """뷰 이름과 언어별 지표 기록 테스트"""
+
+    def test_records_requests_per_view_and_language(self) -> None:
+        """요청 수, 응답 시간, 쿼리 수, 템플릿 렌더링 시간이 뷰와 언어별로 기록되는지 테스트"""
+        FAQFactory.create_batch(2)
+        self.client.get(reverse("faq"))
+        self.client.get(reverse("faq"))
+        with translation.override("en"):
+            self.client.get(reverse("faq"))
+        self.client.get("/ko/missing-page/")
+
+        views, statuses = self.registry.collect()
+
+        self.assertEqual(statuses[("faq", "ko", "200")], 2)
+        self.assertEqual(statuses[("faq", "en", "200")], 1)
+        self.assertEqual(statuses[("unmatched", "ko", "404")], 1)
+        count, duration, response_bytes, db_queries, db_seconds, template_seconds = views[("faq", "ko")][:6]
+        self.assertEqual(count, 2)
+        self.assertEqual(db_queries, 4)
+        self.assertGreater(response_bytes, 0)
+        self.assertGreater(template_seconds, 0)
+        self.assertGreaterEqual(duration, template_seconds)
+
+    def test_render_prometheus_text(self) -> None:
+        """Prometheus 텍스트 형식의 히스토그램과 카운터 테스트"""
+        timings = RequestTimings()
+        timings.db_queries = 3
+        self.registry.observe("home", "ko", 200, 0.02, 1000, timings)
+        self.registry.observe("home", "ko", 200, 3.0, 1000, timings)
+
+        text = self.registry.render()
+
+        self.assertIn('http_requests_total{view="home",language="ko",status="200"} 2', text)
+        self.assertIn('http_request_duration_seconds_bucket{view="home",language="ko",le="0.01"} 0', text)
+        self.assertIn('http_request_duration_seconds_bucket{view="home",language="ko",le="0.025"} 1', text)
+        self.assertIn('http_request_duration_seconds_bucket{view="home",language="ko",le="+Inf"} 2', text)
+        self.assertIn('http_request_duration_seconds_count{view="home",language="ko"} 2', text)
+        self.assertIn('http_response_size_bytes_total{view="home",language="ko"} 2000', text)
+        self.assertIn('db_queries_total{view="home",language="ko"} 6', text)
+
+
+class MultiProcessMetricsTest(TestCase):
+    """여러 프로세스(워커)의 지표 합산 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정 (워커 pid를 흉내 내고, 모든 pid를 실행 중으로 간주)"""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+        self.pid = 100
+        self.alive = {self.pid}
+        for target, function in (("os.getpid", lambda: self.pid), ("_process_alive", lambda pid: pid in self.alive)):
+            patcher = patch(f"main.metrics.{target}", side_effect=function)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def worker(self, pid: int) -> MetricsRegistry:
+        """pid 프로세스의 지표 저장소"""
+        self.pid = pid
+        self.alive.add(pid)
+        return MetricsRegistry(self.directory, flush_interval=0)
+
+    def collect(self) -> tuple:
+        """/metrics를 처리하는 다른 워커에서 합산"""
+        return self.worker(999).collect()
+
+    def test_collect_sums_every_process_file(self) -> None:
+        """워커마다 저장한 파일을 합산하는지 테스트"""
+        for pid in (101, 102):
+            self.worker(pid).observe("home", "ko", 200, 0.1, 100, RequestTimings())
+        self.worker(103).observe("faq", "en", 404, 0.1, 100, RequestTimings())
+
+        views, statuses = self.collect()
+
+        self.assertEqual(statuses[("home", "ko", "200")], 2)
+        self.assertEqual(statuses[("faq", "en", "404")], 1)
+        self.assertEqual(views[("home", "ko")][0], 2)
+
+    def test_forked_worker_uses_own_file(self) -> None:
+        """--preload로 fork된 워커는 자기 pid의 파일을 쓰고 부모의 값을 물려받지 않는지 테스트"""
+        registry = self.worker(100)
+        registry.observe("home", "ko", 200, 0.1, 100, RequestTimings())
+
+        for pid in (201, 202):
+            self.worker(pid)
+            registry.observe("faq", "ko", 200, 0.1, 100, RequestTimings())
+
+        self.assertEqual(
+            sorted(path.name for path in self.directory.glob("*.json")),
+            ["metrics-100.json", "metrics-201.json", "metrics-202.json"],
+        )
+        _views, statuses = self.collect()
+        self.assertEqual(statuses[("home", "ko", "200")], 1)
+        self.assertEqual(statuses[("faq", "ko", "200")], 2)
+
+    def test_dead_workers_are_merged_into_aggregate(self) -> None:
+        """종료된 워커의 파일은 누적 파일에 더한 뒤 삭제하여 합계가 줄어들지 않는지 테스트"""
+        for pid in (301, 302):
+            self.worker(pid).observe("home", "ko", 200, 0.1, 100, RequestTimings())
+        self.alive.discard(301)
+
+        _views, statuses = self.collect()
+        self.assertEqual(statuses[("home", "ko", "200")], 2)
+        self.assertFalse((self.directory / "metrics-301.json").exists())
+        self.assertTrue((self.directory / "metrics-aggregate.json").exists())
+
+        # 재시작된 워커(새 pid)의 값과 누적 값을 함께 합산
+        self.alive.discard(302)
+        self.worker(303).observe("home", "ko", 200, 0.1, 100, RequestTimings())
+        views, statuses = self.collect()
+        self.assertEqual(statuses[("home", "ko", "200")], 3)
+        self.assertEqual(views[("home", "ko")][0], 3)
+        self.assertEqual(
+            sorted(path.name for path in self.directory.glob("*.json")),
+            ["metrics-303.json", "metrics-999.json", "metrics-aggregate.json"],
+        )
+
+
+class MetricsEndpointTest(MetricsTestCase):
+    """/metrics 접근 제한 테스트"""
+
+    def test_anonymous_request_is_forbidden(self) -> None:
+        """토큰이 없거나 틀리면 거부하는지 테스트"""
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 403)
+        with override_settings(METRICS_TOKEN="secret"):
+            response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_bearer_token(self) -> None:
+        """토큰으로 조회할 수 있는지 테스트"""
+        self.client.get(reverse("coc"))
+
+        response = self.client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer secret")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn('http_requests_total{view="coc",language="ko",status="200"} 1', response.content.decode())
+
+    def test_staff_user(self) -> None:
+        """스태프 사용자는 토큰 없이 조회할 수 있는지 테스트"""
+        user = get_user_model().objects.create_user("staff", password="password", is_staff=True)
+        self.client.force_login(user)
+
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 200)
+
+
+class ServerTimingMiddlewareTest(TestCase):
+    """Server-Timing 응답 헤더 테스트"""
+
+    def test_disabled_for_anonymous_requests(self) -> None:
+        """익명 요청에는 헤더를 붙이지 않는지 테스트"""
+        self.assertFalse(self.client.get(reverse("faq")).has_header("Server-Timing"))
+
+    @override_settings(SERVER_TIMING_ALWAYS=True)
+    def test_phase_breakdown(self) -> None:
+        """db/tpl/cache/view/total 단계별 시간을 보내는지 테스트"""
+        FAQFactory.create_batch(2)
+
+        header = self.client.get(reverse("faq"))["Server-Timing"]
+
+        phases = [entry.split(";")[0] for entry in header.split(", ")]
+        self.assertEqual(phases, ["db", "tpl", "cache", "view", "total"])
+        self.assertRegex(
+            header, r'^db;dur=\d+\.\d;desc="2 queries", tpl;dur=\d+\.\d, cache;dur=\d+\.\d;desc="\d+ calls"'
+        )
+
+    def test_template_time_excludes_queries(self) -> None:
+        """렌더링 중에 실행된 SQL 쿼리 시간은 tpl이 아닌 db에만 기록되는지 테스트"""
+
+        def slow_execute(execute, sql, params, many, context):
+            time.sleep(0.05)
+            return execute(sql, params, many, context)
+
+        def run_query() -> int:
+            with connection.execute_wrapper(slow_execute):
+                return get_user_model().objects.count()
+
+        template = engines["django"].from_string("{{ run_query }}")
+        with track_request() as timings:
+            template.render({"run_query": run_query})
+
+        self.assertEqual(timings.db_queries, 1)
+        self.assertGreaterEqual(timings.db_seconds, 0.05)
+        self.assertLess(timings.template_seconds, 0.05)
+
+    @override_settings(SERVER_TIMING_TOKEN="secret")
+    def test_debug_header_token(self) -> None:
+        """토큰이 맞는 X-Server-Timing 헤더가 있을 때만 붙이는지 테스트"""
+        self.assertTrue(self.client.get(reverse("coc"), HTTP_X_SERVER_TIMING="secret").has_header("Server-Timing"))
+        self.assertFalse(self.client.get(reverse("coc"), HTTP_X_SERVER_TIMING="wrong").has_header("Server-Timing"))
+
+    def test_staff_user(self) -> None:
+        """스태프 사용자에게는 헤더를 붙이는지 테스트"""
+        user = get_user_model().objects.create_user("staff", password="password", is_staff=True)
+        self.client.force_login(user)
+
+        self.assertTrue(self.client.get(reverse("coc")).has_header("Server-Timing"))
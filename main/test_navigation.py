@@ -0,0 +1,130 @@
+"""
+이벤트 탐색 정보 테스트
+"""
+
+from datetime import timedelta
+from importlib import import_module
+
+from django.apps import apps
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Activity, ActivityNavigation
+from .navigation import get_navigation, refresh_navigation
+from .test_factories import ActivityFactory
+
+
+class ActivityNavigationTest(TestCase):
+    """미리 계산된 이전/다음, 관련 이벤트 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        now = timezone.now()
+        self.first = ActivityFactory.create(activity_type="seminar", start_datetime=now + timedelta(days=1))
+        self.second = ActivityFactory.create(activity_type="workshop", start_datetime=now + timedelta(days=2))
+        self.third = ActivityFactory.create(activity_type="seminar", start_datetime=now + timedelta(days=3))
+        self.study_group = ActivityFactory.create_study_group()
+
+    def navigation(self, activity: Activity) -> tuple:
+        """(이전 id, 다음 id, 관련 id 목록)"""
+        row = ActivityNavigation.objects.get(activity=activity)
+        return row.previous_id, row.next_id, row.related_ids
+
+    def all_navigation(self) -> dict:
+        """활동 id별 (이전 id, 다음 id, 관련 id 목록)"""
+        rows = ActivityNavigation.objects.all()
+        return {row.activity_id: (row.previous_id, row.next_id, row.related_ids) for row in rows}
+
+    def assert_matches_full_rebuild(self) -> None:
+        """증분 갱신 결과가 처음부터 다시 계산한 결과와 같은지 확인"""
+        incremental = self.all_navigation()
+        ActivityNavigation.objects.all().delete()
+        refresh_navigation(Activity.objects.filter(is_public=True).values_list("id", flat=True))
+        rebuilt = self.all_navigation()
+
+        for pk, row in incremental.items():
+            if Activity.objects.filter(pk=pk, is_public=True).exists():
+                self.assertEqual(row, rebuilt[pk])
+
+    def test_chronological_neighbours(self) -> None:
+        """시작 일시 순서로 이전/다음 이벤트가 연결되는지 테스트"""
+        self.assertEqual(self.navigation(self.first)[:2], (None, self.second.id))
+        self.assertEqual(self.navigation(self.second)[:2], (self.first.id, self.third.id))
+        self.assertEqual(self.navigation(self.third)[:2], (self.second.id, None))
+        self.assertEqual(self.navigation(self.study_group)[:2], (None, None))
+
+    def test_related_activities_of_same_type(self) -> None:
+        """같은 유형의 다른 공개 활동이 최신 순으로 연결되는지 테스트"""
+        self.assertEqual(self.navigation(self.first)[2], [self.third.id])
+        self.assertEqual(self.navigation(self.second)[2], [])
+
+    def test_moving_an_event_relinks_neighbours(self) -> None:
+        """시작 일시가 바뀌면 이전/새 이웃이 모두 갱신되는지 테스트"""
+        self.first.start_datetime = self.third.start_datetime + timedelta(days=1)
+        self.first.save()
+
+        self.assertEqual(self.navigation(self.second)[:2], (None, self.third.id))
+        self.assertEqual(self.navigation(self.third)[:2], (self.second.id, self.first.id))
+        self.assertEqual(self.navigation(self.first)[:2], (self.third.id, None))
+        self.assert_matches_full_rebuild()
+
+    def test_hiding_and_deleting_relinks_neighbours(self) -> None:
+        """비공개 전환과 삭제 시 이웃과 관련 목록에서 빠지는지 테스트"""
+        self.second.is_public = False
+        self.second.save()
+        self.assertEqual(self.navigation(self.first)[:2], (None, self.third.id))
+
+        self.third.delete()
+        self.assertEqual(self.navigation(self.first), (None, None, []))
+        self.assert_matches_full_rebuild()
+
+    def test_changing_type_updates_related_lists(self) -> None:
+        """유형이 바뀌면 이전 유형과 새 유형의 관련 목록이 모두 갱신되는지 테스트"""
+        self.third.activity_type = "workshop"
+        self.third.save()
+
+        self.assertEqual(self.navigation(self.first)[2], [])
+        self.assertEqual(self.navigation(self.second)[2], [self.third.id])
+        self.assert_matches_full_rebuild()
+
+    def test_missing_navigation_is_computed_lazily(self) -> None:
+        """탐색 정보가 없으면 처음 조회할 때 계산되는지 테스트"""
+        ActivityNavigation.objects.all().delete()
+        event = Activity.objects.get(pk=self.second.pk)
+
+        navigation = get_navigation(event)
+        self.assertEqual((navigation.previous, navigation.next), (self.first, self.third))
+
+    def test_migration_backfills_existing_activities(self) -> None:
+        """데이터 마이그레이션이 시그널로 계산한 것과 같은 탐색 정보를 채우는지 테스트"""
+        hidden = ActivityFactory.create(activity_type="seminar", is_public=False)
+        expected = {
+            row.activity_id: (row.previous_id, row.next_id, row.related_ids) for row in ActivityNavigation.objects.all()
+        }
+        ActivityNavigation.objects.all().delete()
+
+        import_module("main.migrations.0008_backfill_activity_navigation").backfill_navigation(apps, None)
+
+        rows = {
+            row.activity_id: (row.previous_id, row.next_id, row.related_ids) for row in ActivityNavigation.objects.all()
+        }
+        self.assertEqual(rows, expected)
+        self.assertNotIn(hidden.pk, rows)
+
+    def test_event_detail_uses_navigation(self) -> None:
+        """상세 페이지가 미리 계산된 탐색 정보로 렌더링되는지 테스트"""
+        response = self.client.get(reverse("event_detail", args=[self.first.id]))
+
+        self.assertEqual(response.context["next_event"], self.second)
+        self.assertIsNone(response.context["previous_event"])
+        self.assertEqual(response.context["related_events"], [self.third])
+        self.assertContains(response, reverse("event_detail", args=[self.second.id]))
+
+    def test_event_detail_navigation_titles_in_both_languages(self) -> None:
+        """이전/다음 이벤트 제목을 한국어와 영어로 모두 출력하는지 테스트"""
+        response = self.client.get(reverse("event_detail", args=[self.second.id]))
+
+        for kind, event in (("previous", self.first), ("next", self.third)):
+            self.assertContains(response, f'id="{kind}-title-ko">{event.title_ko}</span>')
+            self.assertContains(response, f'id="{kind}-title-en">{event.title_en}</span>')
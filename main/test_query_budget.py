@@ -0,0 +1,73 @@
+"""
+뷰별 쿼리 수 제한 테스트
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from . import urls, views
+from .models import ActivityNavigation, ActivityPublication, LinkType
+from .query_budget import QueryBudgetExceeded
+from .test_factories import (
+    ActivityFactory,
+    ContributionOpportunityFactory,
+    FAQFactory,
+    OrganizerFactory,
+    SocialMediaPlatformFactory,
+)
+from .test_utils import QueryBudgetTestMixin
+
+
+class QueryBudgetTest(QueryBudgetTestMixin, TestCase):
+    """대규모 데이터에서 모든 페이지가 쿼리 예산을 지키는지 테스트"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """테스트 데이터 설정 (페이지 크기보다 많은 활동과 게시물)"""
+        now = timezone.now()
+        platforms = SocialMediaPlatformFactory.create_batch(3, link_type=LinkType.PUBLICATION_PLATFORM)
+        activity_types = ["seminar", "workshop", "meetup", "networking"]
+        activities = [
+            ActivityFactory.create(
+                start_datetime=now + timedelta(days=day), activity_type=activity_types[day % len(activity_types)]
+            )
+            for day in range(-40, 40, 2)
+        ]
+        activities += [ActivityFactory.create_study_group() for _ in range(5)]
+        ActivityFactory.create_batch(5, is_public=False)
+        ActivityPublication.objects.bulk_create(
+            ActivityPublication(activity=activity, platform=platform, publication_url="https://example.com/post")
+            for activity in activities
+            for platform in platforms
+        )
+        OrganizerFactory.create_batch(20)
+        FAQFactory.create_batch(30)
+        ContributionOpportunityFactory.create_batch(10)
+        cls.event = activities[len(activities) // 2]
+
+    def test_all_urls_within_budget(self) -> None:
+        """`main.urls`의 모든 URL이 예산 안에서 응답하는지 테스트"""
+        self.assert_urls_within_budget(urls.urlpatterns, {"event_detail": {"event_id": self.event.id}})
+
+    def test_middleware_reports_offending_queries(self) -> None:
+        """예산을 넘으면 미들웨어가 실행된 SQL과 함께 예외를 발생시키는지 테스트"""
+        with patch.object(views.faq, "query_budget", 1):
+            with self.assertRaises(QueryBudgetExceeded) as raised:
+                self.client.get(reverse("faq"))
+
+        message = str(raised.exception)
+        self.assertIn("faq ran 2 queries (budget 1)", message)
+        self.assertIn('FROM "main_faq"', message)
+
+    def test_lazy_navigation_is_exempt(self) -> None:
+        """탐색 정보를 처음 계산하는 상세 페이지 요청도 예산 안에서 응답하는지 테스트"""
+        ActivityNavigation.objects.filter(activity=self.event).delete()
+
+        response = self.client.get(reverse("event_detail", args=[self.event.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(ActivityNavigation.objects.filter(activity=self.event).exists())
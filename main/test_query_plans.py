@@ -0,0 +1,69 @@
+"""
+공개 페이지 쿼리 실행 계획 테스트
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import Activity
+from .test_factories import (
+    ActivityFactory,
+    ContributionOpportunityFactory,
+    FAQFactory,
+    OrganizerFactory,
+    SocialMediaPlatformFactory,
+)
+from .test_utils import QueryPlanTestMixin
+
+
+class ViewQueryPlanTest(QueryPlanTestMixin, TestCase):
+    """`main.views`의 쿼리가 인덱스를 사용하는지 테스트"""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """테스트 데이터 설정"""
+        now = timezone.now()
+        for days in (-14, -7, 7, 14):
+            ActivityFactory.create(start_datetime=now + timedelta(days=days), activity_type="workshop")
+        ActivityFactory.create(start_datetime=now + timedelta(days=3), is_public=False)
+        ActivityFactory.create_study_group()
+        OrganizerFactory.create_batch(2)
+        OrganizerFactory.create(is_public=False)
+        FAQFactory.create_batch(3)
+        ContributionOpportunityFactory.create_batch(2)
+        SocialMediaPlatformFactory.create_batch(2)
+        SocialMediaPlatformFactory.create(is_active=False)
+        cls.event = Activity.objects.filter(is_public=True, start_datetime__isnull=False).first()
+
+    def test_list_pages(self) -> None:
+        """홈, 기여하기, FAQ 페이지 테스트"""
+        for url_name in ("home", "contribute", "faq"):
+            with self.subTest(url_name=url_name), self.assert_indexed_queries() as queries:
+                self.assertEqual(self.client.get(reverse(url_name)).status_code, 200)
+            self.assertTrue(queries.captured_queries)
+
+    def test_events_list_pages(self) -> None:
+        """이벤트 목록 첫 페이지와 다음 페이지 테스트"""
+        with patch("main.views.EVENTS_PAGE_SIZE", 2):
+            with self.assert_indexed_queries():
+                response = self.client.get(reverse("events_list"))
+            self.assertIsNotNone(response.context["next_cursor"])
+
+            with self.assert_indexed_queries():
+                response = self.client.get(reverse("events_list"), {"cursor": response.context["next_cursor"]})
+            self.assertEqual(response.status_code, 200)
+
+    def test_event_detail(self) -> None:
+        """이벤트 상세 페이지 테스트"""
+        with self.assert_indexed_queries():
+            self.assertEqual(self.client.get(reverse("event_detail", args=[self.event.id])).status_code, 200)
+
+    def test_detects_full_scan(self) -> None:
+        """인덱스가 없는 조건과 정렬을 찾아내는지 테스트"""
+        with self.assertRaisesMessage(AssertionError, "USE TEMP B-TREE FOR ORDER BY"):
+            with self.assert_indexed_queries():
+                list(Activity.objects.filter(title_ko="파이썬 세미나").order_by("title_en"))
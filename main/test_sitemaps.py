@@ -0,0 +1,101 @@
+"""
+사이트맵 테스트
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from .sitemaps import SITEMAPS
+from .test_caching import CacheTestCase
+from .test_factories import ActivityFactory, FAQFactory
+
+
+class SitemapTest(TestCase):
+    """사이트맵 내용 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.activity = ActivityFactory.create()
+        self.hidden = ActivityFactory.create(is_public=False)
+
+    def test_index_lists_sections(self) -> None:
+        """인덱스에 섹션별 사이트맵이 lastmod와 함께 포함되는지 테스트"""
+        content = self.client.get(reverse("sitemap")).content.decode()
+
+        self.assertIn("<loc>http://testserver/sitemap-pages.xml</loc>", content)
+        self.assertIn("<loc>http://testserver/sitemap-events.xml</loc>", content)
+        self.assertEqual(content.count("<lastmod>"), 2)
+
+    def test_events_section_has_every_language_with_alternates(self) -> None:
+        """공개 이벤트가 언어별 URL과 hreflang 대체 링크로 포함되는지 테스트"""
+        response = self.client.get(reverse("sitemap_section", args=["events"]))
+        content = response.content.decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(f"<loc>http://testserver/ko/events/{self.activity.id}/</loc>", content)
+        self.assertIn(f"<loc>http://testserver/en/events/{self.activity.id}/</loc>", content)
+        self.assertIn(f'hreflang="en" href="http://testserver/en/events/{self.activity.id}/"', content)
+        self.assertIn('hreflang="x-default"', content)
+        self.assertIn(f"<lastmod>{self.activity.modified.date().isoformat()}</lastmod>", content)
+        self.assertNotIn(f"/events/{self.hidden.id}/", content)
+
+    def test_pages_section(self) -> None:
+        """목록/안내 페이지가 포함되는지 테스트"""
+        content = self.client.get(reverse("sitemap_section", args=["pages"])).content.decode()
+
+        for path in ("/ko/", "/en/events/", "/ko/faq/", "/en/coc/"):
+            self.assertIn(f"<loc>http://testserver{path}</loc>", content)
+
+    def test_large_section_is_split_into_pages(self) -> None:
+        """항목이 limit보다 많으면 인덱스가 여러 파일을 가리키는지 테스트"""
+        ActivityFactory.create()
+
+        with patch.object(SITEMAPS["events"], "limit", 1):
+            index = self.client.get(reverse("sitemap")).content.decode()
+            second = self.client.get(reverse("sitemap_section", args=["events"]), {"p": 2})
+
+        self.assertIn("sitemap-events.xml?p=2", index)
+        self.assertEqual(second.status_code, 200)
+
+    def test_unknown_section(self) -> None:
+        """존재하지 않는 섹션은 404를 반환하는지 테스트"""
+        self.assertEqual(self.client.get(reverse("sitemap_section", args=["unknown"])).status_code, 404)
+
+
+class SitemapCacheTest(CacheTestCase):
+    """사이트맵 캐시 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        super().setUp()
+        self.activity = ActivityFactory.create(is_public=False)
+        self.url = reverse("sitemap_section", args=["events"])
+
+    def test_section_is_rebuilt_only_when_its_content_changes(self) -> None:
+        """관련 없는 모델 변경에는 캐시를 유지하고 활동 변경 시에만 다시 생성하는지 테스트"""
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            FAQFactory.create()
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.activity.is_public = True
+            self.activity.save()
+        self.assertIn(f"/events/{self.activity.id}/", self.client.get(self.url).content.decode())
+
+    def test_index_is_rebuilt_when_content_changes(self) -> None:
+        """콘텐츠가 바뀌면 인덱스의 섹션별 lastmod도 다시 생성되는지 테스트"""
+        index_url = reverse("sitemap")
+        before = self.client.get(index_url).content
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(index_url).content, before)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.activity.is_public = True
+            self.activity.save()
+        self.assertNotEqual(self.client.get(index_url).content, before)
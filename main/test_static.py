@@ -0,0 +1,97 @@
+"""
+정적 파일 스토리지와 제공 미들웨어 테스트
+"""
+
+import gzip
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from .middleware import IMMUTABLE_CACHE_CONTROL, STATIC_CACHE_CONTROL
+
+CSS = "body { background: url('../img/logo.svg'); }\n" + ".card { margin: 0 auto; padding: 1rem; }\n" * 20
+SVG = '<svg xmlns="http://www.w3.org/2000/svg"><rect width="10" height="10"/></svg>'
+
+
+class StaticFilesTestCase(TestCase):
+    """임시 정적 파일 디렉터리와 내용 해시 스토리지로 collectstatic을 실행하는 테스트 기본 클래스"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        source = tempfile.TemporaryDirectory()
+        target = tempfile.TemporaryDirectory()
+        self.addCleanup(source.cleanup)
+        self.addCleanup(target.cleanup)
+        (Path(source.name) / "css").mkdir()
+        (Path(source.name) / "img").mkdir()
+        (Path(source.name) / "css" / "site.css").write_text(CSS)
+        (Path(source.name) / "img" / "logo.svg").write_text(SVG)
+
+        self.root = Path(target.name)
+        settings_override = override_settings(
+            STATIC_ROOT=target.name,
+            STATICFILES_DIRS=[source.name],
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+            STORAGES={
+                **settings.STORAGES,
+                "staticfiles": {"BACKEND": "main.storage.CompressedManifestStaticFilesStorage"},
+            },
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+
+class CompressedManifestStorageTest(StaticFilesTestCase):
+    """내용 해시와 사전 압축본 테스트"""
+
+    def test_hashed_files_are_precompressed(self) -> None:
+        """해시 파일명으로 저장되고 충분히 큰 텍스트 파일만 .gz 압축본이 생기는지 테스트"""
+        css = staticfiles_storage.stored_name("css/site.css")
+        svg = staticfiles_storage.stored_name("img/logo.svg")
+
+        self.assertRegex(css, r"^css/site\.[0-9a-f]{12}\.css$")
+        hashed_css = (self.root / css).read_bytes()
+        self.assertIn(svg.split("/")[-1].encode(), hashed_css)
+        self.assertEqual(gzip.decompress((self.root / (css + ".gz")).read_bytes()), hashed_css)
+        self.assertFalse((self.root / (svg + ".gz")).exists())
+        self.assertFalse((self.root / "css" / "site.css.gz").exists())
+
+
+@override_settings(SERVE_STATIC=True)
+class StaticFilesMiddlewareTest(StaticFilesTestCase):
+    """nginx 없이 정적 파일을 제공하는 미들웨어 테스트"""
+
+    def test_serves_precompressed_hashed_file(self) -> None:
+        """gzip을 허용하면 압축본을, 해시 파일에는 immutable 캐시를 적용하는지 테스트"""
+        url = staticfiles_storage.url("css/site.css")
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="br;q=0, gzip")
+        content = b"".join(response.streaming_content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Content-Type"], "text/css")
+        self.assertEqual(response["Cache-Control"], IMMUTABLE_CACHE_CONTROL)
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertIn(b".card", gzip.decompress(content))
+
+    def test_serves_plain_file_without_accept_encoding(self) -> None:
+        """압축을 허용하지 않으면 원본을, 해시가 없는 이름에는 짧은 캐시를 적용하는지 테스트"""
+        response = self.client.get("/static/css/site.css")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(b"".join(response.streaming_content).decode(), CSS)
+        self.assertEqual(response["Cache-Control"], STATIC_CACHE_CONTROL)
+
+        not_modified = self.client.get("/static/css/site.css", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_missing_and_unsafe_paths(self) -> None:
+        """없는 파일과 STATIC_ROOT 밖의 경로는 제공하지 않는지 테스트"""
+        self.assertEqual(self.client.get("/static/css/missing.css").status_code, 404)
+        self.assertEqual(self.client.get("/static/../manage.py").status_code, 404)
@@ -0,0 +1,42 @@
+"""
+백그라운드 작업 테스트
+"""
+
+import threading
+from typing import Any
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from .static_export import ExportResult
+from .tasks import schedule_static_export
+
+
+class StaticExportTaskTest(TestCase):
+    """정적 페이지 내보내기 작업 테스트"""
+
+    def test_queued_runs_are_coalesced(self) -> None:
+        """실행 중에 여러 번 예약하면 대기 중인 실행 하나로 합쳐지는지 테스트"""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def export(**kwargs: Any) -> ExportResult:
+            calls.append(kwargs)
+            started.set()
+            release.wait(5)
+            return ExportResult([], [], 0)
+
+        with patch("main.tasks.export_site", side_effect=export):
+            running = schedule_static_export()
+            self.assertTrue(started.wait(5))
+
+            queued = schedule_static_export()
+            self.assertIsNot(queued, running)
+            self.assertIs(schedule_static_export(), queued)
+
+            release.set()
+            running.result(5)
+            queued.result(5)
+
+        self.assertEqual(len(calls), 2)
@@ -0,0 +1,75 @@
+"""
+언어별 템플릿 로더 테스트
+"""
+
+from django.template import Context, Engine, Template, engines
+from django.template.defaulttags import IfNode
+from django.test import TestCase
+from django.utils import translation
+
+from .template_loaders import LanguageFoldingLoader
+
+TEMPLATES = {
+    "page.html": "{% if LANGUAGE_CODE == 'ko' %}안녕하세요{% else %}Hello{% endif %}",
+    "mixed.html": "{% if LANGUAGE_CODE == 'en' %}A{% elif flag %}B{% else %}C{% endif %}",
+    "nested.html": (
+        "{% for item in items %}{% if flag %}"
+        "{% if not LANGUAGE_CODE != 'ko' and flag %}{{ item }}{% endif %}"
+        "{% if LANGUAGE_CODE == 'en' or 'ko' == LANGUAGE_CODE %}!{% endif %}"
+        "{% endif %}{% endfor %}"
+    ),
+}
+
+
+class LanguageFoldingLoaderTest(TestCase):
+    """언어 분기 접기 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.engine = Engine(
+            loaders=[
+                (
+                    "main.template_loaders.LanguageFoldingLoader",
+                    [("django.template.loaders.locmem.Loader", TEMPLATES)],
+                )
+            ]
+        )
+
+    def get_template(self, name: str, language: str) -> Template:
+        """지정한 언어로 템플릿 로드"""
+        with translation.override(language):
+            return self.engine.get_template(name)
+
+    def test_language_branches_are_removed(self) -> None:
+        """언어 분기가 제거되고 언어별로 다른 템플릿이 캐시되는지 테스트"""
+        korean = self.get_template("page.html", "ko")
+        english = self.get_template("page.html", "en")
+
+        self.assertIsNot(korean, english)
+        self.assertIs(self.get_template("page.html", "ko"), korean)
+        self.assertEqual(korean.nodelist.get_nodes_by_type(IfNode), [])
+        self.assertEqual(korean.render(Context()), "안녕하세요")
+        self.assertEqual(english.render(Context()), "Hello")
+
+    def test_other_conditions_are_kept(self) -> None:
+        """언어와 무관한 조건은 유지되는지 테스트"""
+        template = self.get_template("mixed.html", "ko")
+
+        (if_node,) = template.nodelist.get_nodes_by_type(IfNode)
+        self.assertEqual(len(if_node.conditions_nodelists), 2)
+        self.assertEqual(template.render(Context({"flag": True})), "B")
+        self.assertEqual(template.render(Context({"flag": False})), "C")
+        self.assertEqual(self.get_template("mixed.html", "en").render(Context({"flag": True})), "A")
+
+    def test_nested_and_compound_conditions(self) -> None:
+        """중첩된 태그와 not/and/or 조건도 올바르게 접히는지 테스트"""
+        for language, expected in (("ko", "1!2!"), ("en", "!!")):
+            with self.subTest(language=language):
+                # 접히지 않고 남은 조건은 컨텍스트 프로세서가 넣어 주는 LANGUAGE_CODE로 평가됨
+                context = Context({"items": [1, 2], "flag": True, "LANGUAGE_CODE": language})
+                self.assertEqual(self.get_template("nested.html", language).render(context), expected)
+
+    def test_site_templates_use_folding_loader(self) -> None:
+        """사이트 템플릿 엔진이 언어별 로더를 사용하는지 테스트"""
+        loaders = engines["django"].engine.template_loaders  # type: ignore[attr-defined]
+        self.assertIsInstance(loaders[0], LanguageFoldingLoader)
@@ -2,14 +2,21 @@
 테스트 유틸리티 및 공통 기능
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List
+import re
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.http import HttpResponse
 from django.test import Client
-from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import translation
 
 from .models import FAQ, Activity, Organizer, SocialMediaPlatform
+from .query_budget import budget_report, get_query_budget
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User as AuthUserType
@@ -194,6 +201,62 @@ class PerformanceTestMixin:
         )
 
 
+# 인덱스 없이 테이블 전체를 읽는 단계 ("SCAN main_faq")와 인덱스 순서로 정렬하지 못한 단계
+FULL_SCAN_PLAN_RE = re.compile(r"^SCAN (?!CONSTANT ROW)\S+( AS \S+)?$")
+TEMP_SORT_PLAN = "USE TEMP B-TREE"
+
+
+def explain_query_plan(sql: str) -> List[str]:
+    """SQLite `EXPLAIN QUERY PLAN` 결과의 단계별 설명"""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[-1] for row in cursor.fetchall()]
+
+
+class QueryPlanTestMixin:
+    """쿼리 실행 계획 테스트를 위한 믹스인"""
+
+    @contextmanager
+    def assert_indexed_queries(self) -> Iterator[CaptureQueriesContext]:
+        """블록 안에서 실행된 SELECT가 테이블 전체 스캔이나 임시 B-트리 정렬 없이 실행되는지 테스트"""
+        with CaptureQueriesContext(connection) as context:
+            yield context
+
+        if connection.vendor != "sqlite":
+            return
+        slow_queries = []
+        for query in context.captured_queries:
+            if not query["sql"].startswith("SELECT"):
+                continue
+            plan = explain_query_plan(query["sql"])
+            if any(FULL_SCAN_PLAN_RE.match(step) or TEMP_SORT_PLAN in step for step in plan):
+                slow_queries.append("\n".join([query["sql"], *(f"  -> {step}" for step in plan)]))
+
+        self.assertFalse(slow_queries, "인덱스를 사용하지 않는 쿼리가 있습니다:\n\n" + "\n\n".join(slow_queries))
+
+
+class QueryBudgetTestMixin:
+    """뷰별 쿼리 수 제한 테스트를 위한 믹스인"""
+
+    def assert_urls_within_budget(
+        self, urlpatterns: Sequence[URLPattern], url_kwargs: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """모든 URL의 뷰에 쿼리 예산이 지정되어 있고, 모든 언어에서 예산 안에서 응답하는지 테스트"""
+        for pattern in urlpatterns:
+            budget = get_query_budget(pattern.callback)
+            self.assertIsNotNone(budget, f"{pattern.name} 뷰에 query_budget이 지정되지 않았습니다.")
+
+            for language, _name in settings.LANGUAGES:
+                with self.subTest(url_name=pattern.name, language=language), translation.override(language):
+                    url = reverse(pattern.name, kwargs=(url_kwargs or {}).get(pattern.name))
+                    with CaptureQueriesContext(connection) as context:
+                        response = self.client.get(url)
+
+                    self.assertEqual(response.status_code, 200)
+                    queries = [(query["sql"], ()) for query in context.captured_queries]
+                    self.assertLessEqual(len(queries), budget, budget_report(pattern.name, budget, queries))
+
+
 class SecurityTestMixin:
     """보안 테스트를 위한 믹스인"""
 
@@ -2,11 +2,16 @@
 뷰 레이어 테스트
 """
 
+from datetime import timedelta
+from unittest.mock import patch
+
 from django.http import HttpResponse
 from django.test import Client, TestCase
 from django.urls import reverse
+from django.utils import timezone
 
 from .test_factories import (
+    ActivityFactory,
     ContributionOpportunityFactory,
     FAQFactory,
     SocialMediaPlatformFactory,
@@ -246,6 +251,17 @@ class COCViewTest(TestCase):
         self.assertIn("inappropriate_content_ko", coc_info)
         self.assertIn("inappropriate_content_en", coc_info)
 
+    def test_coc_view_uses_precomputed_html(self) -> None:
+        """CoC 마크다운이 요청마다 변환되지 않고 미리 변환된 값을 쓰는지 테스트"""
+        from .views import RENDERED_CODE_OF_CONDUCT
+
+        response: HttpResponse = self.client.get(self.url)
+        coc_info = response.context["coc_info"]
+
+        self.assertIs(coc_info, RENDERED_CODE_OF_CONDUCT)
+        self.assertIn("<strong>", coc_info["community_content_ko"])
+        self.assertNotIn("**", coc_info["community_content_en"])
+
     def test_coc_view_content(self) -> None:
         """CoC 페이지 컨텐츠 테스트"""
         response: HttpResponse = self.client.get(self.url)
@@ -256,6 +272,69 @@ class COCViewTest(TestCase):
         self.assertIn("Code of Conduct", content)
 
 
+class EventsListViewTest(TestCase):
+    """이벤트 목록 뷰 테스트"""
+
+    def setUp(self) -> None:
+        """테스트 설정"""
+        self.client = Client()
+        self.url = reverse("events_list")
+
+        # 같은 시작 일시를 가진 이벤트와 시작 일시가 없는 스터디그룹을 섞어 생성
+        start = timezone.now()
+        self.events = [ActivityFactory.create(start_datetime=start - timedelta(days=i // 2)) for i in range(8)]
+        self.study_groups = [ActivityFactory.create_study_group() for _ in range(3)]
+        ActivityFactory.create(is_public=False)
+
+    def collect_pages(self) -> list:
+        """다음 페이지 커서를 따라가며 모든 이벤트 수집"""
+        collected = []
+        cursor = None
+        while True:
+            response: HttpResponse = self.client.get(self.url, {"cursor": cursor} if cursor else {})
+            self.assertEqual(response.status_code, 200)
+            collected.extend(response.context["events"])
+            cursor = response.context["next_cursor"]
+            if cursor is None:
+                return collected
+
+    def test_events_list_paginates_without_duplicates(self) -> None:
+        """페이지를 넘겨도 중복이나 누락 없이 정렬 순서대로 조회되는지 테스트"""
+        with patch("main.views.EVENTS_PAGE_SIZE", 3):
+            collected = self.collect_pages()
+
+        expected = sorted(self.events, key=lambda event: (event.start_datetime, event.id), reverse=True)
+        expected += sorted(self.study_groups, key=lambda event: event.id, reverse=True)
+        self.assertEqual([event.id for event in collected], [event.id for event in expected])
+
+    def test_events_list_next_page_link(self) -> None:
+        """다음 페이지가 있을 때만 더 보기 링크가 표시되는지 테스트"""
+        with patch("main.views.EVENTS_PAGE_SIZE", 10):
+            first = self.client.get(self.url)
+            second = self.client.get(self.url, {"cursor": first.context["next_cursor"]})
+
+        self.assertContains(first, 'rel="next"')
+        self.assertNotContains(second, 'rel="next"')
+        self.assertEqual(len(second.context["events"]), 1)
+
+    def test_events_list_htmx_returns_next_batch_only(self) -> None:
+        """HTMX 요청에는 카드 묶음과 다음 묶음 센티널만 응답하는지 테스트"""
+        with patch("main.views.EVENTS_PAGE_SIZE", 3):
+            first = self.client.get(self.url)
+            response = self.client.get(self.url, {"cursor": first.context["next_cursor"]}, HTTP_HX_REQUEST="true")
+
+        self.assertTemplateUsed(response, "components/event_list_page.html")
+        self.assertTemplateNotUsed(response, "events_list.html")
+        self.assertNotContains(response, "<html")
+        self.assertContains(response, 'hx-trigger="revealed"')
+        self.assertEqual(len(response.context["events"]), 3)
+
+    def test_events_list_invalid_cursor(self) -> None:
+        """잘못된 커서는 400을 반환하는지 테스트"""
+        response: HttpResponse = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+
+
 class ViewIntegrationTest(TestCase):
     """뷰 통합 테스트"""
 
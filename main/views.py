@@ -1,12 +1,34 @@
 import re
+from datetime import datetime
 from typing import Any, Dict, Optional
 
-from django.db.models import QuerySet
+from django.core.exceptions import BadRequest
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
-
-from .models import FAQ, Activity, ContributionOpportunity, Organizer, SocialMediaPlatform
+from django.utils.safestring import mark_safe
+
+from .caching import (
+    ACTIVITIES,
+    FAQS,
+    LAYOUT,
+    OPPORTUNITIES,
+    ORGANIZERS,
+    activity_namespace,
+    activity_type_namespace,
+    add_page_dependencies,
+    cache_public_page,
+    conditional_page,
+    set_page_cache_expiry,
+)
+from .models import FAQ, Activity, ContributionOpportunity, Organizer
+from .navigation import get_navigation, get_related_activities
+from .pagination import InvalidCursor, paginate
+from .query_budget import query_budget
+
+# 이벤트 목록 페이지 크기와 정렬 (시작 일시가 없는 스터디그룹은 마지막)
+EVENTS_PAGE_SIZE = 12
+EVENTS_ORDERING = ("-start_datetime", "-id")
 
 # 커뮤니티 상수 정보
 COMMUNITY_INFO: Dict[str, str] = {
@@ -184,17 +206,6 @@ CODE_OF_CONDUCT: Dict[str, str] = {
 }
 
 
-def get_social_media_platforms() -> QuerySet[SocialMediaPlatform]:
-    """활성화된 소셜 미디어 플랫폼 조회"""
-    return SocialMediaPlatform.objects.filter(is_active=True).order_by("order")
-
-
-def get_discord_url() -> Optional[str]:
-    """Discord URL 조회"""
-    discord_platform = SocialMediaPlatform.objects.filter(name_en__icontains="discord", is_active=True).first()
-    return discord_platform.url if discord_platform else None
-
-
 def convert_markdown_to_html(text: str) -> str:
     """간단한 마크다운을 HTML로 변환"""
     # **굵게** -> <strong>굵게</strong>
@@ -206,6 +217,40 @@ def convert_markdown_to_html(text: str) -> str:
     return text
 
 
+# 마크다운 변환이 필요한 행동 강령 필드들
+CODE_OF_CONDUCT_MARKDOWN_FIELDS = (
+    "community_content_ko",
+    "community_content_en",
+    "inappropriate_content_ko",
+    "inappropriate_content_en",
+)
+
+
+def render_code_of_conduct() -> Dict[str, str]:
+    """행동 강령의 마크다운 필드를 HTML로 변환한 사본 생성"""
+    rendered = CODE_OF_CONDUCT.copy()
+    for field in CODE_OF_CONDUCT_MARKDOWN_FIELDS:
+        rendered[field] = mark_safe(convert_markdown_to_html(CODE_OF_CONDUCT[field]))
+    return rendered
+
+
+# 행동 강령은 프로세스 실행 중 변하지 않으므로 임포트 시 한 번만 변환
+RENDERED_CODE_OF_CONDUCT: Dict[str, str] = render_code_of_conduct()
+
+
+def last_home_transition(request: HttpRequest) -> Optional[datetime]:
+    """홈페이지의 다가오는/지난 이벤트 구분이 마지막으로 바뀐 시각 (가장 최근에 시작된 이벤트)"""
+    return (
+        Activity.objects.filter(is_public=True, start_datetime__lt=timezone.now())
+        .order_by("-start_datetime")
+        .values_list("start_datetime", flat=True)
+        .first()
+    )
+
+
+@query_budget(5)
+@conditional_page(last_change=last_home_transition)
+@cache_public_page(LAYOUT, ACTIVITIES, ORGANIZERS)
 def home(request: HttpRequest) -> HttpResponse:
     """홈페이지"""
     now = timezone.now()
@@ -218,6 +263,10 @@ def home(request: HttpRequest) -> HttpResponse:
         "start_datetime"
     )[:6]
 
+    # 가장 가까운 이벤트가 시작되면 "지난 이벤트"로 넘어가므로 그때까지만 캐시
+    if upcoming_events:
+        set_page_cache_expiry(request, upcoming_events[0].start_datetime)
+
     # 지난 이벤트 (현재 시간 이전에 끝난 이벤트)
     past_events = Activity.objects.filter(
         is_public=True,
@@ -228,8 +277,6 @@ def home(request: HttpRequest) -> HttpResponse:
 
     context: Dict[str, Any] = {
         "community_info": COMMUNITY_INFO,
-        "social_platforms": get_social_media_platforms(),
-        "discord_url": get_discord_url(),
         "upcoming_events": upcoming_events,
         "past_events": past_events,
         "organizers": Organizer.objects.filter(is_public=True)[:6],
@@ -237,118 +284,86 @@ def home(request: HttpRequest) -> HttpResponse:
     return render(request, "index.html", context)
 
 
+@query_budget(2)
+@conditional_page()
+@cache_public_page(LAYOUT, OPPORTUNITIES)
 def contribute(request: HttpRequest) -> HttpResponse:
     """기여하기 페이지"""
     context: Dict[str, Any] = {
         "community_info": COMMUNITY_INFO,
-        "social_platforms": get_social_media_platforms(),
-        "discord_url": get_discord_url(),
         "opportunities": ContributionOpportunity.objects.filter(is_public=True).order_by("order"),
     }
     return render(request, "contribute.html", context)
 
 
+@query_budget(2)
+@conditional_page()
+@cache_public_page(LAYOUT, FAQS)
 def faq(request: HttpRequest) -> HttpResponse:
     """FAQ 페이지"""
     context: Dict[str, Any] = {
         "community_info": COMMUNITY_INFO,
-        "social_platforms": get_social_media_platforms(),
-        "discord_url": get_discord_url(),
         "faqs": FAQ.objects.filter(is_public=True).order_by("category", "order"),
     }
     return render(request, "faq.html", context)
 
 
+@query_budget(1)
+@conditional_page()
+@cache_public_page(LAYOUT)
 def coc(request: HttpRequest) -> HttpResponse:
     """행동 강령 페이지"""
-    from django.utils.safestring import mark_safe
-
-    # 마크다운 변환이 필요한 필드들
-    processed_coc = CODE_OF_CONDUCT.copy()
-
-    # 커뮤니티 내용 변환
-    community_ko = CODE_OF_CONDUCT["community_content_ko"]
-    processed_coc["community_content_ko"] = mark_safe(convert_markdown_to_html(community_ko))
-
-    community_en = CODE_OF_CONDUCT["community_content_en"]
-    processed_coc["community_content_en"] = mark_safe(convert_markdown_to_html(community_en))
-
-    # 부적절한 행동 내용 변환
-    inappropriate_ko = CODE_OF_CONDUCT["inappropriate_content_ko"]
-    processed_coc["inappropriate_content_ko"] = mark_safe(convert_markdown_to_html(inappropriate_ko))
-
-    inappropriate_en = CODE_OF_CONDUCT["inappropriate_content_en"]
-    processed_coc["inappropriate_content_en"] = mark_safe(convert_markdown_to_html(inappropriate_en))
-
     context: Dict[str, Any] = {
-        "coc_info": processed_coc,
+        "coc_info": RENDERED_CODE_OF_CONDUCT,
         "community_info": COMMUNITY_INFO,
-        "discord_url": get_discord_url(),
     }
     return render(request, "coc.html", context)
 
 
+@query_budget(2)
+@conditional_page()
+@cache_public_page(LAYOUT, ACTIVITIES)
 def events_list(request: HttpRequest) -> HttpResponse:
-    """이벤트 목록 페이지"""
-    events = Activity.objects.filter(is_public=True).order_by("-start_datetime")
+    """이벤트 목록 페이지 (키셋 페이지네이션, HTMX 요청에는 다음 묶음만 응답)"""
+    events = Activity.objects.filter(is_public=True)
+    try:
+        page = paginate(events, EVENTS_ORDERING, request.GET.get("cursor"), EVENTS_PAGE_SIZE)
+    except InvalidCursor as e:
+        raise BadRequest("Invalid cursor") from e
 
     context: Dict[str, Any] = {
-        "events": events,
+        "events": page.items,
+        "next_cursor": page.next_cursor,
         "community_info": COMMUNITY_INFO,
-        "discord_url": get_discord_url(),
     }
+    if getattr(request, "htmx", False):
+        # 무한 스크롤: 다음 묶음의 카드와 센티널만 응답
+        return render(request, "components/event_list_page.html", context)
     return render(request, "events_list.html", context)
 
 
+@query_budget(3)
+@conditional_page()
+@cache_public_page(LAYOUT)
 def event_detail(request: HttpRequest, event_id: int) -> HttpResponse:
     """이벤트 상세 페이지"""
-    event = get_object_or_404(Activity, id=event_id, is_public=True)
-
-    # 같은 유형의 관련 이벤트 (현재 이벤트 제외)
-    related_events = (
-        Activity.objects.filter(activity_type=event.activity_type, is_public=True)
-        .exclude(id=event.id)
-        .order_by("-start_datetime")[:3]
+    event = get_object_or_404(
+        Activity.objects.select_related("navigation__previous", "navigation__next"), id=event_id, is_public=True
+    )
+    # 미리 계산된 이전/다음, 관련 이벤트 (관련 이벤트는 기본 키 조회 한 번)
+    navigation = get_navigation(event)
+    add_page_dependencies(
+        request,
+        activity_namespace(event.id),
+        activity_type_namespace(event.activity_type),
+        *(activity_namespace(pk) for pk in (navigation.previous_id, navigation.next_id) if pk is not None),
     )
 
     context: Dict[str, Any] = {
         "event": event,
-        "related_events": related_events,
+        "previous_event": navigation.previous,
+        "next_event": navigation.next,
+        "related_events": get_related_activities(navigation),
         "community_info": COMMUNITY_INFO,
-        "social_platforms": get_social_media_platforms(),
-        "discord_url": get_discord_url(),
     }
     return render(request, "event_detail.html", context)
-
-
-def health_check(request: HttpRequest) -> HttpResponse:
-    """헬스체크 엔드포인트"""
-    import sys
-
-    from django.db import connection
-    from django.http import JsonResponse
-
-    try:
-        # 데이터베이스 연결 확인
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-
-        health_data = {
-            "status": "healthy",
-            "timestamp": timezone.now().isoformat(),
-            "version": "1.0.0",
-            "python_version": sys.version,
-            "database": "connected",
-        }
-
-        return JsonResponse(health_data)
-
-    except Exception as e:
-        health_data = {
-            "status": "unhealthy",
-            "timestamp": timezone.now().isoformat(),
-            "error": str(e),
-            "database": "disconnected",
-        }
-
-        return JsonResponse(health_data, status=503)